@@ -1,14 +1,17 @@
-from scanner.checks.base import CheckContext, VulnerabilityCheck
+from scanner.checks.base import FAST_LANE, SLOW_LANE, CheckContext, VulnerabilityCheck
 from scanner.checks.broken_auth import BrokenAuthCheck
 from scanner.checks.registry import CHECK_REGISTRY, all_checks, iter_checks
 from scanner.checks.sensitive_data import SensitiveDataExposureCheck
-from scanner.checks.sql_injection import SQLInjectionCheck
+from scanner.checks.sql_injection import SQLInjectionCheck, TimeBasedSQLInjectionCheck
 from scanner.checks.xss import ReflectedXSSCheck
 
 __all__ = [
     "CheckContext",
     "VulnerabilityCheck",
+    "FAST_LANE",
+    "SLOW_LANE",
     "SQLInjectionCheck",
+    "TimeBasedSQLInjectionCheck",
     "ReflectedXSSCheck",
     "BrokenAuthCheck",
     "SensitiveDataExposureCheck",
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
 import abc
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, Optional
 
 if TYPE_CHECKING:
     from scanner.core.http_client import HttpClient
 
+from scanner.core.analysis import AnalysisExecutor
+from scanner.core.payloads import PayloadLibrary
 from scanner.core.reporting import ScanFinding
+from scanner.core.request_template import RequestTemplate
+from scanner.core.response import ScanResponse
+from scanner.core.scan_log import ScanLog
+from scanner.core.similarity import ResponseBaseline, ResponseSignature, SignatureBaselines, signature_async
+from scanner.core.timing import BaselineCache
+
+
+# Yavaş şeritteki kontroller (zaman tabanlı problar) kendi eşzamanlılık
+# sınırıyla çalışır ve hızlı kontrollerin slotlarını işgal etmez.
+FAST_LANE = "fast"
+SLOW_LANE = "slow"
 
 
 @dataclass
@@ -15,9 +28,36 @@ class CheckContext:
     base_url: str
     endpoint: str
     method: str
-    request_kwargs: Dict[str, Any]
+    template: RequestTemplate
     metadata: Dict[str, Any]
     http_client: "HttpClient"
+    baselines: BaselineCache = field(default_factory=BaselineCache)
+    # Büyük gövdelerde regex/alt dizi analizi bu yürütücüyle havuza gönderilir.
+    analysis: AnalysisExecutor = field(default_factory=AnalysisExecutor.inline_only)
+    log: Optional[ScanLog] = None
+    # Diferansiyel tespit için endpoint başına yanıt imzası tabanı (tarama boyunca paylaşılır).
+    signatures: SignatureBaselines = field(default_factory=SignatureBaselines)
+    # Yapılandırmada korpus tanımlı kontroller payload'larını buradan tembel olarak alır.
+    corpora: PayloadLibrary = field(default_factory=PayloadLibrary)
+
+    @property
+    def url(self) -> str:
+        return self.template.url
+
+    async def response_baseline(self) -> ResponseBaseline:
+        """Değiştirilmemiş isteğin yanıt imzası; endpoint başına bir kez ölçülür."""
+        return await self.signatures.get(
+            f"{self.method} {self.url}",
+            lambda: self.http_client.request(**self.template.render()),
+            self.analysis,
+        )
+
+    async def signature(self, response: ScanResponse) -> ResponseSignature:
+        return await signature_async(response, self.analysis)
+
+    @property
+    def request_kwargs(self) -> Dict[str, Any]:
+        return self.template.as_kwargs()
 
 
 class VulnerabilityCheck(abc.ABC):
@@ -25,6 +65,7 @@ class VulnerabilityCheck(abc.ABC):
     name: str
     description: str
     severity: str
+    lane: str = FAST_LANE
 
     def __init__(self, *, weight: int = 1) -> None:
         self.weight = weight
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, Optional
+import asyncio
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, Optional
 
 import httpx
 
 from scanner.checks.base import CheckContext, VulnerabilityCheck
-from scanner.core.reporting import ScanFinding
+from scanner.core.config import CredentialTestSettings
+from scanner.core.credentials import AccountThrottle
+from scanner.core.reporting import ScanFinding, finding_text
+from scanner.core.request_template import FORM, JSON, InsertionPoint, RequestTemplate
+from scanner.core.response import ScanResponse
 
 
 class BrokenAuthCheck(VulnerabilityCheck):
@@ -14,63 +20,124 @@ class BrokenAuthCheck(VulnerabilityCheck):
     description = "Varsayılan/kaçak kimlik bilgileri ile oturum açmayı dener."
     severity = "high"
 
+    text = finding_text(
+        text_id="AUTH-001.default-credentials",
+        summary="Zayıf kimlik doğrulama tespit edildi",
+        description="Varsayılan veya tahmin edilebilir kimlik bilgileri ile oturum açılabildi.",
+        remediation="Varsayılan kimlik bilgilerini devre dışı bırakın ve güçlü parola politikası uygulayın.",
+        references=["https://owasp.org/Top10/A07_2021-Identification_and_Authentication_Failures/"],
+    )
+
     async def execute(self, context: CheckContext) -> Optional[ScanFinding]:
         credentials: Iterable[Dict[str, str]] = context.metadata.get("credentials", [])
         if not credentials:
             return None
 
-        request_kwargs = self._prepare_request(context.request_kwargs)
-        if not request_kwargs:
+        template = context.template
+        if not template.has_body:
             return None
 
-        url = f"{context.base_url.rstrip('/')}{context.endpoint}"
-        for cred in credentials:
-            payload_kwargs = self._inject_credentials(request_kwargs, cred)
-            try:
-                response = await context.http_client.request(
-                    method=context.method,
-                    url=url,
-                    **payload_kwargs,
-                )
-            except httpx.RequestError:
-                continue
-
-            if self._looks_like_success(response):
-                return ScanFinding(
-                    check_id=self.check_id,
-                    severity=self.severity,
-                    endpoint=url,
-                    summary="Zayıf kimlik doğrulama tespit edildi",
-                    description="Varsayılan veya tahmin edilebilir kimlik bilgileri ile oturum açılabildi.",
-                    evidence={
-                        "username": cred.get("username"),
-                        "status_code": response.status_code,
-                        "set_cookie": response.headers.get("set-cookie", "")[:200],
-                    },
-                    remediation="Varsayılan kimlik bilgilerini devre dışı bırakın ve güçlü parola politikası uygulayın.",
-                    references=["https://owasp.org/Top10/A07_2021-Identification_and_Authentication_Failures/"],
-                )
-        return None
+        settings: CredentialTestSettings = context.metadata.get("credential_testing") or CredentialTestSettings()
+        # Tek yineleyici tüm işçilerce paylaşılır; liste tembel okunur ve her satır bir kez denenir.
+        attempts: Iterator[Dict[str, str]] = iter(credentials)
+        if settings.max_attempts:
+            attempts = islice(attempts, settings.max_attempts)
+        # Tarayıcı taramaya tek bir kısıtlayıcı verir; hız ve kilitlenme tüm endpoint'lerde ortaktır.
+        throttle: Optional[AccountThrottle] = context.metadata.get("account_throttle")
+        if throttle is None:
+            throttle = AccountThrottle(settings.per_account_interval)
+        outcome: Dict[str, Any] = {}
 
-    def _prepare_request(self, kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        if "json" in kwargs or "data" in kwargs:
-            return kwargs
-        return None
+        async def worker() -> bool:
+            for cred in attempts:
+                username = cred.get("username", "")
+                if throttle.is_locked(username):
+                    continue
+                await throttle.wait(username)
+                response = await self._attempt(context, template, cred)
+                if response is None:
+                    continue
+                lockout = self._lockout_reason(response, settings)
+                if lockout:
+                    throttle.lock(username)
+                    outcome["lockout"] = lockout
+                    return True
+                if self._looks_like_success(response):
+                    outcome["finding"] = self._finding(context.url, cred, response)
+                    return True
+            return False
 
-    def _inject_credentials(self, kwargs: Dict[str, Any], cred: Dict[str, str]) -> Dict[str, Any]:
-        payload = dict(kwargs)
-        if "json" in payload and isinstance(payload["json"], dict):
-            payload["json"] = {**payload["json"], **cred}
-        if "data" in payload and isinstance(payload["data"], dict):
-            payload["data"] = {**payload["data"], **cred}
-        return payload
+        tasks = {asyncio.create_task(worker()) for _ in range(settings.concurrency)}
+        try:
+            pending = tasks
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.result() for task in done):
+                    break
+        finally:
+            # Başarı ya da kilitlenmede kalan denemeler iptal edilir.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        if "lockout" in outcome and context.log is not None:
+            context.log.warning(
+                "hesap kilitleme belirtisi (%s); denemeler durduruldu.",
+                outcome["lockout"],
+                endpoint=f"{context.method} {context.endpoint}",
+                check_id=self.check_id,
+            )
+        return outcome.get("finding")
+
+    async def _attempt(
+        self,
+        context: CheckContext,
+        template: RequestTemplate,
+        cred: Dict[str, str],
+    ) -> Optional[ScanResponse]:
+        try:
+            return await context.http_client.request(**self._inject_credentials(template, cred))
+        except httpx.HTTPStatusError as exc:
+            # 401/423/429 gibi yanıtlar da incelenir; kilitlenme çoğunlukla böyle döner.
+            return ScanResponse.of(exc.response)
+        except httpx.RequestError:
+            return None
 
-    def _looks_like_success(self, response: httpx.Response) -> bool:
+    def _inject_credentials(self, template: RequestTemplate, cred: Dict[str, str]) -> Dict[str, Any]:
+        values: Dict[InsertionPoint, Any] = {}
+        for location, body in ((JSON, template.json), (FORM, template.form)):
+            if body is not None:
+                values.update({InsertionPoint(location, name): value for name, value in cred.items()})
+        return template.render(values)
+
+    def _lockout_reason(self, response: ScanResponse, settings: CredentialTestSettings) -> Optional[str]:
+        if response.status_code in settings.lockout_statuses:
+            return f"HTTP {response.status_code}"
+        if 200 <= response.status_code < 300:
+            # Başarılı yanıt gövdesindeki rastgele bir "locked" ifadesi denemeyi durdurmamalı.
+            return None
+        for pattern in settings.lockout_patterns:
+            if pattern.casefold() in response.folded:
+                return pattern
+        return None
+
+    def _looks_like_success(self, response: ScanResponse) -> bool:
         if response.status_code in (200, 201, 202, 204, 302):
-            if "set-cookie" in response.headers:
+            if response.has_header("set-cookie"):
                 return True
-            if "token" in response.text.lower():
+            if "token" in response.folded:
                 return True
         return False
 
-
+    def _finding(self, url: str, cred: Dict[str, str], response: ScanResponse) -> ScanFinding:
+        return ScanFinding(
+            check_id=self.check_id,
+            severity=self.severity,
+            endpoint=url,
+            text=self.text,
+            evidence={
+                "username": cred.get("username"),
+                "status_code": response.status_code,
+                "set_cookie": (response.header("set-cookie") or "")[:200],
+            },
+        )
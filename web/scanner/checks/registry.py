@@ -5,12 +5,13 @@ from typing import Dict, Iterable, List, Type
 from scanner.checks.base import VulnerabilityCheck
 from scanner.checks.broken_auth import BrokenAuthCheck
 from scanner.checks.sensitive_data import SensitiveDataExposureCheck
-from scanner.checks.sql_injection import SQLInjectionCheck
+from scanner.checks.sql_injection import SQLInjectionCheck, TimeBasedSQLInjectionCheck
 from scanner.checks.xss import ReflectedXSSCheck
 
 
 CHECK_REGISTRY: Dict[str, Type[VulnerabilityCheck]] = {
     SQLInjectionCheck.check_id: SQLInjectionCheck,
+    TimeBasedSQLInjectionCheck.check_id: TimeBasedSQLInjectionCheck,
     ReflectedXSSCheck.check_id: ReflectedXSSCheck,
     BrokenAuthCheck.check_id: BrokenAuthCheck,
     SensitiveDataExposureCheck.check_id: SensitiveDataExposureCheck,
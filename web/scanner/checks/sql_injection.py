@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import re
-from copy import deepcopy
-from typing import Any, Dict, Iterable, Optional
+from typing import Dict, Iterable, Optional
 
 import httpx
 
-from scanner.checks.base import CheckContext, VulnerabilityCheck
-from scanner.core.reporting import ScanFinding
+from scanner.checks.base import SLOW_LANE, CheckContext, VulnerabilityCheck
+from scanner.core.reporting import FindingText, ScanFinding, finding_text
+from scanner.core.request_template import RequestTemplate
+from scanner.core.response import ScanResponse
+from scanner.core.timing import LatencyBaseline, timed_request
 
 
 SQL_ERRORS = [
@@ -22,6 +24,25 @@ SQL_ERRORS = [
     "unterminated quoted string at or near",
 ]
 
+SQL_ERROR_PATTERN = re.compile("|".join(f"(?:{pattern})" for pattern in SQL_ERRORS), re.IGNORECASE)
+
+
+def contains_sql_error(body: str) -> bool:
+    return SQL_ERROR_PATTERN.search(body) is not None
+
+
+def _sqli_text(text_id: str, note: str) -> FindingText:
+    return finding_text(
+        text_id=f"SQLI-001.{text_id}",
+        summary="SQL Injection belirtisi tespit edildi",
+        description=(
+            f"Sunucu, enjekte edilen payload'a hatalı yanıt verdi. {note} "
+            "Bu durum parametrik sorgular kullanılmadığına işaret eder."
+        ),
+        remediation="Parametreleri parametrik sorgularla kullanın ve giriş doğrulaması uygulayın.",
+        references=["https://owasp.org/www-community/attacks/SQL_Injection"],
+    )
+
 
 class SQLInjectionCheck(VulnerabilityCheck):
     check_id = "SQLI-001"
@@ -32,88 +53,154 @@ class SQLInjectionCheck(VulnerabilityCheck):
     payloads: Iterable[str] = (
         "' OR 1=1 --",
         "\" OR \"1\"=\"1\" --",
-        "'; WAITFOR DELAY '0:0:3' --",
         "' UNION SELECT NULL,NULL,NULL --",
         "') OR ('1'='1",
     )
 
+    texts: Dict[str, FindingText] = {
+        "status_error": _sqli_text("status-error", "Sunucu hata verdi."),
+        "server_error": _sqli_text("server-error", "Sunucu hata döndürdü."),
+        "error_trace": _sqli_text("error-trace", "Yanıtta SQL hata izi bulundu."),
+    }
+
     async def execute(self, context: CheckContext) -> Optional[ScanFinding]:
-        url = f"{context.base_url.rstrip('/')}{context.endpoint}"
-        for payload in self.payloads:
-            kwargs = self._build_payload(context.request_kwargs, payload)
+        url = context.url
+        parameter = ",".join(f"{point.location}:{point.name}" for point in context.template.primary_points())
+        for payload in context.corpora.iter(self.check_id, self.payloads):
+            kwargs = self._build_payload(context.template, payload)
             try:
-                response = await context.http_client.request(
-                    method=context.method,
-                    url=url,
-                    **kwargs,
-                )
+                response = await context.http_client.request(**kwargs)
             except httpx.HTTPStatusError as exc:
-                if exc.response.status_code >= 500 and self._contains_sql_error(exc.response.text):
-                    return self._finding(payload, url, exc.response.text, "Sunucu hata verdi.")
+                error_response = ScanResponse.of(exc.response)
+                if error_response.status_code >= 500 and await self._contains_sql_error(context, error_response):
+                    context.corpora.record_hit(self.check_id, payload)
+                    return self._finding(payload, url, error_response.text, "status_error", parameter)
                 continue
             except httpx.RequestError:
                 continue
 
-            if response.status_code >= 500 and self._contains_sql_error(response.text):
-                return self._finding(payload, url, response.text, "Sunucu hata döndürdü.")
-
-            if self._contains_sql_error(response.text):
-                return self._finding(payload, url, response.text, "Yanıtta SQL hata izi bulundu.")
+            if await self._contains_sql_error(context, response):
+                context.corpora.record_hit(self.check_id, payload)
+                text_key = "server_error" if response.status_code >= 500 else "error_trace"
+                return self._finding(payload, url, response.text, text_key, parameter)
         return None
 
-    def _build_payload(self, request_kwargs: Dict[str, Any], payload: str) -> Dict[str, Any]:
-        kwargs = deepcopy(request_kwargs)
-        params = kwargs.get("params") or {}
-        if isinstance(params, dict):
-            if params:
-                first_key = next(iter(params))
-                params[first_key] = payload
-            else:
-                params["probe"] = payload
-            kwargs["params"] = params
-
-        json_body = kwargs.get("json")
-        if isinstance(json_body, dict):
-            first_key = next(iter(json_body), None)
-            if first_key:
-                json_body[first_key] = payload
-            else:
-                json_body["probe"] = payload
-            kwargs["json"] = json_body
-
-        data_body = kwargs.get("data")
-        if isinstance(data_body, dict):
-            first_key = next(iter(data_body), None)
-            if first_key:
-                data_body[first_key] = payload
-            else:
-                data_body["probe"] = payload
-            kwargs["data"] = data_body
-
-        if not params and "json" not in kwargs and "data" not in kwargs:
-            kwargs["params"] = {"probe": payload}
-        return kwargs
+    def _build_payload(self, template: RequestTemplate, payload: str) -> dict:
+        return template.render({point: payload for point in template.primary_points()})
 
     @staticmethod
-    def _contains_sql_error(body: str) -> bool:
-        return any(re.search(pattern, body, re.IGNORECASE) for pattern in SQL_ERRORS)
+    async def _contains_sql_error(context: CheckContext, response: ScanResponse) -> bool:
+        return await context.analysis.memo(response, "sql_error", contains_sql_error)
+
+    def _finding(
+        self,
+        payload: str,
+        url: str,
+        body: str,
+        text_key: str,
+        parameter: Optional[str] = None,
+    ) -> ScanFinding:
+        evidence = {
+            "payload": payload,
+            "response_snippet": body[:500],
+        }
+        if parameter:
+            evidence["parameter"] = parameter
+        return ScanFinding(
+            check_id=self.check_id,
+            severity=self.severity,
+            endpoint=url,
+            text=self.texts[text_key],
+            evidence=evidence,
+        )
 
-    def _finding(self, payload: str, url: str, body: str, note: str) -> ScanFinding:
+
+class TimeBasedSQLInjectionCheck(VulnerabilityCheck):
+    """Gecikme komutlu payload'larla kör SQL Injection arar.
+
+    Yavaş şeritte çalışır: önce endpoint'in gecikme tabanı birkaç örnekle
+    ölçülür, ardından her payload'ın yanıt süresi bu tabanla karşılaştırılır.
+    Ağ dalgalanmasını elemek için gecikme aynı payload ile bir kez daha
+    doğrulanır.
+    """
+
+    check_id = "SQLI-002"
+    name = "Zaman Tabanlı Kör SQL Injection Kontrolü"
+    description = "Gecikme komutlu payload'larla yanıt süresindeki sapmayı ölçer."
+    severity = "critical"
+    lane = SLOW_LANE
+
+    delay_seconds: float = 3.0
+
+    payloads: Iterable[str] = (
+        "'; WAITFOR DELAY '0:0:{delay}' --",
+        "' OR SLEEP({delay}) --",
+        "'; SELECT pg_sleep({delay}) --",
+    )
+
+    text = finding_text(
+        text_id="SQLI-002.time-delay",
+        summary="Zaman tabanlı kör SQL Injection belirtisi tespit edildi",
+        description=(
+            "Gecikme komutu içeren payload, yanıtı endpoint'in ölçülen gecikme tabanına göre "
+            "tutarlı biçimde geciktirdi. Bu durum girdinin SQL sorgusunda çalıştırıldığına işaret eder."
+        ),
+        remediation="Parametreleri parametrik sorgularla kullanın ve giriş doğrulaması uygulayın.",
+        references=["https://owasp.org/www-community/attacks/Blind_SQL_Injection"],
+    )
+
+    async def execute(self, context: CheckContext) -> Optional[ScanFinding]:
+        template = context.template
+        try:
+            baseline = await context.baselines.get(
+                f"{template.method} {template.url}",
+                lambda: self._sample(context),
+            )
+        except httpx.RequestError:
+            # Taban ölçülemiyorsa gecikme karşılaştırılamaz; endpoint'e ulaşılamıyor demektir.
+            return None
+        timeout = baseline.timeout_for(self.delay_seconds, ceiling=max(context.http_client.timeout, self.delay_seconds * 3))
+        points = template.primary_points()
+        for pattern in context.corpora.iter(self.check_id, self.payloads):
+            # `format` değil: korpustaki payload'lar başka süslü parantez içerebilir.
+            payload = pattern.replace("{delay}", f"{self.delay_seconds:g}")
+            request = template.render({point: payload for point in points})
+            try:
+                probe = await timed_request(context.http_client, request, timeout=timeout)
+                if not baseline.is_delayed(probe.elapsed, self.delay_seconds):
+                    continue
+                confirm = await timed_request(context.http_client, request, timeout=timeout)
+            except httpx.RequestError:
+                continue
+            if baseline.is_delayed(confirm.elapsed, self.delay_seconds):
+                context.corpora.record_hit(self.check_id, pattern)
+                parameter = ",".join(f"{point.location}:{point.name}" for point in points)
+                return self._finding(payload, template.url, parameter, baseline, (probe.elapsed, confirm.elapsed))
+        return None
+
+    @staticmethod
+    async def _sample(context: CheckContext) -> float:
+        return (await timed_request(context.http_client, context.template.render())).elapsed
+
+    def _finding(
+        self,
+        payload: str,
+        url: str,
+        parameter: str,
+        baseline: LatencyBaseline,
+        observed: Iterable[float],
+    ) -> ScanFinding:
         return ScanFinding(
             check_id=self.check_id,
             severity=self.severity,
             endpoint=url,
-            summary="SQL Injection belirtisi tespit edildi",
-            description=(
-                f"Sunucu, enjekte edilen payload'a hatalı yanıt verdi. {note} "
-                "Bu durum parametrik sorgular kullanılmadığına işaret eder."
-            ),
+            text=self.text,
             evidence={
                 "payload": payload,
-                "response_snippet": body[:500],
+                "parameter": parameter,
+                "baseline_ms": round(baseline.median * 1000),
+                "baseline_max_ms": round(baseline.upper * 1000),
+                "observed_ms": [round(value * 1000) for value in observed],
+                "delay_seconds": self.delay_seconds,
             },
-            remediation="Parametreleri parametrik sorgularla kullanın ve giriş doğrulaması uygulayın.",
-            references=["https://owasp.org/www-community/attacks/SQL_Injection"],
         )
-
-
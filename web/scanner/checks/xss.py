@@ -1,74 +1,96 @@
 from __future__ import annotations
 
 import html
-import secrets
-from copy import deepcopy
-from typing import Any, Dict, Optional
+from typing import Dict, Iterable, Optional
 
 import httpx
 
 from scanner.checks.base import CheckContext, VulnerabilityCheck
-from scanner.core.reporting import ScanFinding
+from scanner.core.reporting import FindingText, ScanFinding, finding_text
+from scanner.core.request_template import QUERY, InsertionPoint
+
+
+PROBE_HEADERS = {"X-Vuln-Scanner": "xss-probe"}
+PROBE_POINT = InsertionPoint(QUERY, "q")
+
+
+def _reflection(body: str, token: str, payload: str) -> Optional[str]:
+    """Payload'un yanıtta nasıl döndüğü: "raw", "escaped" ya da `None`."""
+    if token not in body:
+        return None
+    if payload in body:
+        return "raw"
+    if html.escape(payload) in body:
+        return "escaped"
+    return None
+
+
+def _xss_text(text_id: str, note: str) -> FindingText:
+    return finding_text(
+        text_id=f"XSS-001.{text_id}",
+        summary="Reflected XSS belirtisi tespit edildi",
+        description=(
+            "Uygulama, gönderilen payload'u yanıtta token ile birlikte döndürdü. "
+            f"{note} Bu durum XSS istismarına yol açabilir."
+        ),
+        remediation="Kullanıcı girdilerini HTML encode edin ve içerik güvenlik politikaları uygulayın.",
+        references=["https://owasp.org/www-community/attacks/xss/"],
+    )
 
 
 class ReflectedXSSCheck(VulnerabilityCheck):
     check_id = "XSS-001"
     name = "Reflected XSS Kontrolü"
-    description = "Reflected XSS ihtimallerini rastgele token ile sınar."
+    description = "Reflected XSS ihtimallerini benzersiz token ile sınar."
     severity = "high"
 
+    # `{token}` her istekte benzersiz prob token'ıyla değiştirilir; yansıma token'la aranır.
+    payloads: Iterable[str] = ("<svg/onload=alert('{token}')>",)
+
+    texts: Dict[str, FindingText] = {
+        "raw": _xss_text("raw", "Payload HTML escape edilmeden geri döndü."),
+        "escaped": _xss_text("escaped", "Payload kısmen escape edildi."),
+    }
+
     async def execute(self, context: CheckContext) -> Optional[ScanFinding]:
-        token = secrets.token_hex(6)
-        payload = f"<svg/onload=alert('{token}')>"
-        kwargs = deepcopy(context.request_kwargs)
-        kwargs.setdefault("headers", {})
-        kwargs["headers"]["X-Vuln-Scanner"] = "xss-probe"
-
-        params = kwargs.get("params") or {}
-        if isinstance(params, dict):
-            params.setdefault("q", payload)
-            kwargs["params"] = params
-        elif isinstance(params, list):
-            params.append(("q", payload))
-            kwargs["params"] = params
-        else:
-            kwargs["params"] = {"q": payload}
-
-        url = f"{context.base_url.rstrip('/')}{context.endpoint}"
-        try:
-            response = await context.http_client.request(
-                method=context.method,
-                url=url,
-                **kwargs,
-            )
-        except httpx.RequestError:
-            return None
-
-        if token in response.text and payload in response.text:
-            return self._build_finding(url, payload, response.text)
-
-        escaped = html.escape(payload)
-        if token in response.text and escaped in response.text:
-            return self._build_finding(url, payload, response.text, escaped=True)
+        template = context.template
+        token = context.http_client.probe_token(f"{self.check_id} {template.method} {template.url}")
+        # Mevcut `q` parametresinin değeri korunur (eski `setdefault` davranışı); payload gönderilmez.
+        preserved = PROBE_POINT in template.insertion_points
+        url = context.url
+        for pattern in context.corpora.iter(self.check_id, self.payloads):
+            if "{token}" not in pattern:
+                continue
+            payload = pattern.replace("{token}", token)
+            values = {} if preserved else {PROBE_POINT: payload}
+            kwargs = template.render(values, headers=PROBE_HEADERS)
+            try:
+                response = await context.http_client.request(**kwargs)
+            except httpx.RequestError:
+                if preserved:
+                    return None
+                continue
+
+            body = response.text
+            reflection = await context.analysis.run(len(response.content), _reflection, body, token, payload)
+            if reflection is not None:
+                context.corpora.record_hit(self.check_id, pattern)
+                return self._build_finding(url, payload, body, escaped=reflection == "escaped")
+            if preserved:
+                return None  # aynı isteği farklı payload'la tekrarlamanın anlamı yok
         return None
 
     def _build_finding(self, url: str, payload: str, body: str, escaped: bool = False) -> ScanFinding:
-        note = "Payload HTML escape edilmeden geri döndü." if not escaped else "Payload kısmen escape edildi."
         return ScanFinding(
             check_id=self.check_id,
             severity=self.severity,
             endpoint=url,
-            summary="Reflected XSS belirtisi tespit edildi",
-            description=(
-                "Uygulama, gönderilen payload'u yanıtta token ile birlikte döndürdü. "
-                f"{note} Bu durum XSS istismarına yol açabilir."
-            ),
+            text=self.texts["escaped" if escaped else "raw"],
             evidence={
                 "payload": payload,
+                "parameter": f"{PROBE_POINT.location}:{PROBE_POINT.name}",
                 "response_snippet": body[:500],
             },
-            remediation="Kullanıcı girdilerini HTML encode edin ve içerik güvenlik politikaları uygulayın.",
-            references=["https://owasp.org/www-community/attacks/xss/"],
         )
 
 
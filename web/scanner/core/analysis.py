@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+from scanner.core.response import ScanResponse
+
+
+T = TypeVar("T")
+
+# Bu boyutun altındaki gövdeler döngüde analiz edilir; havuza gönderme maliyeti kazancı aşar.
+DEFAULT_OFFLOAD_THRESHOLD = 256 * 1024
+DEFAULT_LAG_INTERVAL = 0.05
+DEFAULT_STALL_THRESHOLD = 0.1
+
+
+class AnalysisExecutor:
+    """Büyük yanıt gövdelerinin CPU yoğun analizini olay döngüsünden çıkarır.
+
+    `re` motoru ve alt dizi aramaları tek çağrı boyunca GIL'i bırakmadığından
+    varsayılan havuz süreç havuzudur; süreç açılamayan ortamlarda iş
+    parçacığı havuzuna düşülür. Havuz ilk büyük gövdede tembel kurulur.
+    Gönderilen fonksiyonlar ve argümanlar pickle edilebilir olmalıdır
+    (modül düzeyi fonksiyonlar, metin).
+    """
+
+    def __init__(
+        self,
+        threshold: Optional[int] = DEFAULT_OFFLOAD_THRESHOLD,
+        max_workers: Optional[int] = None,
+        use_processes: bool = True,
+    ) -> None:
+        self.threshold = threshold
+        self.max_workers = max_workers
+        self.use_processes = use_processes
+        self.inline = 0
+        self.offloaded = 0
+        self._pool: Optional[Executor] = None
+        self.pool_kind: Optional[str] = None
+        self._pending: Dict[Tuple[int, str], "asyncio.Future[Any]"] = {}
+
+    @classmethod
+    def inline_only(cls) -> "AnalysisExecutor":
+        """Havuz kullanmayan yürütücü; tarayıcı dışında kurulan bağlamlar için."""
+        return cls(threshold=None)
+
+    def should_offload(self, size: int) -> bool:
+        return self.threshold is not None and size >= self.threshold
+
+    async def run(self, size: int, func: Callable[..., T], *args: Any) -> T:
+        """`func(*args)` sonucunu döndür; `size` eşiği aşıyorsa havuzda çalıştır."""
+        if not self.should_offload(size):
+            self.inline += 1
+            return func(*args)
+        self.offloaded += 1
+        return await asyncio.get_running_loop().run_in_executor(self._executor(), func, *args)
+
+    async def memo(self, response: ScanResponse, key: str, func: Callable[[str], T]) -> T:
+        """`response.memo(key, ...)` eşdeğeri; `func(response.text)` gerekirse havuzda hesaplanır.
+
+        Sonuç yanıtın memo'suna yazılır, eşzamanlı çağıranlar aynı hesabı bekler;
+        aynı anahtarı senkron okuyan kod (ör. pasif analizörler) sonucu hazır bulur.
+        """
+        if response.has_memo(key):
+            return response.memo(key, lambda: func(response.text))
+        marker = (id(response), key)
+        pending = self._pending.get(marker)
+        if pending is None:
+            pending = self._pending[marker] = asyncio.ensure_future(
+                self.run(len(response.content), func, response.text)
+            )
+            pending.add_done_callback(lambda _: self._pending.pop(marker, None))
+        result = await asyncio.shield(pending)
+        return response.memo(key, lambda: result)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "threshold_bytes": self.threshold,
+            "inline": self.inline,
+            "offloaded": self.offloaded,
+            "pool": self.pool_kind,
+        }
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _executor(self) -> Executor:
+        if self._pool is None:
+            if self.use_processes:
+                try:
+                    self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+                except (OSError, NotImplementedError):
+                    self._pool = None
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="analysis")
+            self.pool_kind = type(self._pool).__name__
+        return self._pool
+
+
+class LoopLagMonitor:
+    """Olay döngüsünün gecikmesini ölçer: sabit aralıkla uyuyup geç uyanma süresini kaydeder.
+
+    Döngüyü bloklayan her iş (ör. büyük gövdede regex) bir sonraki uyanmayı
+    geciktirir; `stall_threshold`'u aşan gecikmeler ayrıca sayılır.
+    """
+
+    def __init__(
+        self,
+        interval: float = DEFAULT_LAG_INTERVAL,
+        stall_threshold: float = DEFAULT_STALL_THRESHOLD,
+        window: int = 2048,
+    ) -> None:
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self.samples = 0
+        self.stalls = 0
+        self.max_lag = 0.0
+        self._total = 0.0
+        self._recent: Deque[float] = deque(maxlen=window)
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def record(self, lag: float) -> None:
+        lag = max(0.0, lag)
+        self.samples += 1
+        self._total += lag
+        self.max_lag = max(self.max_lag, lag)
+        self._recent.append(lag)
+        if lag >= self.stall_threshold:
+            self.stalls += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        recent = sorted(self._recent)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+        return {
+            "interval_ms": round(self.interval * 1000, 1),
+            "samples": self.samples,
+            "mean_ms": round(self._total / self.samples * 1000, 2) if self.samples else 0.0,
+            "median_ms": round(statistics.median(recent) * 1000, 2) if recent else 0.0,
+            "p95_ms": round(p95 * 1000, 2),
+            "max_ms": round(self.max_lag * 1000, 2),
+            "stalls": self.stalls,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            started = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.record(time.perf_counter() - started - self.interval)
@@ -12,6 +12,22 @@ class AuthCredential(BaseModel):
     password: str
 
 
+class CredentialTestSettings(BaseModel):
+    concurrency: int = Field(default=4, ge=1, le=64)
+    per_account_interval: float = Field(default=1.0, ge=0.0, le=3600.0)
+    max_attempts: Optional[PositiveInt] = None
+    lockout_statuses: List[int] = Field(default_factory=lambda: [423, 429])
+    lockout_patterns: List[str] = Field(
+        default_factory=lambda: [
+            "account locked",
+            "account is locked",
+            "too many failed",
+            "too many login attempts",
+            "kilitlendi",
+        ]
+    )
+
+
 class Header(BaseModel):
     name: str
     value: str
@@ -20,6 +36,10 @@ class Header(BaseModel):
 class HttpSettings(BaseModel):
     timeout: float = Field(default=10.0, ge=1.0, le=120.0)
     max_retries: PositiveInt = Field(default=2, le=5)
+    # Kayan pencerede yeniden denemeler başarılı isteklerin bu oranı + `retry_budget_reserve` ile sınırlı.
+    retry_budget_ratio: float = Field(default=0.1, ge=0.0, le=1.0)
+    retry_budget_window: int = Field(default=10, ge=1, le=600)
+    retry_budget_reserve: int = Field(default=10, ge=0, le=1000)
     user_agent: str = Field(
         default="AdvancedVulnScanner/0.1 (+https://example.com/security)"
     )
@@ -60,6 +80,50 @@ class Scope(BaseModel):
         return endpoint
 
 
+class SessionSettings(BaseModel):
+    """Tarama başında bir kez oturum açılır; çerez ve token tüm kontrollerle paylaşılır."""
+
+    login_path: str
+    login_method: str = Field(default="POST")
+    # Gövde değerlerindeki `{username}` ve `{password}` yer tutucuları doldurulur.
+    login_json: Dict[str, Any] = Field(default_factory=dict)
+    login_data: Dict[str, Any] = Field(default_factory=dict)
+    username: Optional[str] = None
+    password: Optional[str] = None
+    password_env: Optional[str] = None
+    # Token kaynağı: JSON gövdesinde noktalı yol, yanıt başlığı ya da çerez. Hiçbiri yoksa yalnızca çerez oturumu.
+    token_json: Optional[str] = None
+    token_header: Optional[str] = None
+    token_cookie: Optional[str] = None
+    header_name: str = "Authorization"
+    header_template: str = "Bearer {token}"
+    refresh_statuses: List[int] = Field(default_factory=lambda: [401])
+    # İki oturum açma arasında en az bu kadar saniye; hatalı 401'ler oturum açma fırtınasına dönmez.
+    min_refresh_interval: float = Field(default=5.0, ge=0.0, le=3600.0)
+
+    @validator("login_method")
+    def normalize_login_method(cls, value: str) -> str:
+        return value.upper()
+
+    @validator("login_path")
+    def ensure_login_slash(cls, value: str) -> str:
+        return value if value.startswith("/") else "/" + value
+
+
+class PayloadCorpusSettings(BaseModel):
+    """Kontrolün yerleşik payload listesi yerine kullanılan korpus (`--build-corpus` ile üretilir)."""
+
+    path: Path
+    tags: List[str] = Field(default_factory=list)
+    sample: Optional[PositiveInt] = None
+    seed: Optional[int] = None
+    order_by_hits: bool = True
+
+    @validator("tags", each_item=True)
+    def normalize_tag(cls, value: str) -> str:
+        return value.strip().lower()
+
+
 class ScannerConfig(BaseModel):
     name: str
     scope: Scope
@@ -67,6 +131,12 @@ class ScannerConfig(BaseModel):
     default_checks: List[str] = Field(default_factory=list)
     headers: List[Header] = Field(default_factory=list)
     credentials: List[AuthCredential] = Field(default_factory=list)
+    credentials_file: Optional[Path] = None
+    credential_testing: CredentialTestSettings = Field(default_factory=CredentialTestSettings)
+    session: Optional[SessionSettings] = None
+    # Kontrol kimliği -> payload korpusu (ör. SQLI-001).
+    payloads: Dict[str, PayloadCorpusSettings] = Field(default_factory=dict)
+    passive_checks: Optional[List[str]] = None
     rate_limit_per_minute: Optional[int] = Field(default=None, ge=10, le=600)
 
     def iter_headers(self) -> Iterable[tuple[str, str]]:
@@ -77,6 +147,13 @@ class ScannerConfig(BaseModel):
 def load_scanner_config(path: Path) -> ScannerConfig:
     with Path(path).open("r", encoding="utf-8") as handle:
         data = yaml.safe_load(handle)
-    return ScannerConfig.model_validate(data)
+    config = ScannerConfig.model_validate(data)
+    if config.credentials_file is not None and not config.credentials_file.is_absolute():
+        # Göreli liste yolu, çalışma dizinine değil YAML dosyasına göredir.
+        config.credentials_file = Path(path).parent / config.credentials_file
+    for corpus in config.payloads.values():
+        if not corpus.path.is_absolute():
+            corpus.path = Path(path).parent / corpus.path
+    return config
 
 
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Sequence, Set
+
+from scanner.core.config import AuthCredential
+
+
+COMMENT_PREFIX = "#"
+SEPARATOR = ":"
+
+
+class CredentialSource:
+    """YAML'daki kimlik bilgileri ve ardından `kullanıcı:parola` satırlı dosya.
+
+    Dosya her yinelemede baştan, satır satır okunur; milyon satırlık listeler
+    belleğe alınmaz. Boş, `#` ile başlayan ve `:` içermeyen satırlar atlanır.
+    """
+
+    def __init__(self, inline: Sequence[AuthCredential] = (), path: Optional[Path] = None) -> None:
+        self._inline = [credential.model_dump() for credential in inline]
+        self.path = Path(path) if path is not None else None
+
+    def __bool__(self) -> bool:
+        return bool(self._inline) or self.path is not None
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        for credential in self._inline:
+            yield dict(credential)
+        if self.path is None:
+            return
+        with self.path.open("r", encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                line = line.rstrip("\r\n")
+                if not line or line.startswith(COMMENT_PREFIX) or SEPARATOR not in line:
+                    continue
+                username, password = line.split(SEPARATOR, 1)
+                yield {"username": username, "password": password}
+
+
+class AccountThrottle:
+    """Aynı hesaba yapılan denemeler arasında en az `interval` saniye bırakır.
+
+    Yalnızca bekleme süresi dolmamış hesaplar izlenir; tablo `max_tracked`'i
+    aşınca süresi geçmiş kayıtlar atılır, böylece tekil kullanıcı adlı uzun
+    listelerde bellek büyümez.
+
+    Tarama başına tek örnek kurulur ve tüm endpoint'lerce paylaşılır; aralık
+    hesap başınadır, endpoint başına değil. Kilitlenen hesaplar da burada
+    tutulur ve sonraki endpoint'lerde denenmez.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        max_tracked: int = 4096,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.interval = interval
+        self.max_tracked = max_tracked
+        self._clock = clock
+        self._next: "OrderedDict[str, float]" = OrderedDict()
+        self._locked: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._next)
+
+    def lock(self, account: str) -> None:
+        self._locked.add(account)
+
+    def is_locked(self, account: str) -> bool:
+        return account in self._locked
+
+    def reserve(self, account: str) -> float:
+        """Hesap için bir deneme zamanı ayır; o ana kadar beklenecek süreyi döndür."""
+        now = self._clock()
+        start = max(now, self._next.get(account, now))
+        self._next[account] = start + self.interval
+        self._next.move_to_end(account)
+        if len(self._next) > self.max_tracked:
+            self._prune(now)
+        return start - now
+
+    async def wait(self, account: str) -> None:
+        delay = self.reserve(account)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def _prune(self, now: float) -> None:
+        # Sıra ayırma sırasıdır; baştaki kayıtların süresi önce dolar.
+        while self._next:
+            account, ready_at = next(iter(self._next.items()))
+            if ready_at > now:
+                break
+            del self._next[account]
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+
+STARTED = "started"
+PROGRESS = "progress"
+FINDING = "finding"
+FINISHED = "finished"
+
+DEFAULT_SUBSCRIBER_BUFFER = 256
+DEFAULT_REPLAY = 512
+# Sınır aşılınca yalnızca bunlar düşürülür: ilerleme anlık görüntüsü birikimlidir,
+# sonraki eskisini kapsar. Bulgular ve yaşam döngüsü olayları hiç düşürülmez.
+DROPPABLE = frozenset({PROGRESS})
+
+
+@dataclass(frozen=True, slots=True)
+class ScanEvent:
+    seq: int
+    kind: str
+    data: Dict[str, Any]
+
+    def serialize(self) -> Dict[str, Any]:
+        return {"seq": self.seq, "type": self.kind, "data": self.data}
+
+
+def _append_bounded(events: Deque[ScanEvent], event: ScanEvent, limit: int) -> bool:
+    """Olayı ekle; `limit` aşılırsa en eski düşürülebilir olayı at ve `True` dön.
+
+    Yeni olay hiç atılmaz; kuyruk bulgularla doluysa en güncel ilerleme
+    görüntüsü sınırın bir fazlası olarak kalır.
+    """
+    if len(events) >= limit:
+        for index, queued in enumerate(events):
+            if queued.kind in DROPPABLE:
+                del events[index]
+                events.append(event)
+                return True
+    events.append(event)
+    return False
+
+
+class Subscription:
+    """Tek bir dinleyicinin sınırlı olay kuyruğu.
+
+    Kuyruk dolduğunda en eski ilerleme olayı düşürülür (`dropped` sayılır);
+    bulgular düşürülmez, bu yüzden kuyruk en fazla bulgu sayısı kadar taşabilir.
+    Yavaş bir dinleyici taramayı ya da diğer dinleyicileri asla bekletmez. Hem iş
+    parçacıklarından (`get`) hem de asyncio'dan (`async for`) tüketilebilir.
+    """
+
+    def __init__(self, broadcaster: "EventBroadcaster", maxlen: int) -> None:
+        self._broadcaster = broadcaster
+        self._events: Deque[ScanEvent] = deque()
+        self._maxlen = maxlen
+        self._cond = threading.Condition()
+        self.dropped = 0
+        self.closed = False
+
+    def get(self, timeout: Optional[float] = None) -> Optional[ScanEvent]:
+        """Sıradaki olayı döndür; zaman aşımında ya da yayın kapanıp kuyruk boşaldığında `None`."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._events or self.closed, timeout)
+            return self._events.popleft() if self._events else None
+
+    @property
+    def exhausted(self) -> bool:
+        with self._cond:
+            return self.closed and not self._events
+
+    def close(self) -> None:
+        self._broadcaster.unsubscribe(self)
+        self._close()
+
+    async def __aiter__(self) -> AsyncIterator[ScanEvent]:
+        while not self.exhausted:
+            event = await asyncio.to_thread(self.get, 0.5)
+            if event is not None:
+                yield event
+
+    def _push(self, event: ScanEvent) -> None:
+        with self._cond:
+            if _append_bounded(self._events, event, self._maxlen):
+                self.dropped += 1
+            self._cond.notify_all()
+
+    def _close(self) -> None:
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
+class EventBroadcaster:
+    """Tarama olaylarını sınırlı kuyruklu dinleyicilere dağıtan fan-out.
+
+    `publish` hiçbir zaman bloklamaz; dinleyici başına kuyruk dolunca en eski
+    ilerleme olayı atılır. Geçmişte bulgular ve son `replay` ilerleme olayı
+    saklanır, böylece tarama başladıktan sonra bağlanan bir dinleyici (ör. SSE
+    istemcisi) bulguların tamamını alır.
+    """
+
+    def __init__(self, subscriber_buffer: int = DEFAULT_SUBSCRIBER_BUFFER, replay: int = DEFAULT_REPLAY) -> None:
+        self.subscriber_buffer = subscriber_buffer
+        self.replay = replay
+        self.closed = False
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        self._history: Deque[ScanEvent] = deque()
+        self._seq = 0
+
+    def publish(self, kind: str, data: Optional[Dict[str, Any]] = None) -> ScanEvent:
+        with self._lock:
+            self._seq += 1
+            event = ScanEvent(self._seq, kind, data or {})
+            _append_bounded(self._history, event, self.replay)
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            subscriber._push(event)
+        return event
+
+    def subscribe(self, after: int = 0) -> Subscription:
+        """Yeni dinleyici; `after` sıradan sonraki geçmiş olaylar önce teslim edilir."""
+        subscription = Subscription(self, max(self.subscriber_buffer, 1))
+        with self._lock:
+            for event in self._history:
+                if event.seq > after:
+                    subscription._push(event)
+            if self.closed:
+                subscription._close()
+            else:
+                self._subscribers.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscribers:
+                self._subscribers.remove(subscription)
+
+    def close(self) -> None:
+        """Yayını bitir; dinleyiciler kuyruklarını boşalttıktan sonra sonlanır."""
+        with self._lock:
+            self.closed = True
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber._close()
@@ -0,0 +1,191 @@
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from scanner.core.fingerprint import endpoint_identity
+from scanner.core.reporting import SEVERITY_ORDER, ScanReport
+
+
+@dataclass
+class IndexDelta:
+    scan_id: str
+    previous_scan: Optional[str]
+    new: List[str] = field(default_factory=list)
+    recurring: List[str] = field(default_factory=list)
+    fixed: List[str] = field(default_factory=list)
+
+    def serialize(self) -> Dict[str, Any]:
+        return {
+            "scan_id": self.scan_id,
+            "previous_scan": self.previous_scan,
+            "new": len(self.new),
+            "recurring": len(self.recurring),
+            "fixed": len(self.fixed),
+        }
+
+
+@dataclass(frozen=True)
+class IndexedFinding:
+    fingerprint: str
+    check_id: str
+    severity: str
+    endpoint: str
+    parameter: Optional[str]
+    first_seen: str
+    last_seen: str
+    first_scan: str
+    last_scan: str
+    occurrences: int
+
+
+class FindingIndex:
+    """Taramalar arası kalıcı bulgu parmak izi dizini (SQLite).
+
+    Her parmak izi için ilk/son görülme zamanı ve taraması tutulur; yeni,
+    tekrarlayan ve düzelen bulgu sorguları rapor dosyalarını yeniden
+    okumadan dizinden yanıtlanır.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._db = sqlite3.connect(str(self.path))
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS scans (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                scan_id TEXT NOT NULL UNIQUE,
+                target TEXT NOT NULL,
+                recorded_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS findings (
+                fingerprint TEXT PRIMARY KEY,
+                target TEXT NOT NULL,
+                check_id TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                severity_rank INTEGER NOT NULL,
+                endpoint TEXT NOT NULL,
+                parameter TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                first_scan TEXT NOT NULL,
+                last_scan TEXT NOT NULL,
+                occurrences INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS findings_first_scan ON findings (first_scan, severity_rank);
+            CREATE TABLE IF NOT EXISTS sightings (
+                scan_id TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                PRIMARY KEY (scan_id, fingerprint)
+            );
+            """
+        )
+
+    def close(self) -> None:
+        self._db.close()
+
+    def record(self, scan_id: str, target: str, report: ScanReport) -> IndexDelta:
+        previous = self.last_scan(target)
+        now = datetime.now(timezone.utc).isoformat()
+        delta = IndexDelta(scan_id=scan_id, previous_scan=previous)
+        with self._db:
+            self._db.execute(
+                "INSERT INTO scans (scan_id, target, recorded_at) VALUES (?, ?, ?)",
+                (scan_id, target, now),
+            )
+            for finding in report.findings:
+                fingerprint = finding.fingerprint
+                updated = self._db.execute(
+                    "UPDATE findings SET last_seen = ?, last_scan = ?, occurrences = occurrences + 1, "
+                    "severity = ?, severity_rank = ? WHERE fingerprint = ?",
+                    (now, scan_id, finding.severity, _rank(finding.severity), fingerprint),
+                ).rowcount
+                if updated:
+                    delta.recurring.append(fingerprint)
+                else:
+                    self._db.execute(
+                        "INSERT INTO findings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)",
+                        (
+                            fingerprint,
+                            target,
+                            finding.check_id,
+                            finding.severity,
+                            _rank(finding.severity),
+                            endpoint_identity(finding),
+                            finding.evidence.get("parameter"),
+                            now,
+                            now,
+                            scan_id,
+                            scan_id,
+                        ),
+                    )
+                    delta.new.append(fingerprint)
+                self._db.execute("INSERT OR IGNORE INTO sightings VALUES (?, ?)", (scan_id, fingerprint))
+            if previous is not None:
+                delta.fixed = [
+                    row[0]
+                    for row in self._db.execute(
+                        "SELECT fingerprint FROM sightings WHERE scan_id = ? "
+                        "EXCEPT SELECT fingerprint FROM sightings WHERE scan_id = ?",
+                        (previous, scan_id),
+                    )
+                ]
+        return delta
+
+    def last_scan(self, target: str, before: Optional[str] = None) -> Optional[str]:
+        if before is None:
+            row = self._db.execute(
+                "SELECT scan_id FROM scans WHERE target = ? ORDER BY seq DESC LIMIT 1", (target,)
+            ).fetchone()
+        else:
+            row = self._db.execute(
+                "SELECT scan_id FROM scans WHERE target = ? AND seq < (SELECT seq FROM scans WHERE scan_id = ?) "
+                "ORDER BY seq DESC LIMIT 1",
+                (target, before),
+            ).fetchone()
+        return row[0] if row else None
+
+    def new_findings(self, target: str, min_severity: str = "info", scan_id: Optional[str] = None) -> List[IndexedFinding]:
+        """Verilen taramada (varsayılan: son tarama) ilk kez görülen bulgular."""
+        scan_id = scan_id or self.last_scan(target)
+        if scan_id is None:
+            return []
+        return list(
+            self._query(
+                "WHERE target = ? AND first_scan = ? AND severity_rank >= ? ORDER BY severity_rank DESC, endpoint",
+                (target, scan_id, _rank(min_severity)),
+            )
+        )
+
+    def fixed_findings(self, target: str, scan_id: Optional[str] = None) -> List[IndexedFinding]:
+        """Önceki taramada görülüp verilen taramada görülmeyen bulgular."""
+        scan_id = scan_id or self.last_scan(target)
+        previous = self.last_scan(target, before=scan_id) if scan_id else None
+        if previous is None:
+            return []
+        return list(
+            self._query(
+                "WHERE fingerprint IN (SELECT fingerprint FROM sightings WHERE scan_id = ? "
+                "EXCEPT SELECT fingerprint FROM sightings WHERE scan_id = ?) ORDER BY severity_rank DESC",
+                (previous, scan_id),
+            )
+        )
+
+    def get(self, fingerprint: str) -> Optional[IndexedFinding]:
+        return next(self._query("WHERE fingerprint = ?", (fingerprint,)), None)
+
+    def _query(self, where: str, params: tuple) -> Iterator[IndexedFinding]:
+        cursor = self._db.execute(
+            "SELECT fingerprint, check_id, severity, endpoint, parameter, first_seen, last_seen, "
+            f"first_scan, last_scan, occurrences FROM findings {where}",
+            params,
+        )
+        for row in cursor:
+            yield IndexedFinding(*row)
+
+
+def _rank(severity: str) -> int:
+    return SEVERITY_ORDER.index(severity) if severity in SEVERITY_ORDER else 0
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import hashlib
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from scanner.core.reporting import ScanFinding
+
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_endpoint(url: str) -> str:
+    """Şema ve host küçültülür, varsayılan port atılır; yol ve sorgu olduğu gibi kalır."""
+    parts = urlsplit(url)
+    if not parts.scheme or not parts.netloc:
+        return url
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip("/") or "/"
+    return f"{scheme}://{host}{path}" + (f"?{parts.query}" if parts.query else "")
+
+
+def endpoint_identity(finding: "ScanFinding") -> str:
+    """Bulgunun ait olduğu endpoint: yapılandırmadaki `METHOD yol-şablonu`, yoksa tam URL.
+
+    Yol parçaları tahminle birleştirilmez; `/api/items/1` ile `/api/items/2`
+    ayrı yapılandırılmışsa ayrı bulgulardır.
+    """
+    if finding.target:
+        method, _, url = finding.target.partition(" ")
+        return f"{method} {normalize_endpoint(url)}"
+    return normalize_endpoint(finding.endpoint)
+
+
+def evidence_class(finding: "ScanFinding") -> str:
+    """Aynı kontrolün farklı türdeki bulgularını ayıran, değerden bağımsız sınıf."""
+    evidence: Mapping[str, Any] = finding.evidence
+    detail: Optional[str] = None
+    for key in ("matches", "cookies"):
+        if isinstance(evidence.get(key), dict):
+            detail = ",".join(sorted(evidence[key]))
+            break
+    else:
+        if isinstance(evidence.get("missing"), list):
+            detail = ",".join(sorted(evidence["missing"]))
+        elif isinstance(evidence.get("pattern"), str):
+            detail = evidence["pattern"]
+    return f"{finding.text.text_id}[{detail}]" if detail else finding.text.text_id
+
+
+def compute_fingerprint(finding: "ScanFinding") -> str:
+    parameter = finding.evidence.get("parameter") or ""
+    material = "\x1f".join(
+        (finding.check_id, endpoint_identity(finding), str(parameter), evidence_class(finding))
+    )
+    return hashlib.blake2b(material.encode("utf-8"), digest_size=12).hexdigest()
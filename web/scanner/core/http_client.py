@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import secrets
+import time
 from collections.abc import Mapping, MutableMapping
 from contextlib import asynccontextmanager
-from typing import Any, AsyncIterator, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
 
 import httpx
-from tenacity import AsyncRetrying, RetryError, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from scanner.core.config import HttpSettings
+from scanner.core.profiling import record_request, record_throttle, request_size, response_size
+from scanner.core.response import ScanResponse
+from scanner.core.retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from scanner.core.session import SessionManager
+    from scanner.passive.bus import PassiveBus
 
 
 class HttpClient:
@@ -17,14 +26,22 @@ class HttpClient:
         settings: HttpSettings,
         default_headers: Optional[Mapping[str, str]] = None,
         rate_delay: Optional[float] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
     ) -> None:
         self._settings = settings
+        self._transport = transport
         self._base_headers = dict(default_headers or {})
         self._client: Optional[httpx.AsyncClient] = None
         self._lock = asyncio.Lock()
         self.request_count = 0
         self._rate_delay = rate_delay
         self._rate_lock = asyncio.Lock()
+        self.passive: Optional["PassiveBus"] = None
+        self.session: Optional["SessionManager"] = None
+        # Tarama boyunca tek kural ve tek bütçe; istek başına nesne kurulmaz.
+        self.retry = RetryPolicy.from_settings(settings)
+        # Kayıt/replay transport'ları tohum taşır; prob token'ları iki koşuda da aynı olur.
+        self.token_seed: Optional[str] = getattr(transport, "token_seed", None)
 
     @asynccontextmanager
     async def get_client(self) -> AsyncIterator[httpx.AsyncClient]:
@@ -35,11 +52,14 @@ class HttpClient:
                         "User-Agent": self._settings.user_agent,
                         **self._base_headers,
                     }
-                    self._client = httpx.AsyncClient(
+                    # SSL bağlamı ve sertifika deposu yüklemesi ~200 ms sürer; döngüyü bloklamasın.
+                    self._client = await asyncio.to_thread(
+                        httpx.AsyncClient,
                         timeout=self._settings.timeout,
                         headers=headers,
                         verify=self._settings.verify_ssl,
                         follow_redirects=True,
+                        transport=self._transport,
                     )
         assert self._client is not None
         try:
@@ -48,32 +68,89 @@ class HttpClient:
             # client kapanışı, tarama sonunda dışarıdan yapılacak
             pass
 
+    @property
+    def timeout(self) -> float:
+        return self._settings.timeout
+
+    def probe_token(self, label: str, nbytes: int = 6) -> str:
+        """Yanıtta aranacak benzersiz işaret.
+
+        Tohum yoksa rastgeledir. Tohum varsa `label`'dan türetilir; `label`
+        kontrolü ve isteği tanımlamalı ki kayıttaki istekle birebir eşleşsin.
+        """
+        if self.token_seed is None:
+            return secrets.token_hex(nbytes)
+        digest = hashlib.blake2b(label.encode("utf-8"), digest_size=nbytes, key=self.token_seed.encode("ascii"))
+        return digest.hexdigest()
+
     async def close(self) -> None:
         if self._client is not None:
             await self._client.aclose()
             self._client = None
 
-    async def _request_with_retry(self, **kwargs: Any) -> httpx.Response:
-        retrying = AsyncRetrying(
-            reraise=True,
-            retry=retry_if_exception_type((httpx.RequestError, httpx.TimeoutException)),
-            stop=stop_after_attempt(self._settings.max_retries + 1),
-            wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
-        )
-
-        async for attempt in retrying:
-            with attempt:
-                async with self.get_client() as client:
-                    response = await client.request(**kwargs)
-                    response.raise_for_status()
-                    return response
-        raise RetryError("İstek tekrarlarında beklenmeyen durum.")
-
-    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+    async def _request_with_retry(self, retry: bool = True, **kwargs: Any) -> ScanResponse:
+        policy = self.retry
+        attempt = 0
+        failed_at = 0.0  # ilk hatanın anı; yalnızca `attempt > 0` iken anlamlı
+        try:
+            while True:
+                try:
+                    response = await self._attempt(**kwargs)
+                except httpx.RequestError as exc:
+                    if attempt == 0:
+                        failed_at = time.perf_counter()
+                    if not retry or not policy.should_retry(exc, attempt):
+                        raise
+                    await asyncio.sleep(policy.backoff(attempt))
+                    attempt += 1
+                    continue
+                response.raw.raise_for_status()
+                return response
+        finally:
+            if attempt:
+                policy.record_retry_time(time.perf_counter() - failed_at)
+
+    async def _attempt(self, **kwargs: Any) -> ScanResponse:
+        async with self.get_client() as client:
+            started = time.perf_counter()
+            try:
+                raw = await client.request(**kwargs)
+            except httpx.RequestError:
+                record_request(time.perf_counter() - started, 0, 0)
+                raise
+        record_request(time.perf_counter() - started, request_size(raw.request), response_size(raw))
+        # Hata durum kodu da hedefin yanıt verdiği anlamına gelir; bütçe için başarıdır.
+        self.retry.record_success()
+        response = ScanResponse.of(raw)
+        if self.passive is not None:
+            self.passive.publish(response)
+        return response
+
+    async def request(self, method: str, url: str, retry: bool = True, **kwargs: Any) -> ScanResponse:
+        """`retry=False`, zamanlama ölçen problarda zaman aşımının tekrar denenmesini engeller.
+
+        Oturum yöneticisi varsa istek oturum başlıklarıyla gönderilir; oturum
+        düşmüşse (ör. 401) tek seferlik yenilemeden sonra bir kez tekrarlanır.
+        """
+        session = self.session
+        if session is None or session.is_login_request(url):
+            return await self._send(method, url, retry, **kwargs)
+
+        generation = await session.ensure(self)
+        try:
+            return await self._send(method, url, retry, **session.apply(kwargs))
+        except httpx.HTTPStatusError as exc:
+            if not session.expired(exc.response) or not await session.refresh(self, generation):
+                raise
+        return await self._send(method, url, retry, **session.apply(kwargs))
+
+    async def _send(self, method: str, url: str, retry: bool, **kwargs: Any) -> ScanResponse:
         if self._rate_delay:
+            waited = time.perf_counter()
             async with self._rate_lock:
                 await asyncio.sleep(self._rate_delay)
+            record_throttle(time.perf_counter() - waited)
         self.request_count += 1
-        return await self._request_with_retry(method=method, url=url, **kwargs)
+        return await self._request_with_retry(retry=retry, method=method, url=url, **kwargs)
 
 
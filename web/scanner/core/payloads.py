@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import random
+import shutil
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from scanner.core.config import PayloadCorpusSettings
+from scanner.core.scan_log import ScanLog
+
+
+# Korpus dosyası: başlık | kayıt tablosu (payload başına 24 bayt) | UTF-8 veri | etiket adları (JSON).
+# Dosya salt okunur eşlenir; aynı korpusu açan işçi süreçleri işletim sisteminin sayfa önbelleğini paylaşır.
+MAGIC = b"VSCORPUS"
+CORPUS_VERSION = 1
+MAX_TAGS = 64
+HITS_SUFFIX = ".hits.json"
+TAG_DIRECTIVE = "#!"
+_HEADER = struct.Struct("<8sHHIQQQ")
+_RECORD = struct.Struct("<IIQ8s")
+
+
+class CorpusError(ValueError):
+    """Geçersiz ya da sürümü uyumsuz korpus dosyası."""
+
+
+def payload_digest(payload: str) -> bytes:
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).digest()
+
+
+def hits_path_for(path: Path) -> Path:
+    return path.with_name(path.name + HITS_SUFFIX)
+
+
+@dataclass
+class BuildResult:
+    payloads: int
+    duplicates: int
+    tags: List[str]
+
+
+def _read_source(path: Path) -> Iterator[Tuple[str, Tuple[str, ...]]]:
+    """Kaynak metin dosyası: satır başına bir payload.
+
+    `#! tags: mysql, union` satırı sonraki payload'ların etiketlerini belirler;
+    diğer `#` satırları ve boş satırlar atlanır. Payload'un sondaki boşluğu
+    korunur (MySQL `-- ` yorumu boşluk ister).
+    """
+    tags: Tuple[str, ...] = ()
+    with Path(path).open("r", encoding="utf-8") as handle:
+        for line in handle:
+            line = line.rstrip("\r\n")
+            if line.startswith(TAG_DIRECTIVE):
+                name, _, value = line[len(TAG_DIRECTIVE):].partition(":")
+                if name.strip().lower() == "tags":
+                    tags = tuple(tag.strip().lower() for tag in value.split(",") if tag.strip())
+                continue
+            if not line.strip() or line.startswith("#"):
+                continue
+            yield line, tags
+
+
+def build_corpus(sources: Iterable[Path], output: Path) -> BuildResult:
+    """Kaynak dosyalardan tekilleştirilmiş korpus üret.
+
+    Aynı payload birden fazla kez geçerse ilk konumu korunur, etiketleri
+    birleştirilir. Dosya önce geçici adla yazılıp yerine taşınır; eski
+    korpusu eşlemiş çalışan taramalar etkilenmez.
+    """
+    output = Path(output)
+    tag_bits: Dict[str, int] = {}
+    records: List[List] = []
+    seen: Dict[bytes, int] = {}
+    duplicates = 0
+    size = 0
+    with tempfile.TemporaryFile() as spool:
+        for source in sources:
+            for payload, tags in _read_source(source):
+                mask = 0
+                for tag in tags:
+                    if tag not in tag_bits:
+                        if len(tag_bits) == MAX_TAGS:
+                            raise CorpusError(f"Korpusta en fazla {MAX_TAGS} etiket olabilir.")
+                        tag_bits[tag] = len(tag_bits)
+                    mask |= 1 << tag_bits[tag]
+                digest = payload_digest(payload)
+                index = seen.get(digest)
+                if index is not None:
+                    records[index][2] |= mask
+                    duplicates += 1
+                    continue
+                data = payload.encode("utf-8")
+                seen[digest] = len(records)
+                records.append([size, len(data), mask, digest])
+                spool.write(data)
+                size += len(data)
+        if size > 0xFFFFFFFF:
+            raise CorpusError("Korpus verisi 4 GiB sınırını aşıyor.")
+
+        tags_blob = json.dumps(list(tag_bits), ensure_ascii=False).encode("utf-8")
+        data_offset = _HEADER.size + len(records) * _RECORD.size
+        output.parent.mkdir(parents=True, exist_ok=True)
+        partial = output.with_name(f"{output.name}.{os.getpid()}.tmp")
+        with partial.open("wb") as handle:
+            handle.write(
+                _HEADER.pack(MAGIC, CORPUS_VERSION, 0, len(records), data_offset, data_offset + size, len(tags_blob))
+            )
+            for record in records:
+                handle.write(_RECORD.pack(*record))
+            spool.seek(0)
+            shutil.copyfileobj(spool, handle)
+            handle.write(tags_blob)
+        os.replace(partial, output)
+    return BuildResult(payloads=len(records), duplicates=duplicates, tags=list(tag_bits))
+
+
+class PayloadCorpus:
+    """Bellek eşlemeli korpus; payload'lar yalnızca istendiğinde çözülür."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as handle:
+            try:
+                self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exc:  # boş dosya
+                raise CorpusError(f"{self.path}: korpus dosyası boş.") from exc
+        if len(self._map) < _HEADER.size:
+            self._map.close()
+            raise CorpusError(f"{self.path}: korpus başlığı eksik.")
+        magic, version, _, count, data_offset, tags_offset, tags_length = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != CORPUS_VERSION:
+            self._map.close()
+            raise CorpusError(f"{self.path}: desteklenmeyen korpus biçimi (sürüm {version}).")
+        self._count = count
+        self._data_offset = data_offset
+        self.tags: List[str] = json.loads(self._map[tags_offset:tags_offset + tags_length].decode("utf-8"))
+        self._bits = {tag: 1 << bit for bit, tag in enumerate(self.tags)}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record(self, index: int) -> Tuple[int, int, int, bytes]:
+        return _RECORD.unpack_from(self._map, _HEADER.size + index * _RECORD.size)
+
+    def payload(self, index: int) -> str:
+        offset, length, _, _ = self._record(index)
+        start = self._data_offset + offset
+        return self._map[start:start + length].decode("utf-8")
+
+    def digest(self, index: int) -> bytes:
+        return self._record(index)[3]
+
+    def unknown_tags(self, tags: Sequence[str]) -> List[str]:
+        return [tag for tag in tags if tag not in self._bits]
+
+    def iter_ids(self, tags: Sequence[str] = ()) -> Iterator[int]:
+        """Etiketlerden en az birini taşıyan payload'lar; etiketsiz (genel) payload'lar her zaman dahil."""
+        wanted = 0
+        for tag in tags:
+            wanted |= self._bits.get(tag, 0)
+        for index in range(self._count):
+            mask = self._record(index)[2]
+            if not tags or not mask or mask & wanted:
+                yield index
+
+    def close(self) -> None:
+        self._map.close()
+
+
+class HitStats:
+    """Payload başına geçmiş isabet/deneme sayıları (korpusun yanındaki `.hits.json`).
+
+    Kayıt anahtarı payload özetidir; korpus yeniden üretilse de istatistik
+    korunur. Kaydederken diskteki dosya yeniden okunup bu süreçteki artışlar
+    eklenir; aynı korpusu kullanan işçilerin sayıları birbirini ezmez.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._stats = self._load()
+        self._delta: Dict[str, List[int]] = {}
+
+    def __bool__(self) -> bool:
+        return bool(self._stats)
+
+    def _load(self) -> Dict[str, List[int]]:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            return {}  # bozuk yan dosya: sıralama ipucu olmadan devam
+        return {key: [int(hits), int(tries)] for key, (hits, tries) in data.get("payloads", {}).items()}
+
+    def tried(self, digest: bytes) -> None:
+        self._bump(digest.hex(), 0, 1)
+
+    def hit(self, digest: bytes) -> None:
+        self._bump(digest.hex(), 1, 0)
+
+    def _bump(self, key: str, hits: int, tries: int) -> None:
+        for table in (self._stats, self._delta):
+            entry = table.setdefault(key, [0, 0])
+            entry[0] += hits
+            entry[1] += tries
+
+    def hits(self, digest: bytes) -> int:
+        return self._stats.get(digest.hex(), (0, 0))[0]
+
+    def rate(self, digest: bytes) -> float:
+        """Laplace düzeltmeli isabet oranı; hiç denenmemiş payload 0.5 ile başlar."""
+        hits, tries = self._stats.get(digest.hex(), (0, 0))
+        return (hits + 1) / (tries + 2)
+
+    def save(self) -> None:
+        if not self._delta:
+            return
+        merged = self._load()
+        for key, (hits, tries) in self._delta.items():
+            entry = merged.setdefault(key, [0, 0])
+            entry[0] += hits
+            entry[1] += tries
+        partial = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        partial.write_text(json.dumps({"version": 1, "payloads": merged}, sort_keys=True), encoding="utf-8")
+        os.replace(partial, self.path)
+        self._stats, self._delta = merged, {}
+
+
+def plan_payloads(
+    corpus: PayloadCorpus,
+    stats: HitStats,
+    settings: PayloadCorpusSettings,
+    rng: Optional[random.Random] = None,
+) -> Iterable[int]:
+    """Denenecek payload sırası.
+
+    Örnekleme ve geçmiş yoksa seçim tembel bir üreteçtir. Sıralama açıksa
+    isabet oranına göre (kararlı) sıralanır; örneklemede daha önce isabet
+    etmiş payload'lar her zaman tutulur, kalan yer rastgele doldurulur.
+    """
+    ids: Iterable[int] = corpus.iter_ids(settings.tags)
+    ordered = settings.order_by_hits and bool(stats)
+    if not ordered and settings.sample is None:
+        return ids
+    ids = list(ids)
+    if ordered:
+        ids.sort(key=lambda index: -stats.rate(corpus.digest(index)))
+    if settings.sample is not None and settings.sample < len(ids):
+        proven = [index for index in ids if stats.hits(corpus.digest(index))][: settings.sample] if ordered else []
+        keep = set(proven)
+        rest = [index for index in ids if index not in keep]
+        keep.update((rng or random.Random(settings.seed)).sample(rest, settings.sample - len(proven)))
+        ids = [index for index in ids if index in keep]
+    return ids
+
+
+class PayloadLibrary:
+    """Kontrol başına payload kaynağı: yapılandırmada korpus varsa oradan, yoksa kontrolün yerleşik listesi.
+
+    Korpuslar ilk kullanımda açılır ve aynı dosyayı kullanan kontroller tek
+    eşlemeyi paylaşır. Üretilen her payload deneme sayılır; kontrol bulgu
+    ürettiği payload'u `record_hit` ile bildirir.
+    """
+
+    def __init__(
+        self,
+        settings: Optional[Dict[str, PayloadCorpusSettings]] = None,
+        log: Optional[ScanLog] = None,
+    ) -> None:
+        self.settings = settings or {}
+        self.log = log if log is not None else ScanLog()
+        self._corpora: Dict[Path, Tuple[PayloadCorpus, HitStats]] = {}
+        self._checked: Set[str] = set()
+
+    def iter(self, check_id: str, default: Iterable[str]) -> Iterator[str]:
+        settings = self.settings.get(check_id)
+        if settings is None:
+            return iter(default)
+        corpus, stats = self._open(settings, check_id)
+        return self._feed(corpus, stats, settings)
+
+    def record_hit(self, check_id: str, payload: str) -> None:
+        settings = self.settings.get(check_id)
+        if settings is not None:
+            _, stats = self._open(settings, check_id)
+            stats.hit(payload_digest(payload))
+
+    def save(self) -> None:
+        for _, stats in self._corpora.values():
+            stats.save()
+
+    def close(self) -> None:
+        for corpus, _ in self._corpora.values():
+            corpus.close()
+        self._corpora.clear()
+
+    def _open(self, settings: PayloadCorpusSettings, check_id: str) -> Tuple[PayloadCorpus, HitStats]:
+        entry = self._corpora.get(settings.path)
+        if entry is None:
+            corpus = PayloadCorpus(settings.path)
+            entry = self._corpora[settings.path] = (corpus, HitStats(hits_path_for(settings.path)))
+            self.log.info("payload korpusu açıldı: %s (%d payload).", settings.path, len(corpus), check_id=check_id)
+        if check_id not in self._checked:
+            self._checked.add(check_id)
+            unknown = entry[0].unknown_tags(settings.tags)
+            if unknown:
+                self.log.warning("korpusta olmayan etiketler: %s.", ", ".join(unknown), check_id=check_id)
+        return entry
+
+    @staticmethod
+    def _feed(corpus: PayloadCorpus, stats: HitStats, settings: PayloadCorpusSettings) -> Iterator[str]:
+        for index in plan_payloads(corpus, stats, settings):
+            stats.tried(corpus.digest(index))
+            yield corpus.payload(index)
@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import cProfile
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import FrameType
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+
+import httpx
+from rich.console import Console
+from rich.table import Table
+
+
+DEFAULT_SAMPLE_INTERVAL = 0.005
+# Olay döngüsünün boşta beklediği çerçeveler; CPU işi olmadığından yığına yazılmaz.
+_IDLE_FRAMES = {("selectors", "select"), ("selectors", "poll")}
+
+
+@dataclass
+class UnitCost:
+    """Bir kontrol × endpoint çiftinin toplam maliyeti (saniye / bayt)."""
+
+    check_id: str
+    endpoint: str
+    runs: int = 0
+    wall: float = 0.0
+    network: float = 0.0
+    throttled: float = 0.0
+    requests: int = 0
+    bytes_sent: int = 0
+    bytes_received: int = 0
+
+    @property
+    def cpu(self) -> float:
+        """Ağ ve hız sınırı beklemesi dışında kalan süre: kontrolün CPU işi ve döngüde sıra bekleme."""
+        return max(0.0, self.wall - self.network - self.throttled)
+
+    def serialize(self) -> Dict[str, Any]:
+        return {
+            "check_id": self.check_id,
+            "endpoint": self.endpoint,
+            "runs": self.runs,
+            "wall_ms": round(self.wall * 1000, 2),
+            "network_ms": round(self.network * 1000, 2),
+            "throttled_ms": round(self.throttled * 1000, 2),
+            "cpu_ms": round(self.cpu * 1000, 2),
+            "requests": self.requests,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+        }
+
+
+# Çalışan kontrolün maliyet kaydı; kontrolün açtığı alt görevler bağlamı kopyalayarak devralır.
+_current_unit: ContextVar[Optional[UnitCost]] = ContextVar("scanner_profile_unit", default=None)
+
+
+def record_request(network: float, bytes_sent: int, bytes_received: int) -> None:
+    """HTTP katmanından çağrılır; profil kapalıyken tek bir ContextVar okumasıdır."""
+    unit = _current_unit.get()
+    if unit is not None:
+        unit.requests += 1
+        unit.network += network
+        unit.bytes_sent += bytes_sent
+        unit.bytes_received += bytes_received
+
+
+def record_throttle(seconds: float) -> None:
+    unit = _current_unit.get()
+    if unit is not None:
+        unit.throttled += seconds
+
+
+class StackSampler:
+    """Olay döngüsü iş parçacığının yığınını sabit aralıkla örnekler.
+
+    Çıktı flamegraph.pl / speedscope'un okuduğu "collapsed" biçimidir:
+    her satır `modül:fonksiyon;...;modül:fonksiyon adet`.
+    """
+
+    def __init__(self, interval: float = DEFAULT_SAMPLE_INTERVAL) -> None:
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self.idle = 0
+        self._target = threading.get_ident()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._target = threading.get_ident()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("w", encoding="utf-8") as handle:
+            for stack, count in self.stacks.most_common():
+                handle.write(f"{stack} {count}\n")
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            if frame is not None:
+                self._sample(frame)
+
+    def _sample(self, frame: FrameType) -> None:
+        names: List[str] = []
+        innermost: Optional[Tuple[str, str]] = None
+        current: Optional[FrameType] = frame
+        while current is not None:
+            module = current.f_globals.get("__name__", "?")
+            function = current.f_code.co_name
+            if innermost is None:
+                innermost = (module, function)
+            names.append(f"{module}:{function}")
+            current = current.f_back
+        if innermost in _IDLE_FRAMES:
+            self.idle += 1
+            return
+        self.stacks[";".join(reversed(names))] += 1
+
+
+class ScanProfiler:
+    """`--profile`: kontrol × endpoint maliyet tablosu, isteğe bağlı pstats ve collapsed yığın."""
+
+    def __init__(
+        self,
+        pstats_path: Optional[Path] = None,
+        collapsed_path: Optional[Path] = None,
+        sample_interval: float = DEFAULT_SAMPLE_INTERVAL,
+    ) -> None:
+        self.pstats_path = pstats_path
+        self.collapsed_path = collapsed_path
+        self.units: Dict[Tuple[str, str], UnitCost] = {}
+        # Profilci çıktı yoluyla birlikte tutulur; `stop` sonrası ikisi birden bırakılır.
+        self._cprofile: Optional[Tuple[cProfile.Profile, Path]] = (
+            (cProfile.Profile(), pstats_path) if pstats_path else None
+        )
+        self._sampler: Optional[Tuple[StackSampler, Path]] = (
+            (StackSampler(sample_interval), collapsed_path) if collapsed_path else None
+        )
+
+    def start(self) -> None:
+        if self._cprofile is not None:
+            self._cprofile[0].enable()
+        if self._sampler is not None:
+            self._sampler[0].start()
+
+    def stop(self) -> None:
+        if self._cprofile is not None:
+            profile, pstats_path = self._cprofile
+            profile.disable()
+            pstats_path.parent.mkdir(parents=True, exist_ok=True)
+            profile.dump_stats(str(pstats_path))
+            self._cprofile = None
+        if self._sampler is not None:
+            sampler, collapsed_path = self._sampler
+            sampler.stop()
+            sampler.write(collapsed_path)
+            self._sampler = None
+
+    @contextmanager
+    def unit(self, check_id: str, endpoint: str) -> Iterator[UnitCost]:
+        key = (check_id, endpoint)
+        cost = self.units.get(key)
+        if cost is None:
+            cost = self.units[key] = UnitCost(check_id, endpoint)
+        token = _current_unit.set(cost)
+        started = time.perf_counter()
+        try:
+            yield cost
+        finally:
+            cost.wall += time.perf_counter() - started
+            cost.runs += 1
+            _current_unit.reset(token)
+
+    def ranked(self) -> List[UnitCost]:
+        return sorted(self.units.values(), key=lambda cost: cost.wall, reverse=True)
+
+    def serialize(self) -> List[Dict[str, Any]]:
+        return [cost.serialize() for cost in self.ranked()]
+
+    def render(self, console: Console, top: Optional[int] = None) -> None:
+        ranked = self.ranked()
+        shown = ranked[:top] if top else ranked
+        total = sum(cost.wall for cost in ranked) or 1.0
+        table = Table(title=f"Kontrol maliyetleri ({len(shown)}/{len(ranked)})")
+        table.add_column("Kontrol", no_wrap=True)
+        table.add_column("Endpoint", no_wrap=True)
+        for column in ("Süre ms", "%", "Ağ ms", "CPU ms", "Bekleme ms", "İstek", "Giden", "Gelen"):
+            table.add_column(column, justify="right", no_wrap=True)
+        for cost in shown:
+            table.add_row(
+                cost.check_id,
+                cost.endpoint,
+                f"{cost.wall * 1000:.0f}",
+                f"{cost.wall / total * 100:.0f}",
+                f"{cost.network * 1000:.0f}",
+                f"{cost.cpu * 1000:.0f}",
+                f"{cost.throttled * 1000:.0f}",
+                str(cost.requests),
+                _size(cost.bytes_sent),
+                _size(cost.bytes_received),
+            )
+        console.print(table)
+
+    def render_plain(self, stream: TextIO = sys.stdout, top: Optional[int] = None) -> None:
+        ranked = self.ranked()
+        for cost in ranked[:top] if top else ranked:
+            stream.write(
+                f"profil\t{cost.check_id}\t{cost.endpoint}\twall_ms={cost.wall * 1000:.1f}"
+                f"\tnet_ms={cost.network * 1000:.1f}\tcpu_ms={cost.cpu * 1000:.1f}"
+                f"\tistek={cost.requests}\tgiden={cost.bytes_sent}\tgelen={cost.bytes_received}\n"
+            )
+
+
+def request_size(request: httpx.Request) -> int:
+    """İstek satırı, başlıklar ve gövde; HTTP/1.1 kablo boyutuna yakın bir tahmin."""
+    line = len(request.method) + len(request.url.raw_path) + 12
+    headers = sum(len(name) + len(value) + 4 for name, value in request.headers.raw)
+    return line + headers + len(request.content)
+
+
+def response_size(response: httpx.Response) -> int:
+    headers = sum(len(name) + len(value) + 4 for name, value in response.headers.raw)
+    # Bellekte kurulmuş yanıtlarda (MockTransport, replay) indirme sayacı sıfırdır.
+    return headers + (response.num_bytes_downloaded or len(response.content))
+
+
+def _size(count: int) -> str:
+    if count < 1024:
+        return f"{count}B"
+    if count < 1024 * 1024:
+        return f"{count / 1024:.1f}K"
+    return f"{count / (1024 * 1024):.1f}M"
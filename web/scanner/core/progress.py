@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Optional
+
+from rich.console import Console
+from rich.live import Live
+from rich.text import Text
+
+from scanner.core.reporting import SEVERITY_ORDER, ScanFinding
+
+
+DEFAULT_REFRESH_PER_SECOND = 4.0
+
+
+class ScanProgress:
+    """Tarama ilerleme sayaçları.
+
+    Kontroller yalnızca tamsayı sayaçlarını artırır; görüntü bu sayaçları
+    kendi sabit hızında okur, dolayısıyla olay sıklığı çizim maliyetini
+    etkilemez.
+    """
+
+    def __init__(self, request_count: Optional[Callable[[], int]] = None) -> None:
+        self.total_units = 0
+        self.done_units = 0
+        self.errors = 0
+        self.findings: Counter[str] = Counter()
+        self.started = time.monotonic()
+        self._request_count = request_count or (lambda: 0)
+
+    def add_units(self, count: int) -> None:
+        self.total_units += count
+
+    def unit_done(self, finding: Optional[ScanFinding] = None, error: bool = False) -> None:
+        self.done_units += 1
+        if error:
+            self.errors += 1
+        if finding is not None:
+            self.findings[finding.severity] += 1
+
+    @property
+    def requests(self) -> int:
+        return self._request_count()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    @property
+    def requests_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.requests / elapsed if elapsed > 0 else 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "done": self.done_units,
+            "total": self.total_units,
+            "requests": self.requests,
+            "requests_per_second": round(self.requests_per_second, 2),
+            "errors": self.errors,
+            "findings": {severity: self.findings[severity] for severity in SEVERITY_ORDER},
+            "elapsed": round(self.elapsed, 2),
+        }
+
+    def describe(self) -> str:
+        severities = " ".join(
+            f"{severity}={self.findings[severity]}" for severity in reversed(SEVERITY_ORDER) if self.findings[severity]
+        )
+        return (
+            f"{self.done_units}/{self.total_units} birim | {self.requests} istek "
+            f"({self.requests_per_second:.1f}/sn) | {self.errors} hata | "
+            f"bulgular: {severities or '-'} | {self.elapsed:.1f} sn"
+        )
+
+
+class LiveProgress:
+    """`ScanProgress`'i rich `Live` ile sabit hızda çizen bağlam yöneticisi.
+
+    Tazeleme rich'in kendi iş parçacığında, saniyede `refresh_per_second`
+    kez yapılır; konsol terminal değilse (CI, yönlendirilmiş çıktı) hiçbir
+    şey çizilmez.
+    """
+
+    def __init__(
+        self,
+        progress: ScanProgress,
+        console: Console,
+        refresh_per_second: float = DEFAULT_REFRESH_PER_SECOND,
+    ) -> None:
+        self.progress = progress
+        self._live: Optional[Live] = None
+        if console.is_terminal and not console.quiet:
+            self._live = Live(
+                get_renderable=self._render,
+                console=console,
+                refresh_per_second=refresh_per_second,
+                transient=True,
+            )
+
+    def __enter__(self) -> "LiveProgress":
+        if self._live is not None:
+            self._live.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._live is not None:
+            self._live.stop()
+
+    def _render(self) -> Text:
+        return Text(self.progress.describe(), style="cyan")
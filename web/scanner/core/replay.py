@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import secrets
+import time
+import zlib
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, DefaultDict, Dict, List, Optional
+
+import httpx
+
+
+ARCHIVE_VERSION = 1
+INDEX_SUFFIX = ".idx"
+# Transport'un kaydettiği ağ süresi; `timed_request` bunu duvar saatine tercih eder.
+RECORDED_ELAPSED_EXTENSION = "scanner.recorded_elapsed"
+# Bu boyutun altındaki gövdeler sıkıştırılmaz; zlib başlığı kazancı yer.
+MIN_COMPRESS_BYTES = 256
+
+
+class ReplayMiss(httpx.TransportError):
+    """Arşivde karşılığı olmayan istek. Tekrar denemek sonucu değiştirmez."""
+
+    retryable = False
+
+
+def request_key(method: str, url: str, body: bytes) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(method.upper().encode("ascii"))
+    digest.update(b"\0")
+    digest.update(url.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(body)
+    return digest.hexdigest()
+
+
+def index_path_for(path: Path) -> Path:
+    return path.with_name(path.name + INDEX_SUFFIX)
+
+
+async def _request_key(request: httpx.Request) -> str:
+    return request_key(request.method, str(request.url), await request.aread())
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Gerçek transport'u sarar; her istek/yanıt alışverişini arşive ekler.
+
+    Arşiv iki dosyadan oluşur: ham (gerekirse zlib ile sıkıştırılmış) yanıt
+    gövdelerinin art arda yazıldığı veri dosyası ve her alışverişin ofset,
+    uzunluk, durum, başlık ve süre bilgisini tutan JSON satırları dizini.
+    Her alışveriş önce veri dosyasına, ardından dizine yazılıp diske itilir;
+    süreç yarıda kalırsa o ana kadarki kayıtlar replay edilebilir.
+    """
+
+    def __init__(self, path: Path, inner: Optional[httpx.AsyncBaseTransport] = None) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.inner = inner or httpx.AsyncHTTPTransport()
+        # Aynı tohum replay sırasında yüklenir; prob token'ları birebir aynı üretilir.
+        self.token_seed = secrets.token_hex(16)
+        self.recorded = 0
+        self._data: IO[bytes] = self.path.open("wb")
+        self._index: IO[str] = index_path_for(self.path).open("w", encoding="utf-8")
+        self._offset = 0
+        self._write_index(
+            {
+                "meta": {
+                    "version": ARCHIVE_VERSION,
+                    "token_seed": self.token_seed,
+                    "created": datetime.now(timezone.utc).isoformat(),
+                }
+            }
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = await _request_key(request)
+        started = time.perf_counter()
+        response = await self.inner.handle_async_request(request)
+        try:
+            if response.is_stream_consumed:  # bellekte kurulmuş yanıt (ör. MockTransport)
+                body = response.content
+            else:
+                # Ham (çözülmemiş) gövde saklanır; Content-Encoding istemcide her zamanki gibi çözülür.
+                body = b"".join([chunk async for chunk in response.aiter_raw()])
+        finally:
+            await response.aclose()
+        elapsed = time.perf_counter() - started
+
+        self._append(key, request, response, body, elapsed)
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            content=body,
+            extensions={RECORDED_ELAPSED_EXTENSION: elapsed},
+        )
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+        self._data.close()
+        self._index.close()
+
+    def _append(
+        self,
+        key: str,
+        request: httpx.Request,
+        response: httpx.Response,
+        body: bytes,
+        elapsed: float,
+    ) -> None:
+        stored, compressed = body, False
+        if len(body) >= MIN_COMPRESS_BYTES and "content-encoding" not in response.headers:
+            packed = zlib.compress(body, 6)
+            if len(packed) < len(body):
+                stored, compressed = packed, True
+        self._data.write(stored)
+        # Dizin satırı, işaret ettiği gövde diskte olmadan görünmemeli.
+        self._data.flush()
+        self._write_index(
+            {
+                "key": key,
+                "method": request.method,
+                "url": str(request.url),
+                "status": response.status_code,
+                "headers": response.headers.multi_items(),
+                "offset": self._offset,
+                "length": len(stored),
+                "zlib": compressed,
+                "elapsed": round(elapsed, 6),
+            }
+        )
+        self._offset += len(stored)
+        self.recorded += 1
+
+    def _write_index(self, entry: Dict[str, Any]) -> None:
+        self._index.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")))
+        self._index.write("\n")
+        self._index.flush()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Kaydedilmiş arşivden yanıt veren, ağa hiç çıkmayan transport.
+
+    Veri dosyası bellek eşlemeli açılır; yalnızca istenen gövde dilimi okunur.
+    JSON satırları dizini ise açılışta bir kez okunup belleğe alınır.
+    Aynı istek birden çok kez kaydedildiyse yanıtlar kayıt sırasıyla verilir,
+    sonuncusu tekrarlanır.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.token_seed: Optional[str] = None
+        self.served = 0
+        self.misses = 0
+        self._entries: DefaultDict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._cursor: Dict[str, int] = {}
+        self._load_index(index_path_for(self.path))
+        self._file = self.path.open("rb")
+        size = self.path.stat().st_size
+        self._map: Optional[mmap.mmap] = (
+            mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else None
+        )
+
+    def _load_index(self, index_path: Path) -> None:
+        with index_path.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if not line.endswith("\n"):
+                    break  # kayıt yarıda kesilmiş; eksik son satır atlanır
+                entry = json.loads(line)
+                if "meta" in entry:
+                    self.token_seed = entry["meta"].get("token_seed")
+                    continue
+                self._entries[entry["key"]].append(entry)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        key = await _request_key(request)
+        entries = self._entries.get(key)
+        if not entries:
+            self.misses += 1
+            raise ReplayMiss(f"Arşivde kayıt yok: {request.method} {request.url}", request=request)
+
+        position = self._cursor.get(key, 0)
+        self._cursor[key] = position + 1
+        entry = entries[min(position, len(entries) - 1)]
+        self.served += 1
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=[tuple(pair) for pair in entry["headers"]],
+            content=self._body(entry),
+            extensions={RECORDED_ELAPSED_EXTENSION: entry["elapsed"]},
+        )
+
+    async def aclose(self) -> None:
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def _body(self, entry: Dict[str, Any]) -> bytes:
+        if not entry["length"]:
+            return b""
+        assert self._map is not None
+        start = entry["offset"]
+        data = self._map[start : start + entry["length"]]
+        return zlib.decompress(data) if entry["zlib"] else data
+
@@ -1,50 +1,250 @@
 from __future__ import annotations
 
+import hashlib
 import json
-from collections import Counter, defaultdict
+import sys
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set, TextIO, Tuple
 
 from rich.console import Console
 from rich.table import Table
 
+from scanner.core.fingerprint import compute_fingerprint
+from scanner.core.scan_log import INFO, ScanLog
+
 
 SEVERITY_ORDER = ("info", "low", "medium", "high", "critical")
+_SEVERITY_RANK = {severity: rank for rank, severity in enumerate(SEVERITY_ORDER)}
 
 
-@dataclass
-class ScanFinding:
-    check_id: str
-    severity: str
-    endpoint: str
+_STOP_REASONS = {"interrupted": "kullanıcı iptali", "fail_fast": "--fail-fast eşiğinde bulgu"}
+
+
+def severity_at_least(severity: str, threshold: str) -> bool:
+    return _SEVERITY_RANK.get(severity, 0) >= _SEVERITY_RANK[threshold]
+
+# Terminalde gösterilecek bulgu sayısı; tamamı her zaman JSON raporundadır.
+DEFAULT_TOP = 50
+EVIDENCE_PREVIEW_LIMIT = 240
+
+
+@dataclass(frozen=True, slots=True)
+class FindingText:
+    """Bir kontrolün bulgularında tekrar eden sabit metinler.
+
+    Kontrol sınıfında bir kez tanımlanır; bulgular metni kopyalamak yerine
+    bu kayda (ve `text_id` kimliğine) referans tutar.
+    """
+
+    text_id: str
     summary: str
     description: str
-    evidence: Dict[str, Any] = field(default_factory=dict)
-    remediation: Optional[str] = None
-    references: List[str] = field(default_factory=list)
+    remediation: Optional[str]
+    references: Tuple[str, ...]
+
+
+# Yalnızca kontrol sınıflarında tanımlanan sabit metinler; süreç boyunca sabit kalır.
+_TEXT_CATALOG: Dict[str, FindingText] = {}
+_TEXT_BY_CONTENT: Dict[Tuple[Any, ...], FindingText] = {}
+
+
+def finding_text(
+    text_id: str,
+    summary: str,
+    description: str,
+    remediation: Optional[str] = None,
+    references: Iterable[str] = (),
+) -> FindingText:
+    """Kimliği verilen sabit metni kataloğa kaydet (kontrol sınıfı tanımında kullanılır)."""
+    text = FindingText(text_id, summary, description, remediation, tuple(references))
+    key = (summary, description, remediation, text.references)
+    existing = _TEXT_BY_CONTENT.get(key)
+    if existing is not None:
+        return existing
+    _TEXT_CATALOG[text_id] = text
+    _TEXT_BY_CONTENT[key] = text
+    return text
+
+
+def intern_text(
+    summary: str,
+    description: str,
+    remediation: Optional[str] = None,
+    references: Iterable[str] = (),
+) -> FindingText:
+    """İçeriğe göre katalogdaki sabit metni bul; yoksa içerik özetinden kimlik üret.
+
+    Katalogda olmayan metinler kaydedilmez (süreç ömrünce birikmesinler);
+    aynı rapordaki kopyaları `ScanReport.add_finding` tekilleştirir.
+    """
+    refs = tuple(references)
+    existing = _TEXT_BY_CONTENT.get((summary, description, remediation, refs))
+    if existing is not None:
+        return existing
+    digest = hashlib.blake2b(
+        "\x1f".join((summary, description, remediation or "", *refs)).encode("utf-8"), digest_size=8
+    ).hexdigest()
+    return FindingText(f"adhoc:{digest}", summary, description, remediation, refs)
+
+
+def get_text(text_id: str) -> FindingText:
+    return _TEXT_CATALOG[text_id]
+
+
+class ScanFinding:
+    """Tek bir bulgu. Bellekte kompakt tutulur; `serialize` çıktısı değişmez.
+
+    Sabit metinler paylaşılan `FindingText` kaydından, endpoint internlenmiş
+    dizeden okunur. Delil salt okunur bir eşlemedir; rapora eklenirken uzun
+    parçacıklar içerik özetine göre tekilleştirilir.
+    """
+
+    __slots__ = ("check_id", "severity", "endpoint", "target", "text", "_evidence", "_fingerprint")
+
+    def __init__(
+        self,
+        check_id: str,
+        severity: str,
+        endpoint: str,
+        summary: Optional[str] = None,
+        description: Optional[str] = None,
+        evidence: Optional[Dict[str, Any]] = None,
+        remediation: Optional[str] = None,
+        references: Optional[Iterable[str]] = None,
+        text: Optional[FindingText] = None,
+        target: Optional[str] = None,
+    ) -> None:
+        if text is None:
+            if summary is None or description is None:
+                raise ValueError("ScanFinding için `text` ya da `summary` ve `description` gerekli.")
+            text = intern_text(summary, description, remediation, references or ())
+        self.check_id = sys.intern(check_id)
+        self.severity = sys.intern(severity)
+        self.endpoint = sys.intern(endpoint)
+        # Yapılandırılmış endpoint kimliği (`GET http://host/api/items/{id}`); parmak izi bundan türetilir.
+        self.target = sys.intern(target) if target else None
+        self.text = text
+        self._evidence: Mapping[str, Any] = MappingProxyType(dict(evidence or {}))
+        self._fingerprint: Optional[str] = None
+
+    @property
+    def summary(self) -> str:
+        return self.text.summary
+
+    @property
+    def description(self) -> str:
+        return self.text.description
+
+    @property
+    def remediation(self) -> Optional[str]:
+        return self.text.remediation
+
+    @property
+    def references(self) -> List[str]:
+        return list(self.text.references)
+
+    @property
+    def evidence(self) -> Mapping[str, Any]:
+        return self._evidence
+
+    @property
+    def fingerprint(self) -> str:
+        """Kontrol, endpoint kimliği, parametre ve delil sınıfından türetilen kararlı kimlik."""
+        if self._fingerprint is None:
+            self._fingerprint = compute_fingerprint(self)
+        return self._fingerprint
+
+    def intern_evidence(self, pool: "SnippetPool") -> None:
+        self._evidence = MappingProxyType(
+            {sys.intern(key): pool.intern(value) for key, value in self._evidence.items()}
+        )
 
     def serialize(self) -> Dict[str, Any]:
-        return {
+        data = {
             "check_id": self.check_id,
             "severity": self.severity,
             "endpoint": self.endpoint,
             "summary": self.summary,
             "description": self.description,
-            "evidence": self.evidence,
+            "evidence": dict(self._evidence),
             "remediation": self.remediation,
             "references": self.references,
         }
+        if self.target:
+            data["target"] = self.target
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ScanFinding":
+        return cls(
+            check_id=data["check_id"],
+            severity=data["severity"],
+            endpoint=data["endpoint"],
+            summary=data["summary"],
+            description=data["description"],
+            evidence=dict(data.get("evidence") or {}),
+            remediation=data.get("remediation"),
+            references=list(data.get("references") or []),
+            target=data.get("target"),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ScanFinding):
+            return NotImplemented
+        return self.serialize() == other.serialize()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ScanFinding(check_id={self.check_id!r}, severity={self.severity!r}, endpoint={self.endpoint!r})"
+
+
+class SnippetPool:
+    """Uzun delil parçacıklarını içerik özetine göre tekilleştirir (rapor başına)."""
+
+    __slots__ = ("_snippets", "min_length")
+
+    def __init__(self, min_length: int = 32) -> None:
+        self._snippets: Dict[bytes, str] = {}
+        self.min_length = min_length
+
+    def __len__(self) -> int:
+        return len(self._snippets)
+
+    def intern(self, value: Any) -> Any:
+        if not isinstance(value, str) or len(value) < self.min_length:
+            return value
+        digest = hashlib.blake2b(value.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+        return self._snippets.setdefault(digest, value)
 
 
 @dataclass
 class ScanSummary:
     stats: Dict[str, int] = field(default_factory=lambda: {sev: 0 for sev in SEVERITY_ORDER})
     total_requests: int = 0
+    duplicates: int = 0
+    coverage: Optional[Dict[str, Any]] = None
+    # Havuza gönderilen analiz sayıları ve olay döngüsü gecikmesi (`loop_lag`).
+    analysis: Optional[Dict[str, Any]] = None
+    # HTTP yeniden deneme sayıları, harcanan süre ve bütçe reddi (`RetryPolicy.stats`).
+    retries: Optional[Dict[str, Any]] = None
+    # Tarama yarıda kesildiyse nedeni ("interrupted", "fail_fast"); rapor yalnızca biten birimleri içerir.
+    stop_reason: Optional[str] = None
     start_time: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     end_time: Optional[datetime] = None
 
+    @property
+    def incomplete(self) -> bool:
+        return self.stop_reason is not None
+
+    @property
+    def loop_lag(self) -> Optional[Dict[str, Any]]:
+        return self.analysis.get("loop_lag") if self.analysis else None
+
     def finalize(self) -> None:
         self.end_time = datetime.now(timezone.utc)
 
@@ -52,62 +252,172 @@ class ScanSummary:
         return {
             "stats": self.stats,
             "total_requests": self.total_requests,
+            "duplicates": self.duplicates,
+            "coverage": self.coverage,
+            "analysis": self.analysis,
+            "retries": self.retries,
+            "incomplete": self.incomplete,
+            "stop_reason": self.stop_reason,
             "start_time": self.start_time.isoformat(),
             "end_time": self.end_time.isoformat() if self.end_time else None,
             "duration_seconds": (self.end_time - self.start_time).total_seconds() if self.end_time else None,
         }
 
 
+def evidence_preview(evidence: Mapping[str, Any], limit: int = EVIDENCE_PREVIEW_LIMIT) -> str:
+    """Delili `anahtar: değer` satırları olarak kısalt; `json.dumps(indent=2)` maliyetinden kaçınır."""
+    lines: List[str] = []
+    remaining = limit
+    for key, value in evidence.items():
+        if remaining <= 0:
+            lines.append("…")
+            break
+        if isinstance(value, (list, tuple)):
+            text = ", ".join(str(item) for item in value[:5]) + (", …" if len(value) > 5 else "")
+        else:
+            text = str(value)
+        line = f"{key}: {text}"
+        if len(line) > remaining:
+            line = line[: max(remaining - 1, 0)] + "…"
+        lines.append(line)
+        remaining -= len(line)
+    return "\n".join(lines)
+
+
 class ScanReport:
-    def __init__(self) -> None:
+    def __init__(self, log: Optional[ScanLog] = None) -> None:
         self.summary = ScanSummary()
         self.findings: List[ScanFinding] = []
-        self.log_messages: List[str] = []
+        self.log = log if log is not None else ScanLog()
+        # Zaman bütçesi dolduğu için hiç başlatılmamış endpoint × kontrol çiftleri.
+        self.skipped: List[Dict[str, Any]] = []
+        # `--profile` ile: maliyete göre sıralı kontrol × endpoint kayıtları.
+        self.profile: Optional[List[Dict[str, Any]]] = None
+        self._snippets = SnippetPool()
+        self._texts: Dict[str, FindingText] = {}
+        self._fingerprints: Set[str] = set()
 
-    def add_finding(self, finding: ScanFinding) -> None:
+    def add_finding(self, finding: ScanFinding) -> bool:
+        """Bulguyu ekle; aynı parmak izi bu taramada zaten varsa atla ve `False` dön."""
+        fingerprint = finding.fingerprint
+        if fingerprint in self._fingerprints:
+            self.summary.duplicates += 1
+            return False
+        self._fingerprints.add(fingerprint)
+        finding.intern_evidence(self._snippets)
+        finding.text = self._texts.setdefault(finding.text.text_id, finding.text)
         severity = finding.severity if finding.severity in SEVERITY_ORDER else "info"
         self.summary.stats[severity] += 1
         self.findings.append(finding)
+        return True
 
-    def add_log(self, message: str) -> None:
-        self.log_messages.append(message)
+    def add_log(self, message: str, level: str = INFO) -> None:
+        """Geriye uyumlu kısa yol; yeni kod `report.log` üzerinden seviyeli olay yazar."""
+        self.log.log(level, message)
 
-    def render(self, console: Console) -> None:
+    @property
+    def log_messages(self) -> List[str]:
+        """Halka tamponda kalan olayların düz metin hali."""
+        return [event.format() for event in self.log.events()]
+
+    def ranked_findings(self) -> List[ScanFinding]:
+        """Bulgular, en yüksek önem derecesi önde olacak şekilde."""
+        return sorted(self.findings, key=lambda f: _SEVERITY_RANK.get(f.severity, 0), reverse=True)
+
+    def render(self, console: Console, top: Optional[int] = DEFAULT_TOP) -> None:
+        """Önce özet, ardından önem sırasına göre ilk `top` bulgu (`None`/0: tümü)."""
         totals = Table(title="Özet")
         totals.add_column("Seviye")
         totals.add_column("Adet", justify="right")
         for severity in SEVERITY_ORDER:
             totals.add_row(severity.title(), str(self.summary.stats[severity]))
         console.print(totals)
+        if self.summary.stop_reason is not None:
+            reason = _STOP_REASONS.get(self.summary.stop_reason, self.summary.stop_reason)
+            console.print(
+                f"[bold yellow]Tarama yarıda kesildi ({reason}); "
+                "rapor yalnızca tamamlanan birimleri içerir.[/bold yellow]"
+            )
+        coverage = self.summary.coverage
+        if coverage and coverage["skipped"]:
+            console.print(
+                f"[yellow]Kapsam: {coverage['completed']}/{coverage['planned']} birim "
+                f"(%{coverage['ratio'] * 100:.0f}); {coverage['skipped']} birim zaman bütçesi nedeniyle atlandı.[/yellow]"
+            )
+        lag = self.summary.loop_lag
+        if lag and lag["stalls"]:
+            console.print(
+                f"[yellow]Olay döngüsü {lag['stalls']} kez takıldı (p95 {lag['p95_ms']} ms, "
+                f"en fazla {lag['max_ms']} ms).[/yellow]"
+            )
+        retries = self.summary.retries
+        if retries and (retries["retries"] or retries["denied_by_budget"]):
+            console.print(
+                f"[yellow]Yeniden deneme: {retries['retries']} ({retries['retry_seconds']:.1f} sn); "
+                f"bütçe nedeniyle denenmeyen: {retries['denied_by_budget']}.[/yellow]"
+            )
 
         if not self.findings:
             console.print("[green]Bulgu bulunamadı.[/green]")
             return
 
-        by_severity: Dict[str, List[ScanFinding]] = defaultdict(list)
-        for finding in sorted(self.findings, key=lambda f: SEVERITY_ORDER.index(f.severity)):
-            by_severity[finding.severity].append(finding)
+        ranked = self.ranked_findings()
+        shown = ranked[:top] if top else ranked
+        table = Table(title=f"Bulgular ({len(shown)}/{len(ranked)})")
+        table.add_column("Seviye", no_wrap=True)
+        table.add_column("Kontrol", no_wrap=True)
+        table.add_column("Endpoint", no_wrap=True)
+        table.add_column("Özet")
+        table.add_column("Delil")
+        for finding in shown:
+            table.add_row(
+                finding.severity.title(),
+                finding.check_id,
+                finding.endpoint,
+                finding.summary,
+                evidence_preview(finding.evidence),
+            )
+        console.print(table)
+        if len(shown) < len(ranked):
+            console.print(
+                f"[dim]{len(ranked) - len(shown)} bulgu daha gösterilmedi; --top ile artırın, "
+                "tamamı JSON raporunda.[/dim]"
+            )
 
-        for severity in SEVERITY_ORDER:
-            findings = by_severity.get(severity)
-            if not findings:
-                continue
-            console.rule(f"[bold]{severity.title()}[/bold]")
-            table = Table(title=None, show_lines=True)
-            table.add_column("Endpoint", no_wrap=True)
-            table.add_column("Özet")
-            table.add_column("Delil")
-            for finding in findings:
-                evidence_str = json.dumps(finding.evidence, ensure_ascii=False, indent=2)[:500]
-                table.add_row(finding.endpoint, finding.summary, evidence_str)
-            console.print(table)
+    def render_plain(self, stream: TextIO = sys.stdout, top: Optional[int] = DEFAULT_TOP) -> None:
+        """rich kullanmadan düz metin çıktı (CI için `--quiet`)."""
+        stats = " ".join(f"{severity}={self.summary.stats[severity]}" for severity in reversed(SEVERITY_ORDER))
+        stream.write(f"özet: {stats} istek={self.summary.total_requests}\n")
+        if self.summary.incomplete:
+            stream.write(f"eksik: {self.summary.stop_reason}\n")
+        coverage = self.summary.coverage
+        if coverage and coverage["skipped"]:
+            stream.write(f"kapsam: {coverage['completed']}/{coverage['planned']} atlanan={coverage['skipped']}\n")
+        lag = self.summary.loop_lag
+        if lag and lag["stalls"]:
+            stream.write(f"döngü: takılma={lag['stalls']} p95_ms={lag['p95_ms']} max_ms={lag['max_ms']}\n")
+        retries = self.summary.retries
+        if retries and (retries["retries"] or retries["denied_by_budget"]):
+            stream.write(
+                f"tekrar: deneme={retries['retries']} sn={retries['retry_seconds']} "
+                f"bütçe_reddi={retries['denied_by_budget']}\n"
+            )
+        ranked = self.ranked_findings()
+        shown = ranked[:top] if top else ranked
+        for finding in shown:
+            stream.write(f"{finding.severity}\t{finding.check_id}\t{finding.endpoint}\t{finding.summary}\n")
+        if len(shown) < len(ranked):
+            stream.write(f"... {len(ranked) - len(shown)} bulgu daha\n")
 
     def write_json(self, path: Path) -> None:
         payload = {
             "summary": self.summary.serialize(),
             "findings": [finding.serialize() for finding in self.findings],
-            "logs": self.log_messages,
+            "skipped": self.skipped,
+            "logs": self.log.serialize(),
         }
+        if self.profile is not None:
+            payload["profile"] = self.profile
         path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
 
 
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import quote_plus
+
+from scanner.core.config import Endpoint
+
+
+QUERY = "query"
+JSON = "json"
+FORM = "form"
+
+FORM_CONTENT_TYPE = "application/x-www-form-urlencoded"
+
+
+@dataclass(frozen=True)
+class InsertionPoint:
+    location: str
+    name: str
+
+
+def _primitive(value: Any) -> str:
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _encode_pair(name: str, value: Any) -> str:
+    key = quote_plus(str(name))
+    if isinstance(value, (list, tuple)):
+        return "&".join(f"{key}={quote_plus(_primitive(item))}" for item in value)
+    return f"{key}={quote_plus(_primitive(value))}"
+
+
+class _EncodedSection:
+    """Değişmeyen alanları bir kez kodlanmış halde tutar; payload gelen alan yeniden kodlanır."""
+
+    __slots__ = ("names", "parts")
+
+    def __init__(self, values: Mapping[str, Any]) -> None:
+        self.names: Tuple[str, ...] = tuple(values)
+        self.parts: Tuple[str, ...] = tuple(_encode_pair(name, values[name]) for name in self.names)
+
+    def encode(self, overrides: Optional[Dict[str, Any]] = None) -> str:
+        if not overrides:
+            return "&".join(self.parts)
+        parts: List[str] = []
+        for name, part in zip(self.names, self.parts, strict=True):
+            parts.append(_encode_pair(name, overrides[name]) if name in overrides else part)
+        for name, value in overrides.items():
+            if name not in self.names:
+                parts.append(_encode_pair(name, value))
+        return "&".join(parts)
+
+
+class RequestTemplate:
+    """Endpoint başına bir kez kurulan, değiştirilemez istek şablonu.
+
+    Payload'lar adlandırılmış ekleme noktalarına yerleştirilir; değişmeyen
+    bölümler (başlıklar, kodlanmış sorgu/form parçaları, JSON gövdesi) her
+    istekte kopyalanmadan paylaşılır.
+    """
+
+    __slots__ = (
+        "method",
+        "url",
+        "headers",
+        "query",
+        "json",
+        "form",
+        "insertion_points",
+        "_query",
+        "_json",
+        "_form",
+        "_form_headers",
+        "_base_url",
+        "_base_form",
+    )
+
+    def __init__(
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        query: Optional[Mapping[str, Any]] = None,
+        json: Optional[Mapping[str, Any]] = None,
+        form: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.headers: Mapping[str, str] = MappingProxyType(dict(headers or {}))
+        self.query: Mapping[str, Any] = MappingProxyType(dict(query or {}))
+        self._json: Optional[Dict[str, Any]] = dict(json) if json else None
+        self.json: Optional[Mapping[str, Any]] = MappingProxyType(self._json) if self._json else None
+        self.form: Optional[Mapping[str, Any]] = MappingProxyType(dict(form)) if form else None
+
+        points: List[InsertionPoint] = [InsertionPoint(QUERY, name) for name in self.query]
+        points.extend(InsertionPoint(JSON, name) for name in self.json or ())
+        points.extend(InsertionPoint(FORM, name) for name in self.form or ())
+        self.insertion_points: Tuple[InsertionPoint, ...] = tuple(points)
+
+        self._query = _EncodedSection(self.query)
+        self._base_url = self._join_query(self._query.encode())
+        self._form = _EncodedSection(self.form) if self.form is not None else None
+        self._base_form = self._form.encode().encode("utf-8") if self._form is not None else None
+        self._form_headers: Mapping[str, str] = MappingProxyType(
+            {**self.headers, "Content-Type": FORM_CONTENT_TYPE}
+        )
+
+    @classmethod
+    def from_endpoint(
+        cls,
+        base_url: str,
+        endpoint: Endpoint,
+        base_headers: Iterable[Tuple[str, str]] = (),
+    ) -> "RequestTemplate":
+        headers = dict(base_headers)
+        for header in endpoint.headers:
+            headers[header.name] = header.value
+        return cls(
+            method=endpoint.method,
+            url=f"{base_url.rstrip('/')}{endpoint.path}",
+            headers=headers,
+            query=endpoint.query,
+            json=endpoint.json,
+            form=endpoint.data,
+        )
+
+    @property
+    def has_body(self) -> bool:
+        return self.json is not None or self.form is not None
+
+    def primary_points(self) -> Tuple[InsertionPoint, ...]:
+        """Her bölümün ilk parametresi; sorgu boşsa `probe` adlı yeni bir nokta."""
+        points = [InsertionPoint(QUERY, next(iter(self.query), "probe"))]
+        if self.json:
+            points.append(InsertionPoint(JSON, next(iter(self.json))))
+        if self.form:
+            points.append(InsertionPoint(FORM, next(iter(self.form))))
+        return tuple(points)
+
+    def render(
+        self,
+        values: Optional[Mapping[InsertionPoint, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Dict[str, Any]:
+        """`HttpClient.request` için argümanları üret. Yalnızca dokunulan bölümler yeniden kurulur."""
+        overrides: Dict[str, Dict[str, Any]] = {}
+        for point, value in (values or {}).items():
+            overrides.setdefault(point.location, {})[point.name] = value
+
+        query = overrides.get(QUERY)
+        kwargs: Dict[str, Any] = {
+            "method": self.method,
+            "url": self._join_query(self._query.encode(query)) if query else self._base_url,
+        }
+
+        request_headers = self.headers
+        # httpx, form ve JSON birlikte verildiğinde form gövdesini gönderir.
+        if self._form is not None:
+            form_overrides = overrides.get(FORM)
+            kwargs["content"] = (
+                self._form.encode(form_overrides).encode("utf-8") if form_overrides else self._base_form
+            )
+            request_headers = self._form_headers
+        elif self._json is not None:
+            json_overrides = overrides.get(JSON)
+            kwargs["json"] = {**self._json, **json_overrides} if json_overrides else self._json
+
+        kwargs["headers"] = {**request_headers, **headers} if headers else request_headers
+        return kwargs
+
+    def as_kwargs(self) -> Dict[str, Any]:
+        """Eski `request_kwargs` biçiminde (değiştirilebilir) bir kopya döndür."""
+        kwargs: Dict[str, Any] = {"headers": dict(self.headers)}
+        if self.query:
+            kwargs["params"] = dict(self.query)
+        if self.json:
+            kwargs["json"] = dict(self.json)
+        if self.form:
+            kwargs["data"] = dict(self.form)
+        return kwargs
+
+    def _join_query(self, encoded: str) -> str:
+        if not encoded:
+            return self.url
+        separator = "&" if "?" in self.url else "?"
+        return f"{self.url}{separator}{encoded}"
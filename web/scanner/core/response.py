@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import json
+from functools import cached_property
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+import httpx
+from bs4 import BeautifulSoup
+
+
+T = TypeVar("T")
+
+_EXTENSION_KEY = "scanner.scan_response"
+_MISSING = object()
+
+
+class ScanResponse:
+    """`httpx.Response` üzerinde tembel ve önbellekli görünümler.
+
+    HTTP katmanı her yanıt için tek bir `ScanResponse` üretir; metin çözme,
+    casefold, JSON/HTML ayrıştırma ve başlık aramaları, yanıtı kaç kontrol
+    incelerse incelesin en fazla bir kez yapılır.
+    """
+
+    def __init__(self, raw: httpx.Response) -> None:
+        self.raw = raw
+        self._headers: Dict[str, Optional[str]] = {}
+        self._memo: Dict[str, Any] = {}
+        self._json: Any = _MISSING
+
+    @classmethod
+    def of(cls, response: "httpx.Response | ScanResponse") -> "ScanResponse":
+        """Aynı ham yanıt için her zaman aynı sarmalayıcıyı döndür (ör. `HTTPStatusError.response`)."""
+        if isinstance(response, ScanResponse):
+            return response
+        wrapped = response.extensions.get(_EXTENSION_KEY)
+        if wrapped is None:
+            wrapped = cls(response)
+            response.extensions[_EXTENSION_KEY] = wrapped
+        return wrapped
+
+    @property
+    def status_code(self) -> int:
+        return self.raw.status_code
+
+    @property
+    def url(self) -> httpx.URL:
+        return self.raw.url
+
+    @property
+    def request(self) -> httpx.Request:
+        return self.raw.request
+
+    @property
+    def headers(self) -> httpx.Headers:
+        return self.raw.headers
+
+    @property
+    def content(self) -> bytes:
+        return self.raw.content
+
+    @cached_property
+    def text(self) -> str:
+        return self.raw.text
+
+    @cached_property
+    def folded(self) -> str:
+        """Büyük/küçük harf duyarsız aramalar için casefold edilmiş metin."""
+        return self.text.casefold()
+
+    @cached_property
+    def soup(self) -> BeautifulSoup:
+        return BeautifulSoup(self.text, "html.parser")
+
+    def json(self) -> Any:
+        """Ayrıştırılmış JSON gövdesi; gövde JSON değilse `None`."""
+        if self._json is _MISSING:
+            try:
+                self._json = json.loads(self.text)
+            except ValueError:
+                self._json = None
+        return self._json
+
+    def header(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        key = name.lower()
+        if key not in self._headers:
+            self._headers[key] = self.raw.headers.get(key)
+        value = self._headers[key]
+        return default if value is None else value
+
+    def has_header(self, name: str) -> bool:
+        return self.header(name) is not None
+
+    def has_memo(self, key: str) -> bool:
+        return key in self._memo
+
+    def memo(self, key: str, factory: Callable[[], T]) -> T:
+        """Kontroller arası paylaşılan analiz sonuçlarını yanıt başına bir kez hesapla."""
+        if key not in self._memo:
+            self._memo[key] = factory()
+        return self._memo[key]
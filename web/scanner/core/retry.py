@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List
+
+import httpx
+
+from scanner.core.config import HttpSettings
+
+
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 4.0
+
+
+def is_retryable(exc: BaseException) -> bool:
+    # ReplayMiss gibi hatalar `retryable = False` ile tekrar denemeden çıkar.
+    return isinstance(exc, httpx.RequestError) and getattr(exc, "retryable", True)
+
+
+class RetryBudget:
+    """Kayan pencerede yeniden deneme bütçesi.
+
+    Pencere içinde en fazla `reserve + ratio × başarılı istek` kadar yeniden
+    deneme yapılır. Hedef çökmüşse başarı gelmez, bütçe `reserve`'de kalır ve
+    her isteğin `max_retries` kez tekrarlanması yükü katlamaz. Pencere
+    saniyelik kovalarla tutulur; maliyet istek sayısından bağımsızdır.
+    """
+
+    def __init__(
+        self,
+        ratio: float = 0.1,
+        window: int = 10,
+        reserve: int = 10,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ratio = ratio
+        self.window = window
+        self.reserve = reserve
+        self._clock = clock
+        self._buckets: Deque[List[int]] = deque()  # [saniye, başarı, yeniden deneme]
+        self._successes = 0
+        self._retries = 0
+
+    def record_success(self) -> None:
+        self._bucket()[1] += 1
+        self._successes += 1
+
+    def try_acquire(self) -> bool:
+        bucket = self._bucket()
+        if self._retries >= self.reserve + self.ratio * self._successes:
+            return False
+        bucket[2] += 1
+        self._retries += 1
+        return True
+
+    def _bucket(self) -> List[int]:
+        now = int(self._clock())
+        while self._buckets and self._buckets[0][0] <= now - self.window:
+            _, successes, retries = self._buckets.popleft()
+            self._successes -= successes
+            self._retries -= retries
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append([now, 0, 0])
+        return self._buckets[-1]
+
+
+class RetryPolicy:
+    """İstemci başına bir kez kurulan yeniden deneme kuralı: hata sınıfı, deneme sınırı, bütçe ve bekleme.
+
+    Bekleme "full jitter" üsteldir: `[0, min(max_delay, base_delay × 2^deneme)]`
+    aralığından rastgele. Aynı anda düşen istekler aynı anda tekrar gelmez.
+    """
+
+    def __init__(
+        self,
+        max_retries: int,
+        budget: RetryBudget,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        self.max_retries = max_retries
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._rng = rng
+        self.retries = 0
+        self.denied = 0
+        self.gave_up = 0
+        self.retry_seconds = 0.0
+
+    @classmethod
+    def from_settings(cls, settings: HttpSettings) -> "RetryPolicy":
+        budget = RetryBudget(
+            ratio=settings.retry_budget_ratio,
+            window=settings.retry_budget_window,
+            reserve=settings.retry_budget_reserve,
+        )
+        return cls(settings.max_retries, budget)
+
+    def should_retry(self, exc: BaseException, attempt: int) -> bool:
+        """`attempt` 0'dan başlar: ilk denemenin hatası için 0."""
+        if not is_retryable(exc):
+            return False
+        if attempt >= self.max_retries:
+            self.gave_up += 1
+            return False
+        if not self.budget.try_acquire():
+            self.denied += 1
+            return False
+        self.retries += 1
+        return True
+
+    def backoff(self, attempt: int) -> float:
+        return self._rng() * min(self.max_delay, self.base_delay * 2 ** attempt)
+
+    def record_success(self) -> None:
+        self.budget.record_success()
+
+    def record_retry_time(self, seconds: float) -> None:
+        self.retry_seconds += seconds
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "retries": self.retries,
+            "retry_seconds": round(self.retry_seconds, 3),
+            "denied_by_budget": self.denied,
+            "gave_up": self.gave_up,
+            "budget_ratio": self.budget.ratio,
+        }
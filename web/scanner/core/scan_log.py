@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import json
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Deque, Dict, List, Mapping, Optional, Tuple
+
+
+DEBUG = "debug"
+INFO = "info"
+WARNING = "warning"
+ERROR = "error"
+
+LOG_LEVELS: Tuple[str, ...] = (DEBUG, INFO, WARNING, ERROR)
+
+DEFAULT_CAPACITY = 500
+DEFAULT_TAIL = 50
+# Seviye başına "N olaydan biri" tamponda tutulur; dosyaya her olay yazılır.
+DEFAULT_SAMPLING: Mapping[str, int] = {DEBUG: 20, INFO: 1, WARNING: 1, ERROR: 1}
+# Dosya en geç bu aralıkla diske itilir; uyarı ve hatalar beklemeden yazılır.
+FLUSH_INTERVAL = 1.0
+
+
+class LogEvent:
+    """Tek bir tarama günlüğü olayı; mesaj yalnızca ihtiyaç olduğunda biçimlendirilir."""
+
+    __slots__ = ("seq", "level", "timestamp", "endpoint", "check_id", "_template", "_args", "_message")
+
+    def __init__(
+        self,
+        seq: int,
+        level: str,
+        template: str,
+        args: Tuple[Any, ...] = (),
+        endpoint: Optional[str] = None,
+        check_id: Optional[str] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        self.seq = seq
+        self.level = level
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.endpoint = endpoint
+        self.check_id = check_id
+        self._template = template
+        self._args = args
+        self._message: Optional[str] = None
+
+    @property
+    def message(self) -> str:
+        if self._message is None:
+            try:
+                self._message = self._template % self._args if self._args else self._template
+            except (TypeError, ValueError):
+                self._message = " ".join([self._template, *map(str, self._args)])
+            self._args = ()
+        return self._message
+
+    def format(self) -> str:
+        """Eski `log_messages` biçimi: `endpoint -> check_id mesaj`."""
+        prefix = self.endpoint or ""
+        if self.check_id:
+            prefix = f"{prefix} -> {self.check_id}" if prefix else self.check_id
+        return f"{prefix} {self.message}" if prefix else self.message
+
+    def serialize(self) -> Dict[str, Any]:
+        return {
+            "time": datetime.fromtimestamp(self.timestamp, timezone.utc).isoformat(),
+            "level": self.level,
+            "endpoint": self.endpoint,
+            "check_id": self.check_id,
+            "message": self.message,
+        }
+
+    @classmethod
+    def from_dict(cls, seq: int, data: Mapping[str, Any]) -> "LogEvent":
+        stamp = data.get("time")
+        level = data.get("level")
+        return cls(
+            seq=seq,
+            level=level if isinstance(level, str) and level in LOG_LEVELS else INFO,
+            template=str(data.get("message", "")),
+            endpoint=data.get("endpoint"),
+            check_id=data.get("check_id"),
+            timestamp=datetime.fromisoformat(stamp).timestamp() if stamp else None,
+        )
+
+
+class ScanLog:
+    """Seviyeli, yapılandırılmış tarama günlüğü.
+
+    Bellekte yalnızca sınırlı bir halka tampon tutulur (gürültülü seviyeler
+    örneklenir). `path` verilirse eşik seviyesindeki her olay JSON satırı
+    olarak dosyaya akıtılır ve rapor bu dosyaya referans verir.
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        path: Optional[Path] = None,
+        level: str = INFO,
+        sampling: Optional[Mapping[str, int]] = None,
+    ) -> None:
+        if level not in LOG_LEVELS:
+            raise ValueError(f"Bilinmeyen günlük seviyesi: {level}")
+        self.path = Path(path) if path else None
+        self.threshold = LOG_LEVELS.index(level)
+        self.sampling: Dict[str, int] = {**DEFAULT_SAMPLING, **(sampling or {})}
+        self.counts: Counter[str] = Counter()
+        self.sampled_out = 0
+        self._ring: Deque[LogEvent] = deque(maxlen=capacity)
+        self._seq = 0
+        self._file: Optional[IO[str]] = None
+        self._flushed_at = 0.0
+
+    @property
+    def evicted(self) -> int:
+        """Tampon dolduğu için bellekten düşen olay sayısı."""
+        kept = sum(self.counts.values()) - self.sampled_out
+        return kept - len(self._ring)
+
+    def log(
+        self,
+        level: str,
+        template: str,
+        *args: Any,
+        endpoint: Optional[str] = None,
+        check_id: Optional[str] = None,
+    ) -> None:
+        if LOG_LEVELS.index(level) < self.threshold:
+            return
+        self._seq += 1
+        self._emit(LogEvent(self._seq, level, template, args, endpoint, check_id))
+
+    def debug(self, template: str, *args: Any, **fields: Optional[str]) -> None:
+        self.log(DEBUG, template, *args, **fields)
+
+    def info(self, template: str, *args: Any, **fields: Optional[str]) -> None:
+        self.log(INFO, template, *args, **fields)
+
+    def warning(self, template: str, *args: Any, **fields: Optional[str]) -> None:
+        self.log(WARNING, template, *args, **fields)
+
+    def error(self, template: str, *args: Any, **fields: Optional[str]) -> None:
+        self.log(ERROR, template, *args, **fields)
+
+    def ingest(self, data: Mapping[str, Any]) -> None:
+        """Başka bir süreçte serileştirilmiş olayı (ör. dağıtık işçi) bu günlüğe ekle."""
+        self._seq += 1
+        self._emit(LogEvent.from_dict(self._seq, data))
+
+    def events(self, level: Optional[str] = None) -> List[LogEvent]:
+        if level is None:
+            return list(self._ring)
+        return [event for event in self._ring if event.level == level]
+
+    def events_since(self, seq: int) -> List[LogEvent]:
+        """Tamponda hâlâ duran, `seq` değerinden sonraki olaylar."""
+        return [event for event in self._ring if event.seq > seq]
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def serialize(self, tail: int = DEFAULT_TAIL) -> Dict[str, Any]:
+        recent = list(self._ring)[-tail:] if tail else []
+        return {
+            "file": str(self.path) if self.path else None,
+            "counts": {level: self.counts[level] for level in LOG_LEVELS},
+            "sampled_out": self.sampled_out,
+            "evicted": self.evicted,
+            "tail": [event.serialize() for event in recent],
+        }
+
+    def _emit(self, event: LogEvent) -> None:
+        self.counts[event.level] += 1
+        if self.path is not None:
+            self._write(event)
+        rate = self.sampling.get(event.level, 1)
+        if rate > 1 and self.counts[event.level] % rate != 1:
+            self.sampled_out += 1
+            return
+        self._ring.append(event)
+
+    def _write(self, event: LogEvent) -> None:
+        if self._file is None:
+            assert self.path is not None
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps(event.serialize(), ensure_ascii=False))
+        self._file.write("\n")
+        # Süreç çökse veya öldürülse de son uyarılar dosyada olmalı (`tail -f` için de).
+        now = time.monotonic()
+        if LOG_LEVELS.index(event.level) >= LOG_LEVELS.index(WARNING) or now - self._flushed_at >= FLUSH_INTERVAL:
+            self._file.flush()
+            self._flushed_at = now
@@ -1,104 +1,334 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Iterable, List, Optional
+from contextlib import suppress
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
+import httpx
 from rich.console import Console
 
-from scanner.checks.base import CheckContext, VulnerabilityCheck
+from scanner.checks.base import SLOW_LANE, CheckContext, VulnerabilityCheck
 from scanner.checks.registry import CHECK_REGISTRY, all_checks, iter_checks
+from scanner.core.analysis import AnalysisExecutor, LoopLagMonitor
 from scanner.core.config import Endpoint, ScannerConfig
+from scanner.core.credentials import AccountThrottle, CredentialSource
+from scanner.core.events import FINDING, FINISHED, PROGRESS, STARTED, EventBroadcaster
 from scanner.core.http_client import HttpClient
-from scanner.core.reporting import ScanFinding, ScanReport
+from scanner.core.payloads import PayloadLibrary
+from scanner.core.profiling import ScanProfiler
+from scanner.core.progress import ScanProgress
+from scanner.core.reporting import ScanFinding, ScanReport, severity_at_least
+from scanner.core.request_template import RequestTemplate
+from scanner.core.scan_log import ScanLog
+from scanner.core.scheduler import PriorityScheduler
+from scanner.core.session import SessionManager
+from scanner.core.similarity import SignatureBaselines
+from scanner.core.timing import BaselineCache
+from scanner.passive.base import PassiveAnalyzer
+from scanner.passive.bus import PassiveBus
+from scanner.passive.registry import all_analyzers, iter_analyzers
+
+
+# `Scanner.cancel` nedenleri; raporda `summary.stop_reason` olarak görünür.
+INTERRUPTED = "interrupted"
+FAIL_FAST = "fail_fast"
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    endpoint_index: int
+    check_id: str
 
 
 class Scanner:
-    def __init__(self, config: ScannerConfig, max_concurrency: int, console: Console) -> None:
+    def __init__(
+        self,
+        config: ScannerConfig,
+        max_concurrency: int,
+        console: Console,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        log: Optional[ScanLog] = None,
+        events: Optional[EventBroadcaster] = None,
+        progress_interval: float = 0.5,
+        slow_concurrency: int = 2,
+        time_budget: Optional[float] = None,
+        analysis: Optional[AnalysisExecutor] = None,
+        profiler: Optional[ScanProfiler] = None,
+        fail_fast: Optional[str] = None,
+    ) -> None:
         self.config = config
+        self.events = events
+        self.progress_interval = progress_interval
         self.console = console
         rate_delay = 60 / config.rate_limit_per_minute if config.rate_limit_per_minute else None
         headers = dict(config.iter_headers())
-        self.http_client = HttpClient(config.http, headers, rate_delay=rate_delay)
-        self.semaphore = asyncio.Semaphore(max_concurrency)
-        self.report = ScanReport()
+        self.http_client = HttpClient(config.http, headers, rate_delay=rate_delay, transport=transport)
+        # Dışarıdan verilen yürütücünün havuzu çağıranındır; tarama sonunda kapatılmaz.
+        self._owns_analysis = analysis is None
+        self.analysis = analysis or AnalysisExecutor()
+        self.loop_lag = LoopLagMonitor()
+        self.profiler = profiler
+        # Bu önem derecesinde ya da üstünde ilk bulguda kalan iş iptal edilir.
+        self.fail_fast = fail_fast
+        self.stop_reason: Optional[str] = None
+        self.passive_bus = PassiveBus(
+            self._resolve_analyzers(), analysis=self.analysis, default_checks=config.default_checks or None
+        )
+        self.http_client.passive = self.passive_bus
+        self.max_concurrency = max(1, max_concurrency)
+        self.slow_concurrency = max(1, slow_concurrency)
+        self.time_budget = time_budget
+        self.semaphore = asyncio.Semaphore(self.max_concurrency)
+        self.slow_semaphore = asyncio.Semaphore(self.slow_concurrency)
+        self.baselines = BaselineCache()
+        self.signatures = SignatureBaselines()
+        self.report = ScanReport(log=log)
+        self.log = self.report.log
+        if config.session is not None:
+            self.http_client.session = SessionManager(
+                config.session, str(config.scope.base_url), config.credentials, log=self.log
+            )
+        self.corpora = PayloadLibrary(config.payloads, log=self.log)
+        self.progress = ScanProgress(lambda: self.http_client.request_count)
+        self._base_url = str(config.scope.base_url)
+        self._credentials = CredentialSource(config.credentials, config.credentials_file)
+        self._account_throttle = AccountThrottle(config.credential_testing.per_account_interval)
+        self._contexts: Dict[int, CheckContext] = {}
+        self._checks: Dict[str, VulnerabilityCheck] = {}
+        self._workers: List["asyncio.Task[None]"] = []
+        self._interrupted_units = 0
 
     async def scan(self) -> ScanReport:
         self.console.print(f"[bold]Tarama başlıyor:[/bold] {self.config.name}")
-        tasks = [asyncio.create_task(self._scan_endpoint(endpoint)) for endpoint in self._iter_endpoints()]
-        if tasks:
-            await asyncio.gather(*tasks)
-        else:
-            self.report.add_log("Tarama yapılacak endpoint bulunamadı.")
+        self.loop_lag.start()
+        endpoints = self._iter_endpoints()
+        scheduler = self._plan(endpoints)
+        self.progress.add_units(scheduler.planned)
+        self._publish(
+            STARTED,
+            {"name": self.config.name, "endpoints": len(endpoints), "units": scheduler.planned},
+        )
+        ticker = asyncio.create_task(self._publish_progress()) if self.events is not None else None
+        workers = self._workers = [
+            asyncio.create_task(self._lane_worker(scheduler, lane))
+            for lane in scheduler.lanes
+            for _ in range(self._lane_size(lane))
+        ]
+        try:
+            if workers:
+                # `cancel` ile iptal edilen işçiler CancelledError döner; tarama kısmi raporla sürer.
+                for result in await asyncio.gather(*workers, return_exceptions=True):
+                    if isinstance(result, Exception):
+                        raise result
+            else:
+                self.log.warning("Tarama yapılacak endpoint bulunamadı.")
+        except asyncio.CancelledError:
+            # `scan` görevinin kendisi dışarıdan iptal edildi; bağlantı havuzu yine de kapatılır.
+            await self.http_client.close()
+            raise
+        finally:
+            if ticker is not None:
+                ticker.cancel()
+                with suppress(asyncio.CancelledError):
+                    await ticker
+        self._record_coverage(scheduler)
+        return await self.finish()
+
+    def cancel(self, reason: str = INTERRUPTED) -> bool:
+        """Süren ve bekleyen tüm birimleri iptal et; `scan` tamamlananlarla kısmi rapor döndürür.
+
+        Sinyal işleyicisinden ya da `--fail-fast` eşiğindeki bulguda çağrılır.
+        Yalnızca ilk çağrı etkilidir; iptal başladıysa `True` döner.
+        """
+        if self.stop_reason is not None or all(task.done() for task in self._workers):
+            return False
+        self.stop_reason = reason
+        self.log.warning("tarama iptal ediliyor (%s).", reason)
+        for task in self._workers:
+            task.cancel()
+        return True
+
+    def work_units(self) -> List[WorkUnit]:
+        """Taramayı öncelik sırasıyla endpoint × kontrol birimlerine böl (dağıtık mod için)."""
+        scheduler = self._plan(self._iter_endpoints())
+        return [WorkUnit(unit.endpoint_index, unit.check.check_id) for unit in scheduler.pending()]
+
+    async def run_unit(self, unit: WorkUnit) -> Optional[ScanFinding]:
+        endpoint = self.config.scope.endpoints[unit.endpoint_index]
+        check = self._checks.get(unit.check_id)
+        if check is None:
+            check_cls = CHECK_REGISTRY.get(unit.check_id)
+            if check_cls is None:
+                self.log.error("bilinmeyen kontrol %s.", unit.check_id, endpoint=endpoint.identifier)
+                return None
+            check = self._checks.setdefault(unit.check_id, check_cls())
+        self.loop_lag.start()
+        async with self._lane_semaphore(check):
+            return await self._run_check(endpoint, check, self._context_for(unit.endpoint_index))
+
+    async def finish(self) -> ScanReport:
+        """Pasif analizi tamamla, özeti kapat ve istemciyi serbest bırak."""
+        for finding in await self.passive_bus.drain():
+            self._add_finding(finding)
+        if self.passive_bus.dropped:
+            self.log.warning("Pasif analiz kuyruğu doldu, %d yanıt incelenmedi.", self.passive_bus.dropped)
         self.report.summary.total_requests = self.http_client.request_count
+        self.report.summary.stop_reason = self.stop_reason
+        await self.loop_lag.stop()
+        self.report.summary.retries = self.http_client.retry.stats()
+        self.report.summary.analysis = {**self.analysis.stats(), "loop_lag": self.loop_lag.snapshot()}
+        if self.profiler is not None:
+            self.report.profile = self.profiler.serialize()
         self.report.summary.finalize()
         await self.http_client.close()
+        self.corpora.save()
+        self.corpora.close()
+        if self._owns_analysis:
+            self.analysis.shutdown()
+        self.log.close()
+        self._publish(PROGRESS, self.progress.snapshot())
+        self._publish(FINISHED, {"summary": self.report.summary.serialize(), "findings_count": len(self.report.findings)})
         return self.report
 
-    def _iter_endpoints(self) -> Iterable[Endpoint]:
+    def _iter_endpoints(self) -> List[Endpoint]:
         endpoints = self.config.scope.endpoints
         if not endpoints:
-            self.report.add_log("Konfigürasyonda endpoint tanımı yok.")
+            self.log.warning("Konfigürasyonda endpoint tanımı yok.")
         return endpoints
 
-    async def _scan_endpoint(self, endpoint: Endpoint) -> None:
-        request_kwargs = self._build_request_kwargs(endpoint)
-        checks = self._resolve_checks(endpoint)
-        if not checks:
-            self.report.add_log(f"{endpoint.identifier}: etkin kontrol yok.")
-            return
+    def _plan(self, endpoints: List[Endpoint]) -> PriorityScheduler:
+        scheduler = PriorityScheduler(self.time_budget)
+        for index, endpoint in enumerate(endpoints):
+            checks = self._resolve_checks(endpoint)
+            if not checks:
+                self.log.warning("etkin kontrol yok.", endpoint=endpoint.identifier)
+            for check in checks:
+                scheduler.push(index, endpoint, check)
+        return scheduler
 
-        for check in checks:
-            async with self.semaphore:
-                finding = await self._run_check(endpoint, check, request_kwargs)
-                if finding:
-                    self.report.add_finding(finding)
+    async def _lane_worker(self, scheduler: PriorityScheduler, lane: str) -> None:
+        # Bütçe dolunca yeni birim alınmaz; elindeki birimi bitiren işçi çıkar.
+        while (unit := scheduler.pop(lane)) is not None:
+            finding = await self._run_check(unit.endpoint, unit.check, self._context_for(unit.endpoint_index))
+            if finding:
+                self._add_finding(finding)
 
-    async def _run_check(
-        self,
-        endpoint: Endpoint,
-        check: VulnerabilityCheck,
-        request_kwargs: dict,
-    ) -> Optional[ScanFinding]:
-        context = CheckContext(
-            base_url=str(self.config.scope.base_url),
+    def _lane_size(self, lane: str) -> int:
+        return self.slow_concurrency if lane == SLOW_LANE else self.max_concurrency
+
+    def _record_coverage(self, scheduler: PriorityScheduler) -> None:
+        skipped = scheduler.pending()
+        self.report.skipped = [unit.describe() for unit in skipped]
+        completed = scheduler.started - self._interrupted_units
+        self.report.summary.coverage = {
+            "planned": scheduler.planned,
+            "completed": completed,
+            "skipped": len(skipped),
+            "ratio": round(completed / scheduler.planned, 4) if scheduler.planned else 1.0,
+            "time_budget": self.time_budget,
+        }
+        if self.stop_reason is not None:
+            self.report.summary.coverage["interrupted"] = self._interrupted_units
+            self.log.warning(
+                "Tarama kesildi (%s); %d birim yarıda kaldı, %d birim başlamadı.",
+                self.stop_reason,
+                self._interrupted_units,
+                len(skipped),
+            )
+        elif skipped:
+            self.log.warning(
+                "Zaman bütçesi (%s sn) doldu; %d birim atlandı.", self.time_budget, len(skipped)
+            )
+
+    def _lane_semaphore(self, check: VulnerabilityCheck) -> asyncio.Semaphore:
+        return self.slow_semaphore if check.lane == SLOW_LANE else self.semaphore
+
+    def _context_for(self, index: int) -> CheckContext:
+        # Şablon ve metadata endpoint başına bir kez kurulur; kontroller salt okunur paylaşır.
+        context = self._contexts.get(index)
+        if context is None:
+            context = self._contexts[index] = self._build_context(self.config.scope.endpoints[index])
+        return context
+
+    def _build_context(self, endpoint: Endpoint) -> CheckContext:
+        template = RequestTemplate.from_endpoint(self._base_url, endpoint, self.config.iter_headers())
+        # Pasif analizörler de endpoint'in kontrol listesine uyar; `passive_checks` genel anahtardır.
+        self.passive_bus.scope(endpoint.method, template.url, self._check_ids(endpoint))
+        return CheckContext(
+            base_url=self._base_url,
             endpoint=endpoint.path,
             method=endpoint.method,
-            request_kwargs=request_kwargs,
+            template=template,
             metadata={
                 "endpoint_name": endpoint.name,
-                "credentials": [cred.model_dump() for cred in self.config.credentials],
+                "credentials": self._credentials,
+                "credential_testing": self.config.credential_testing,
+                "account_throttle": self._account_throttle,
             },
             http_client=self.http_client,
+            baselines=self.baselines,
+            analysis=self.analysis,
+            log=self.log,
+            signatures=self.signatures,
+            corpora=self.corpora,
         )
 
+    async def _run_check(
+        self,
+        endpoint: Endpoint,
+        check: VulnerabilityCheck,
+        context: CheckContext,
+    ) -> Optional[ScanFinding]:
         try:
-            result = await check.execute(context)
-            if result:
-                self.report.add_log(f"{endpoint.identifier} -> {check.check_id} bulgu üretti.")
-            return result
+            if self.profiler is None:
+                result = await check.execute(context)
+            else:
+                with self.profiler.unit(check.check_id, endpoint.identifier):
+                    result = await check.execute(context)
+        except asyncio.CancelledError:
+            self._interrupted_units += 1
+            raise
         except Exception as exc:  # noqa: BLE001
-            self.report.add_log(f"{endpoint.identifier} -> {check.check_id} hata: {exc}")
+            self.log.error("hata: %s", exc, endpoint=endpoint.identifier, check_id=check.check_id)
+            self.progress.unit_done(error=True)
             return None
+        if result:
+            if result.target is None:
+                result.target = f"{context.method} {context.url}"
+            self.log.info("bulgu üretti.", endpoint=endpoint.identifier, check_id=check.check_id)
+        else:
+            self.log.debug("bulgu yok.", endpoint=endpoint.identifier, check_id=check.check_id)
+        self.progress.unit_done(result)
+        return result
+
+    def _add_finding(self, finding: ScanFinding) -> None:
+        if self.report.add_finding(finding):
+            self._publish(FINDING, finding.serialize())
+            if self.fail_fast is not None and severity_at_least(finding.severity, self.fail_fast):
+                self.cancel(FAIL_FAST)
+
+    def _publish(self, kind: str, data: Dict[str, Any]) -> None:
+        if self.events is not None:
+            self.events.publish(kind, data)
+
+    async def _publish_progress(self) -> None:
+        # Olay başına değil sabit aralıkla; dinleyici sayısı taramayı yavaşlatmaz.
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            self._publish(PROGRESS, self.progress.snapshot())
+
+    def _resolve_analyzers(self) -> List[PassiveAnalyzer]:
+        if self.config.passive_checks is None:
+            return all_analyzers()
+        return iter_analyzers(self.config.passive_checks)
+
+    def _check_ids(self, endpoint: Endpoint) -> Optional[List[str]]:
+        """Endpoint'te etkin kontrol kimlikleri; `None` tümü demektir."""
+        return endpoint.enabled_checks or self.config.default_checks or None
 
     def _resolve_checks(self, endpoint: Endpoint) -> List[VulnerabilityCheck]:
-        if endpoint.enabled_checks:
-            return iter_checks(endpoint.enabled_checks)
-        if self.config.default_checks:
-            return iter_checks(self.config.default_checks)
-        return all_checks()
-
-    def _build_request_kwargs(self, endpoint: Endpoint) -> dict:
-        headers = dict(self.config.iter_headers())
-        for header in endpoint.headers:
-            headers[header.name] = header.value
-
-        kwargs: dict = {"headers": headers}
-        if endpoint.query:
-            kwargs["params"] = dict(endpoint.query)
-        if endpoint.json:
-            kwargs["json"] = dict(endpoint.json)
-        if endpoint.data:
-            kwargs["data"] = dict(endpoint.data)
-        return kwargs
+        check_ids = self._check_ids(endpoint)
+        return all_checks() if check_ids is None else iter_checks(check_ids)
 
 
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
+
+from scanner.core.config import Endpoint
+from scanner.core.reporting import SEVERITY_ORDER
+
+if TYPE_CHECKING:
+    from scanner.checks.base import VulnerabilityCheck
+
+
+# `risk_override` verilmemiş endpoint'ler ölçeğin ortasından başlar (0-10).
+DEFAULT_RISK = 5
+
+
+def unit_priority(endpoint: Endpoint, check: "VulnerabilityCheck") -> float:
+    """Endpoint riski × kontrol önem derecesi × kontrol ağırlığı; büyük olan önce çalışır."""
+    risk = endpoint.risk_override if endpoint.risk_override is not None else DEFAULT_RISK
+    severity = SEVERITY_ORDER.index(check.severity) + 1 if check.severity in SEVERITY_ORDER else 1
+    # risk 0 bile olsa birim sıralamada kalsın; yalnızca en sona düşer.
+    return (risk + 0.5) * severity * max(check.weight, 0)
+
+
+@dataclass(order=True)
+class ScheduledUnit:
+    sort_key: tuple = field(init=False, repr=False)
+    priority: float = field(compare=False)
+    seq: int = field(compare=False)
+    endpoint_index: int = field(compare=False)
+    endpoint: Endpoint = field(compare=False, repr=False)
+    check: "VulnerabilityCheck" = field(compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Eşit öncelikte YAML sırası korunur.
+        self.sort_key = (-self.priority, self.seq)
+
+    @property
+    def lane(self) -> str:
+        return self.check.lane
+
+    def describe(self) -> Dict[str, object]:
+        return {
+            "endpoint": self.endpoint.identifier,
+            "check_id": self.check.check_id,
+            "priority": round(self.priority, 2),
+        }
+
+
+class PriorityScheduler:
+    """Şerit başına öncelik yığını ve isteğe bağlı zaman bütçesi.
+
+    Bütçe dolduğunda `pop` yeni iş vermez; yığında kalan birimler
+    atlanmış olarak raporlanır. Hâlihazırda çalışan birimler kesilmez.
+    """
+
+    def __init__(
+        self,
+        time_budget: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._clock = clock
+        self._deadline = clock() + time_budget if time_budget is not None else None
+        self._heaps: Dict[str, List[ScheduledUnit]] = {}
+        self._seq = itertools.count()
+        self.planned = 0
+        self.started = 0
+
+    def push(self, endpoint_index: int, endpoint: Endpoint, check: "VulnerabilityCheck") -> ScheduledUnit:
+        unit = ScheduledUnit(
+            priority=unit_priority(endpoint, check),
+            seq=next(self._seq),
+            endpoint_index=endpoint_index,
+            endpoint=endpoint,
+            check=check,
+        )
+        heapq.heappush(self._heaps.setdefault(check.lane, []), unit)
+        self.planned += 1
+        return unit
+
+    @property
+    def lanes(self) -> List[str]:
+        return list(self._heaps)
+
+    @property
+    def expired(self) -> bool:
+        return self._deadline is not None and self._clock() >= self._deadline
+
+    @property
+    def remaining(self) -> Optional[float]:
+        return None if self._deadline is None else max(0.0, self._deadline - self._clock())
+
+    def pop(self, lane: str) -> Optional[ScheduledUnit]:
+        heap = self._heaps.get(lane)
+        if not heap or self.expired:
+            return None
+        self.started += 1
+        return heapq.heappop(heap)
+
+    def pending(self) -> List[ScheduledUnit]:
+        """Henüz başlatılmamış birimler, öncelik sırasıyla (bütçe sonunda: atlananlar)."""
+        return sorted(itertools.chain.from_iterable(self._heaps.values()))
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Sequence, Tuple
+
+import httpx
+
+from scanner.core.config import AuthCredential, SessionSettings
+from scanner.core.response import ScanResponse
+from scanner.core.scan_log import ScanLog
+
+if TYPE_CHECKING:
+    from scanner.core.http_client import HttpClient
+
+
+def _fill(value: Any, replacements: Dict[str, str]) -> Any:
+    """Gövde şablonundaki `{username}`/`{password}` yer tutucularını doldur (iç içe yapılarda da)."""
+    if isinstance(value, str):
+        for placeholder, replacement in replacements.items():
+            value = value.replace(placeholder, replacement)
+        return value
+    if isinstance(value, dict):
+        return {key: _fill(item, replacements) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fill(item, replacements) for item in value]
+    return value
+
+
+def _dig(data: Any, path: str) -> Any:
+    for part in path.split("."):
+        if isinstance(data, dict):
+            data = data.get(part)
+        elif isinstance(data, list) and part.isdigit() and int(part) < len(data):
+            data = data[int(part)]
+        else:
+            return None
+    return data
+
+
+class SessionManager:
+    """Taramada tek oturum: bir kez oturum açar, token'ı tüm isteklere ekler.
+
+    Çerezler `HttpClient`'in paylaşılan çerez kavanozunda tutulur; token
+    `header_template` ile başlık olarak eklenir. 401 gibi yanıtlarda yenileme
+    tek seferliktir (single-flight): eski oturumla dönen tüm istekler aynı
+    yenilemeyi bekler. Oturum açma denemeleri arasında en az
+    `min_refresh_interval` saniye bırakılır; giriş uç noktasının kendisine
+    giden istekler (ör. kimlik bilgisi denemeleri) yenileme tetiklemez.
+    """
+
+    def __init__(
+        self,
+        settings: SessionSettings,
+        base_url: str,
+        credentials: Sequence[AuthCredential] = (),
+        log: Optional[ScanLog] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = settings
+        self.login_url = f"{base_url.rstrip('/')}{settings.login_path}"
+        self.log = log if log is not None else ScanLog()
+        self.generation = 0
+        self.attempts = 0
+        self.headers: Dict[str, str] = {}
+        self._username, self._password = self._resolve_credentials(credentials)
+        self._clock = clock
+        self._last_attempt: Optional[float] = None
+        self._lock = asyncio.Lock()
+
+    def _resolve_credentials(self, credentials: Sequence[AuthCredential]) -> Tuple[str, str]:
+        settings = self.settings
+        fallback = credentials[0] if credentials else None
+        username = settings.username or (fallback.username if fallback else "")
+        password = settings.password
+        if password is None and settings.password_env:
+            password = os.environ.get(settings.password_env)
+        if password is None and fallback is not None:
+            password = fallback.password
+        return username, password or ""
+
+    def is_login_request(self, url: str) -> bool:
+        return url.split("?", 1)[0].split("#", 1)[0] == self.login_url
+
+    def apply(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """İstek argümanlarına oturum başlıklarını ekle; oturum başlığı yapılandırmadakini ezer."""
+        if not self.headers:
+            return kwargs
+        return {**kwargs, "headers": {**(kwargs.get("headers") or {}), **self.headers}}
+
+    def expired(self, response: httpx.Response) -> bool:
+        return response.status_code in self.settings.refresh_statuses
+
+    async def ensure(self, http_client: "HttpClient") -> int:
+        """Gerekirse ilk oturumu aç; isteğin gönderildiği oturum kuşağını döndür."""
+        if self.generation == 0 and self._may_attempt():
+            await self.refresh(http_client, 0)
+        return self.generation
+
+    async def refresh(self, http_client: "HttpClient", seen_generation: int) -> bool:
+        """`seen_generation` hâlâ güncelse yeniden oturum aç. Yeni oturum varsa `True`."""
+        async with self._lock:
+            if self.generation != seen_generation:
+                return True  # Başka bir istek oturumu zaten yeniledi.
+            if not self._may_attempt():
+                return False
+            self._last_attempt = self._clock()
+            await self._login(http_client)
+            return self.generation != seen_generation
+
+    def _may_attempt(self) -> bool:
+        return (
+            self._last_attempt is None
+            or self._clock() - self._last_attempt >= self.settings.min_refresh_interval
+        )
+
+    async def _login(self, http_client: "HttpClient") -> None:
+        settings = self.settings
+        replacements = {"{username}": self._username, "{password}": self._password}
+        kwargs: Dict[str, Any] = {}
+        if settings.login_json:
+            kwargs["json"] = _fill(settings.login_json, replacements)
+        if settings.login_data:
+            kwargs["data"] = _fill(settings.login_data, replacements)
+
+        self.attempts += 1
+        try:
+            response = await http_client.request(settings.login_method, self.login_url, **kwargs)
+        except httpx.HTTPStatusError as exc:
+            self.log.error("oturum açılamadı: HTTP %d.", exc.response.status_code, endpoint=self._identifier)
+            return
+        except httpx.RequestError as exc:
+            self.log.error("oturum açılamadı: %s", exc, endpoint=self._identifier)
+            return
+
+        token = self._extract_token(response)
+        if token is None and (settings.token_json or settings.token_header or settings.token_cookie):
+            self.log.error("oturum yanıtında token bulunamadı.", endpoint=self._identifier)
+            return
+        self.headers = {settings.header_name: settings.header_template.format(token=token)} if token else {}
+        self.generation += 1
+        self.log.info("oturum açıldı (%d. oturum).", self.generation, endpoint=self._identifier)
+
+    def _extract_token(self, response: ScanResponse) -> Optional[str]:
+        settings = self.settings
+        token: Any = None
+        if settings.token_json:
+            token = _dig(response.json(), settings.token_json)
+        elif settings.token_header:
+            token = response.header(settings.token_header)
+        elif settings.token_cookie:
+            token = response.raw.cookies.get(settings.token_cookie)
+        return str(token) if token not in (None, "") else None
+
+    @property
+    def _identifier(self) -> str:
+        return f"{self.settings.login_method} {self.settings.login_path}"
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import re
+import zlib
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Awaitable, Callable, Dict, Optional, Tuple
+
+import httpx
+
+from scanner.core.response import ScanResponse
+
+if TYPE_CHECKING:
+    from scanner.core.analysis import AnalysisExecutor
+
+
+# Sketch boyutu karşılaştırma maliyetini sabitler; Jaccard tahmininin hatası ~1/sqrt(k).
+DEFAULT_SKETCH_SIZE = 64
+DEFAULT_MARGIN = 0.1
+_TOKEN_PATTERN = re.compile(r"\w{2,}")
+
+
+def minhash_sketch(text: str, size: int = DEFAULT_SKETCH_SIZE) -> Tuple[int, ...]:
+    """Gövdedeki tekil kelimelerin en küçük `size` özeti (bottom-k MinHash).
+
+    Yalnızca metin alır ve modül düzeyindedir; büyük gövdelerde analiz
+    havuzunda hesaplanabilir.
+    """
+    tokens = set(_TOKEN_PATTERN.findall(text.casefold()))
+    return tuple(sorted(heapq.nsmallest(size, {zlib.crc32(token.encode("utf-8")) for token in tokens})))
+
+
+@dataclass(frozen=True)
+class ResponseSignature:
+    """Yanıtın sabit boyutlu özeti: durum kodu, gövde uzunluğu ve kelime sketch'i."""
+
+    status: int
+    length: int
+    sketch: Tuple[int, ...]
+
+    def similarity(self, other: "ResponseSignature") -> float:
+        """İki gövdenin kelime kümelerinin tahmini Jaccard benzerliği (0-1), sabit sürede."""
+        if not self.sketch and not other.sketch:
+            return 1.0
+        ours, theirs = set(self.sketch), set(other.sketch)
+        union = heapq.nsmallest(max(len(ours), len(theirs)), ours | theirs)
+        shared = sum(1 for value in union if value in ours and value in theirs)
+        return shared / len(union)
+
+    def length_ratio(self, other: "ResponseSignature") -> float:
+        longest = max(self.length, other.length)
+        return min(self.length, other.length) / longest if longest else 1.0
+
+    def matches(self, other: "ResponseSignature", threshold: float = 0.9, length_tolerance: float = 0.1) -> bool:
+        return (
+            self.status == other.status
+            and self.length_ratio(other) >= 1 - length_tolerance
+            and self.similarity(other) >= threshold
+        )
+
+
+def signature(response: ScanResponse) -> ResponseSignature:
+    """Yanıt başına bir kez hesaplanan imza (yanıt memo'sunda saklanır)."""
+    return response.memo(
+        "signature",
+        lambda: ResponseSignature(
+            status=response.status_code,
+            length=len(response.content),
+            sketch=response.memo("minhash", lambda: minhash_sketch(response.text)),
+        ),
+    )
+
+
+async def signature_async(response: ScanResponse, analysis: "AnalysisExecutor") -> ResponseSignature:
+    """`signature` ile aynı; büyük gövdelerin sketch'i analiz havuzunda çıkarılır."""
+    if not response.has_memo("signature"):
+        await analysis.memo(response, "minhash", minhash_sketch)
+    return signature(response)
+
+
+@dataclass(frozen=True)
+class ResponseBaseline:
+    """Endpoint'in değiştirilmemiş isteğe verdiği yanıtın imzası ve doğal değişkenliği.
+
+    Taban iki kez alınır; dinamik sayfalarda (zaman damgası, CSRF token'ı)
+    iki örnek arasındaki benzerlik `stability` olarak saklanır ve problar bu
+    değere göre değerlendirilir.
+    """
+
+    signature: ResponseSignature
+    stability: float
+
+    def differs(self, probe: ResponseSignature, margin: float = DEFAULT_MARGIN) -> bool:
+        """Prob yanıtı, tabanın kendi değişkenliğinin ötesinde farklı mı?"""
+        if probe.status != self.signature.status:
+            return True
+        return probe.similarity(self.signature) < self.stability - margin
+
+
+async def fetch_response(send: Callable[[], Awaitable[ScanResponse]]) -> ScanResponse:
+    """Hata durum kodları da taban olabilir; `HTTPStatusError` yanıtını döndür."""
+    try:
+        return await send()
+    except httpx.HTTPStatusError as exc:
+        return ScanResponse.of(exc.response)
+
+
+class SignatureBaselines:
+    """Endpoint başına yanıt tabanı; ölçüm tek seferlik (single-flight) yapılır.
+
+    `timing.BaselineCache` ile aynı sözleşme: eşzamanlı çağıranlar tek ölçümü
+    bekler, başarısız ölçüm saklanmaz.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, "asyncio.Task[ResponseBaseline]"] = {}
+
+    def cached(self, key: str) -> Optional[ResponseBaseline]:
+        task = self._tasks.get(key)
+        if task is None or not task.done() or task.cancelled() or task.exception() is not None:
+            return None
+        return task.result()
+
+    async def get(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[ScanResponse]],
+        analysis: Optional["AnalysisExecutor"] = None,
+    ) -> ResponseBaseline:
+        task = self._tasks.get(key)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._tasks[key] = asyncio.ensure_future(self._measure(send, analysis))
+        return await asyncio.shield(task)
+
+    async def _measure(
+        self,
+        send: Callable[[], Awaitable[ScanResponse]],
+        analysis: Optional["AnalysisExecutor"],
+    ) -> ResponseBaseline:
+        samples = []
+        for _ in range(2):
+            response = await fetch_response(send)
+            samples.append(signature(response) if analysis is None else await signature_async(response, analysis))
+        first, second = samples
+        stability = first.similarity(second) if first.status == second.status else 0.0
+        return ResponseBaseline(signature=first, stability=stability)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Mapping, Optional, Tuple
+
+import httpx
+
+from scanner.core.replay import RECORDED_ELAPSED_EXTENSION
+from scanner.core.response import ScanResponse
+
+if TYPE_CHECKING:
+    from scanner.core.http_client import HttpClient
+
+
+DEFAULT_BASELINE_SAMPLES = 5
+
+
+@dataclass(frozen=True)
+class TimedResponse:
+    elapsed: float
+    response: Optional[ScanResponse] = None
+    timed_out: bool = False
+
+
+@dataclass(frozen=True)
+class LatencyBaseline:
+    """Bir endpoint'in normal yanıt süresi örnekleri (saniye)."""
+
+    samples: Tuple[float, ...]
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def upper(self) -> float:
+        return max(self.samples)
+
+    def is_delayed(self, elapsed: float, delay: float, tolerance: float = 0.8) -> bool:
+        """Gözlenen süre hem medyanı beklenen gecikmeyle hem de en yavaş örneği aşıyor mu?"""
+        return elapsed >= self.median + delay * tolerance and elapsed >= self.upper + delay / 2
+
+    def timeout_for(self, delay: float, ceiling: float) -> float:
+        """Gecikmeli yanıtı kesmeden bekleyecek kadar uzun, ama sınırlı bir zaman aşımı."""
+        return min(max(self.upper + delay * 2, delay + 1.0), ceiling)
+
+
+async def timed_request(http_client: "HttpClient", request: Mapping[str, Any], **options: Any) -> TimedResponse:
+    """İsteği tekrar denemeden gönder ve ağ süresini ölç.
+
+    Süre mümkünse `httpx.Response.elapsed`'ten alınır; böylece hız sınırı
+    beklemesi ölçüme karışmaz. Kayıt/replay transport'ları kaydedilen süreyi
+    yanıta ekler; replay'de zamanlama probları kayıttaki sonucu birebir verir.
+    Zaman aşımında duvar saati kullanılır.
+    """
+    started = time.perf_counter()
+    try:
+        response = await http_client.request(**request, retry=False, **options)
+    except httpx.HTTPStatusError as exc:
+        response = ScanResponse.of(exc.response)
+    except httpx.TimeoutException:
+        return TimedResponse(elapsed=time.perf_counter() - started, timed_out=True)
+    wall_clock = time.perf_counter() - started
+    recorded = response.raw.extensions.get(RECORDED_ELAPSED_EXTENSION)
+    if recorded is not None:
+        return TimedResponse(elapsed=recorded, response=response)
+    try:
+        elapsed = response.raw.elapsed.total_seconds()
+    except RuntimeError:  # akışı transport'a bağlanmamış yanıtlar (ör. MockTransport)
+        elapsed = wall_clock
+    return TimedResponse(elapsed=elapsed, response=response)
+
+
+class BaselineCache:
+    """Endpoint başına gecikme tabanı; ölçüm tek seferlik (single-flight) yapılır.
+
+    Aynı endpoint için eşzamanlı gelen istekler tek bir ölçümü bekler. Ölçüm
+    hata verirse sonuç saklanmaz ve bir sonraki çağıran yeniden dener.
+    """
+
+    def __init__(self, samples: int = DEFAULT_BASELINE_SAMPLES) -> None:
+        self.samples = max(1, samples)
+        self._tasks: Dict[str, "asyncio.Task[LatencyBaseline]"] = {}
+
+    async def get(self, key: str, sample: Callable[[], Awaitable[float]]) -> LatencyBaseline:
+        task = self._tasks.get(key)
+        if task is None or (task.done() and (task.cancelled() or task.exception() is not None)):
+            task = self._tasks[key] = asyncio.ensure_future(self._measure(sample))
+        # Bekleyen bir çağıranın iptali ortak ölçümü iptal etmesin.
+        return await asyncio.shield(task)
+
+    async def _measure(self, sample: Callable[[], Awaitable[float]]) -> LatencyBaseline:
+        # Örnekler sırayla alınır; paralel ölçüm sunucuyu yükleyip tabanı şişirir.
+        return LatencyBaseline(tuple([await sample() for _ in range(self.samples)]))
@@ -0,0 +1,5 @@
+from scanner.distributed.coordinator import Coordinator
+from scanner.distributed.queue import WorkQueue
+from scanner.distributed.worker import Worker
+
+__all__ = ["Coordinator", "Worker", "WorkQueue"]
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import hmac
+import ipaddress
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Tuple
+
+from rich.console import Console
+
+from scanner.core.config import ScannerConfig
+from scanner.core.reporting import ScanFinding, ScanReport
+from scanner.core.scan_log import ScanLog
+from scanner.core.scanner import Scanner
+from scanner.distributed.protocol import STREAM_LIMIT, ProtocolError, read_message, send_message
+from scanner.distributed.queue import FAILED, WorkQueue
+
+
+# Pasif bulgular bir birime ait değildir; kuyrukta bu kimlikle saklanır.
+PASSIVE_UNIT_ID = -1
+
+
+def is_loopback(host: str) -> bool:
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class Coordinator:
+    """Taramayı endpoint × kontrol birimlerine bölüp TCP üzerinden işçilere dağıtır.
+
+    `hello` yanıtı yapılandırmanın tamamını (başlıklar, kimlik bilgileri,
+    oturum parolası) taşır. Bu yüzden işçiler `token` ile kimlik doğrular;
+    token olmadan yalnızca loopback adresine bağlanılabilir.
+    """
+
+    def __init__(
+        self,
+        config: ScannerConfig,
+        queue_path: Path,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        lease_seconds: float = 30.0,
+        console: Optional[Console] = None,
+        log: Optional[ScanLog] = None,
+        token: Optional[str] = None,
+    ) -> None:
+        if not token and not is_loopback(host):
+            raise ValueError(f"{host} loopback değil; işçilerin kimlik doğrulaması için token gerekli.")
+        self.config = config
+        self.queue = WorkQueue(queue_path)
+        self.host = host
+        self.port = port
+        self.lease_seconds = lease_seconds
+        self.token = token
+        self.console = console or Console(quiet=True)
+        self.address: Optional[Tuple[str, int]] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[str] = set()
+        self._changed = asyncio.Event()
+        self.log = log if log is not None else ScanLog()
+
+    async def start(self) -> Tuple[str, int]:
+        if not self.queue.is_initialized():
+            planner = Scanner(self.config, max_concurrency=1, console=self.console)
+            count = self.queue.enqueue(planner.work_units())
+            self.queue.set_meta("started_at", datetime.now(timezone.utc).isoformat())
+            self.console.print(f"[bold]Kuyruğa {count} iş birimi eklendi.[/bold]")
+        else:
+            self.console.print(f"[bold]Mevcut kuyruktan devam ediliyor:[/bold] {self.queue.counts()}")
+
+        self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=STREAM_LIMIT)
+        sockname = self._server.sockets[0].getsockname()
+        self.address = (sockname[0], sockname[1])
+        return self.address
+
+    async def wait(self) -> ScanReport:
+        """Tüm birimler bitip bağlı işçiler ayrılana kadar bekle ve raporu birleştir."""
+        assert self._server is not None, "Önce start() çağrılmalı."
+        try:
+            while not (self.queue.finished() and not self._connections):
+                self._changed.clear()
+                try:
+                    await asyncio.wait_for(self._changed.wait(), timeout=max(self.lease_seconds / 4, 0.1))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            self._server.close()
+            await self._server.wait_closed()
+        report = self._assemble_report()
+        self.queue.close()
+        return report
+
+    async def run(self) -> ScanReport:
+        host, port = await self.start()
+        self.console.print(f"[bold]Koordinatör dinliyor:[/bold] {host}:{port}")
+        return await self.wait()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        worker: Optional[str] = None
+        try:
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    break
+                if message.get("op") == "hello":
+                    if not self._authenticate(message):
+                        self.log.warning("Geçersiz token ile bağlanma denemesi: %s", message.get("worker"))
+                        await send_message(writer, {"ok": False, "error": "Geçersiz token."})
+                        break
+                    worker = str(message["worker"])
+                    self._connections.add(worker)
+                if worker is None:
+                    raise ProtocolError("İlk mesaj 'hello' olmalı.")
+                reply = self._dispatch(worker, message)
+                await send_message(writer, reply)
+                if message.get("op") == "bye":
+                    break
+        except (ConnectionError, ProtocolError, asyncio.IncompleteReadError) as exc:
+            self.log.error("İşçi bağlantısı koptu (%s): %s", worker, exc)
+        finally:
+            if worker is not None:
+                self._connections.discard(worker)
+                self.queue.release(worker)
+            writer.close()
+            self._changed.set()
+
+    def _authenticate(self, message: Dict[str, Any]) -> bool:
+        if not self.token:
+            return True
+        return hmac.compare_digest(str(message.get("token") or ""), self.token)
+
+    def _dispatch(self, worker: str, message: Dict[str, Any]) -> Dict[str, Any]:
+        op = message.get("op")
+        if op == "hello":
+            return {
+                "ok": True,
+                "config": self.config.model_dump(mode="json"),
+                "lease_seconds": self.lease_seconds,
+            }
+        if op == "lease":
+            lease = self.queue.lease(worker, self.lease_seconds)
+            if lease is None:
+                return {"unit": None, "done": self.queue.finished(), "retry_after": min(1.0, self.lease_seconds / 4)}
+            return {
+                "unit": {
+                    "id": lease.unit_id,
+                    "endpoint_index": lease.unit.endpoint_index,
+                    "check_id": lease.unit.check_id,
+                    "attempt": lease.attempt,
+                }
+            }
+        if op == "heartbeat":
+            return {"ok": True, "renewed": self.queue.renew(worker, self.lease_seconds)}
+        if op == "complete":
+            accepted = self.queue.complete(int(message["unit_id"]), worker, message.get("findings", []))
+            if accepted:
+                self._record_progress(message)
+            self._changed.set()
+            return {"ok": accepted}
+        if op == "passive":
+            self.queue.add_findings(PASSIVE_UNIT_ID, message.get("findings", []))
+            self._record_progress(message)
+            return {"ok": True}
+        if op == "bye":
+            return {"ok": True}
+        raise ProtocolError(f"Bilinmeyen işlem: {op}")
+
+    def _record_progress(self, message: Dict[str, Any]) -> None:
+        requests = int(message.get("requests", 0))
+        if requests:
+            total = int(self.queue.get_meta("total_requests") or 0)
+            self.queue.set_meta("total_requests", str(total + requests))
+        for event in message.get("logs", []):
+            self.log.ingest(event)
+
+    def _assemble_report(self) -> ScanReport:
+        report = ScanReport(log=self.log)
+        started_at = self.queue.get_meta("started_at")
+        if started_at:
+            report.summary.start_time = datetime.fromisoformat(started_at)
+
+        passive_seen: Set[Tuple[str, str]] = set()
+        for unit_id, data in self.queue.iter_findings():
+            if unit_id == PASSIVE_UNIT_ID:
+                key = (data["check_id"], data["endpoint"])
+                if key in passive_seen:
+                    continue
+                passive_seen.add(key)
+            report.add_finding(ScanFinding.from_dict(data))
+
+        failed = self.queue.counts()[FAILED]
+        if failed:
+            self.log.error("%d iş birimi deneme sınırına ulaştı ve tamamlanamadı.", failed)
+        report.summary.total_requests = int(self.queue.get_meta("total_requests") or 0)
+        report.summary.finalize()
+        self.log.close()
+        return report
+
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Dict, Optional, Tuple
+
+
+# Satır başına bir JSON mesajı; büyük yanıt parçacıkları için sınır geniş tutulur.
+STREAM_LIMIT = 16 * 1024 * 1024
+
+# `--token` verilmezse koordinatör ve işçiler paylaşılan anahtarı buradan okur.
+TOKEN_ENV = "VULN_SCANNER_TOKEN"
+
+
+class ProtocolError(RuntimeError):
+    pass
+
+
+async def send_message(writer: asyncio.StreamWriter, message: Dict[str, Any]) -> None:
+    writer.write(json.dumps(message, ensure_ascii=False).encode("utf-8") + b"\n")
+    await writer.drain()
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Dict[str, Any]]:
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        message = json.loads(line)
+    except ValueError as exc:
+        raise ProtocolError(f"Geçersiz mesaj: {exc}") from exc
+    if not isinstance(message, dict):
+        raise ProtocolError("Mesaj bir JSON nesnesi olmalı.")
+    return message
+
+
+def parse_address(value: str) -> Tuple[str, int]:
+    host, sep, port = value.rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Adres HOST:PORT biçiminde olmalı: {value}")
+    return host or "127.0.0.1", int(port)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from scanner.core.scanner import WorkUnit
+
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class Lease:
+    unit_id: int
+    unit: WorkUnit
+    attempt: int
+
+
+class WorkQueue:
+    """SQLite üzerinde kalıcı iş kuyruğu.
+
+    Birimler kiralanır (lease); süresi dolan kiralar, sahibi olan işçi
+    ölmüş sayılarak başka bir işçiye yeniden verilir. Koordinatör yeniden
+    başlatılırsa aynı dosyadan kaldığı yerden devam eder.
+    """
+
+    def __init__(self, path: Path, max_attempts: int = 3) -> None:
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self._db = sqlite3.connect(str(self.path), isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS units (
+                id INTEGER PRIMARY KEY,
+                endpoint_index INTEGER NOT NULL,
+                check_id TEXT NOT NULL,
+                state TEXT NOT NULL,
+                worker TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0
+            );
+            CREATE INDEX IF NOT EXISTS units_state ON units (state, lease_expires);
+            CREATE TABLE IF NOT EXISTS findings (
+                unit_id INTEGER NOT NULL,
+                payload TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+            """
+        )
+
+    def close(self) -> None:
+        self._db.close()
+
+    def is_initialized(self) -> bool:
+        return self.get_meta("initialized") is not None
+
+    def enqueue(self, units: Iterable[WorkUnit]) -> int:
+        with self._transaction():
+            cursor = self._db.executemany(
+                "INSERT INTO units (endpoint_index, check_id, state) VALUES (?, ?, ?)",
+                ((unit.endpoint_index, unit.check_id, PENDING) for unit in units),
+            )
+            self.set_meta("initialized", "1")
+        return cursor.rowcount
+
+    def lease(self, worker: str, lease_seconds: float, now: Optional[float] = None) -> Optional[Lease]:
+        now = time.time() if now is None else now
+        with self._transaction():
+            self._db.execute(
+                "UPDATE units SET state = ?, worker = NULL WHERE state = ? AND lease_expires < ? AND attempts >= ?",
+                (FAILED, LEASED, now, self.max_attempts),
+            )
+            row = self._db.execute(
+                "SELECT id, endpoint_index, check_id, attempts FROM units "
+                "WHERE state = ? OR (state = ? AND lease_expires < ?) ORDER BY id LIMIT 1",
+                (PENDING, LEASED, now),
+            ).fetchone()
+            if row is None:
+                return None
+            unit_id, endpoint_index, check_id, attempts = row
+            self._db.execute(
+                "UPDATE units SET state = ?, worker = ?, lease_expires = ?, attempts = ? WHERE id = ?",
+                (LEASED, worker, now + lease_seconds, attempts + 1, unit_id),
+            )
+        return Lease(unit_id=unit_id, unit=WorkUnit(endpoint_index, check_id), attempt=attempts + 1)
+
+    def release(self, worker: str) -> int:
+        """Bağlantısı kopan işçinin kiralarını beklemeden geri kuyruğa al.
+
+        Deneme sınırına ulaşan birimler, süresi dolan kiralarda olduğu gibi
+        FAILED olur; işçiyi düşüren bir birim sonsuza dek dağıtılmaz.
+        """
+        with self._transaction():
+            failed = self._db.execute(
+                "UPDATE units SET state = ?, worker = NULL, lease_expires = NULL "
+                "WHERE state = ? AND worker = ? AND attempts >= ?",
+                (FAILED, LEASED, worker, self.max_attempts),
+            )
+            released = self._db.execute(
+                "UPDATE units SET state = ?, worker = NULL, lease_expires = NULL WHERE state = ? AND worker = ?",
+                (PENDING, LEASED, worker),
+            )
+        return failed.rowcount + released.rowcount
+
+    def renew(self, worker: str, lease_seconds: float, now: Optional[float] = None) -> int:
+        now = time.time() if now is None else now
+        cursor = self._db.execute(
+            "UPDATE units SET lease_expires = ? WHERE state = ? AND worker = ?",
+            (now + lease_seconds, LEASED, worker),
+        )
+        return cursor.rowcount
+
+    def complete(self, unit_id: int, worker: str, findings: List[Dict[str, Any]]) -> bool:
+        """Birimi tamamla. Kira başka bir işçiye geçtiyse sonuç yok sayılır."""
+        with self._transaction():
+            cursor = self._db.execute(
+                "UPDATE units SET state = ?, lease_expires = NULL WHERE id = ? AND state = ? AND worker = ?",
+                (DONE, unit_id, LEASED, worker),
+            )
+            if cursor.rowcount != 1:
+                return False
+            self._insert_findings(unit_id, findings)
+        return True
+
+    def add_findings(self, unit_id: int, findings: List[Dict[str, Any]]) -> None:
+        with self._transaction():
+            self._insert_findings(unit_id, findings)
+
+    def _insert_findings(self, unit_id: int, findings: List[Dict[str, Any]]) -> None:
+        self._db.executemany(
+            "INSERT INTO findings (unit_id, payload) VALUES (?, ?)",
+            ((unit_id, json.dumps(finding, ensure_ascii=False)) for finding in findings),
+        )
+
+    def counts(self) -> Dict[str, int]:
+        counts = {PENDING: 0, LEASED: 0, DONE: 0, FAILED: 0}
+        for state, count in self._db.execute("SELECT state, COUNT(*) FROM units GROUP BY state"):
+            counts[state] = count
+        return counts
+
+    def finished(self) -> bool:
+        counts = self.counts()
+        return counts[PENDING] == 0 and counts[LEASED] == 0
+
+    def iter_findings(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for unit_id, payload in self._db.execute("SELECT unit_id, payload FROM findings ORDER BY rowid"):
+            yield unit_id, json.loads(payload)
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self._db.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        self._db.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._db)
+
+
+class _Transaction:
+    def __init__(self, db: sqlite3.Connection) -> None:
+        self._db = db
+
+    def __enter__(self) -> None:
+        self._db.execute("BEGIN IMMEDIATE")
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self._db.execute("ROLLBACK" if exc_type else "COMMIT")
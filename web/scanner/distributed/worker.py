@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import secrets
+import socket
+from contextlib import suppress
+from typing import Any, Dict, Optional
+
+import httpx
+from rich.console import Console
+
+from scanner.core.config import ScannerConfig
+from scanner.core.scan_log import ScanLog
+from scanner.core.scanner import Scanner, WorkUnit
+from scanner.distributed.protocol import STREAM_LIMIT, ProtocolError, read_message, send_message
+
+
+class Worker:
+    """Koordinatörden iş birimi kiralayıp kendi `HttpClient`'ı ile çalıştırır."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        worker_id: Optional[str] = None,
+        concurrency: int = 4,
+        console: Optional[Console] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        log: Optional[ScanLog] = None,
+        token: Optional[str] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{secrets.token_hex(3)}"
+        self.concurrency = max(1, concurrency)
+        self.token = token
+        self.console = console or Console(quiet=True)
+        self.completed = 0
+        self._transport = transport
+        self._log = log
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._rpc_lock = asyncio.Lock()
+        self._reported_requests = 0
+        self._reported_seq = 0
+
+    async def run(self) -> int:
+        self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=STREAM_LIMIT)
+        heartbeat: Optional[asyncio.Task[None]] = None
+        try:
+            hello = await self._call({"op": "hello", "worker": self.worker_id, "token": self.token})
+            if not hello.get("ok"):
+                raise ProtocolError(f"Koordinatör bağlantıyı reddetti: {hello.get('error')}")
+            config = ScannerConfig.model_validate(hello["config"])
+            scanner = Scanner(
+                config=config,
+                max_concurrency=self.concurrency,
+                console=self.console,
+                transport=self._transport,
+                log=self._log,
+            )
+            heartbeat = asyncio.create_task(self._heartbeat(float(hello["lease_seconds"]) / 3))
+            try:
+                await asyncio.gather(*(self._lane(scanner) for _ in range(self.concurrency)))
+            finally:
+                report = await scanner.finish()
+            await self._call(
+                {
+                    "op": "passive",
+                    "findings": [finding.serialize() for finding in report.findings],
+                    **self._progress(scanner),
+                }
+            )
+            await self._call({"op": "bye"})
+        finally:
+            if heartbeat is not None:
+                heartbeat.cancel()
+                with suppress(asyncio.CancelledError):
+                    await heartbeat
+            self._writer.close()
+        return self.completed
+
+    async def _lane(self, scanner: Scanner) -> None:
+        while True:
+            reply = await self._call({"op": "lease"})
+            unit = reply.get("unit")
+            if unit is None:
+                if reply.get("done"):
+                    return
+                await asyncio.sleep(float(reply.get("retry_after", 1.0)))
+                continue
+
+            finding = await scanner.run_unit(WorkUnit(int(unit["endpoint_index"]), str(unit["check_id"])))
+            await self._call(
+                {
+                    "op": "complete",
+                    "unit_id": unit["id"],
+                    "findings": [finding.serialize()] if finding else [],
+                    **self._progress(scanner),
+                }
+            )
+            self.completed += 1
+
+    async def _heartbeat(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self._call({"op": "heartbeat"})
+
+    def _progress(self, scanner: Scanner) -> Dict[str, Any]:
+        requests = scanner.http_client.request_count - self._reported_requests
+        self._reported_requests += requests
+        # Yalnızca halka tamponda kalan yeni olaylar gönderilir; örneklenip
+        # düşürülenler işçi tarafında sayılır, koordinatöre taşınmaz.
+        events = scanner.log.events_since(self._reported_seq)
+        self._reported_seq = scanner.log.last_seq
+        return {"requests": requests, "logs": [event.serialize() for event in events]}
+
+    async def _call(self, message: Dict[str, Any]) -> Dict[str, Any]:
+        assert self._reader is not None and self._writer is not None
+        async with self._rpc_lock:
+            await send_message(self._writer, message)
+            reply = await read_message(self._reader)
+        if reply is None:
+            raise ProtocolError("Koordinatör bağlantıyı kapattı.")
+        return reply
@@ -2,14 +2,31 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import os
+import signal
+import sys
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional, Union
 
+import httpx
 from rich.console import Console
 from rich.traceback import install as install_rich_traceback
 
+from scanner.core.analysis import DEFAULT_OFFLOAD_THRESHOLD, AnalysisExecutor
 from scanner.core.config import load_scanner_config
-from scanner.core.scanner import Scanner
+from scanner.core.finding_index import FindingIndex
+from scanner.core.payloads import build_corpus
+from scanner.core.profiling import ScanProfiler
+from scanner.core.progress import LiveProgress
+from scanner.core.replay import RecordingTransport, ReplayTransport
+from scanner.core.reporting import DEFAULT_TOP, SEVERITY_ORDER, ScanReport, severity_at_least
+from scanner.core.scan_log import INFO, LOG_LEVELS, ScanLog
+from scanner.core.scanner import INTERRUPTED, Scanner
+from scanner.distributed import Coordinator, Worker
+from scanner.distributed.coordinator import is_loopback
+from scanner.distributed.protocol import TOKEN_ENV, parse_address
 
 
 console = Console()
@@ -25,8 +42,8 @@ def parse_args() -> argparse.Namespace:
         "-c",
         "--config",
         type=Path,
-        required=True,
-        help="Tarama senaryosu için YAML konfigürasyon dosyası",
+        default=None,
+        help="Tarama senaryosu için YAML konfigürasyon dosyası (işçi modunda gerekmez)",
     )
     parser.add_argument(
         "--report",
@@ -40,44 +57,432 @@ def parse_args() -> argparse.Namespace:
         default=8,
         help="Eş zamanlı istek limiti",
     )
+    parser.add_argument(
+        "--slow-concurrency",
+        type=int,
+        default=2,
+        help="Zaman tabanlı (yavaş) problar için ayrı eş zamanlılık limiti",
+    )
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Tarama süresi sınırı; dolunca yeni iş başlatılmaz, süren işler tamamlanır ve atlananlar raporlanır",
+    )
+    parser.add_argument(
+        "--analysis-threshold",
+        type=int,
+        default=DEFAULT_OFFLOAD_THRESHOLD,
+        metavar="BYTES",
+        help="Bu boyutu aşan yanıt gövdelerinin regex analizi süreç havuzunda yapılır (0: her zaman havuz)",
+    )
     parser.add_argument(
         "--timeout",
         type=float,
         default=None,
         help="İstek zaman aşımı (saniye). Yapılandırmada belirtileni ezmek için kullanın.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=None,
+        help="Taramalar arası bulgu dizini (SQLite). Yeni/tekrarlayan/düzelen bulguları raporlar.",
+    )
+    parser.add_argument(
+        "--log-file",
+        type=Path,
+        default=None,
+        help="Tarama günlüğünün JSON satırları olarak akıtılacağı dosya. Rapor yalnızca bu dosyaya referans verir.",
+    )
+    parser.add_argument(
+        "--log-level",
+        choices=LOG_LEVELS,
+        default=INFO,
+        help="Kaydedilecek en düşük günlük seviyesi",
+    )
+    parser.add_argument(
+        "--top",
+        type=int,
+        default=DEFAULT_TOP,
+        help="Terminalde önem sırasına göre gösterilecek bulgu sayısı (0: tümü). JSON rapor her zaman tamdır.",
+    )
+    parser.add_argument(
+        "-q",
+        "--quiet",
+        action="store_true",
+        help="CI modu: canlı ilerleme ve rich çıktısı yerine yalnızca düz metin özet yaz",
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        metavar="ARCHIVE",
+        help="Tüm istek/yanıt alışverişlerini bu arşive kaydet (yanında ARCHIVE.idx dizini oluşur)",
+    )
+    archive.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        metavar="ARCHIVE",
+        help="Ağa çıkmadan, --record ile alınmış arşivden tara (deterministik, hız sınırı uygulanmaz)",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        choices=SEVERITY_ORDER,
+        default=None,
+        metavar="SEVERITY",
+        help="Bu önem derecesinde ya da üstünde ilk bulguda kalan işi iptal et, kısmi raporu yaz ve 1 ile çık "
+        f"({', '.join(SEVERITY_ORDER)})",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Kontrol × endpoint başına süre (ağ/CPU), istek ve bayt sayılarını ölçüp maliyet tablosu yazdır",
+    )
+    parser.add_argument(
+        "--profile-pstats",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Taramanın CPU işini cProfile ile ölç ve pstats dosyası yaz (--profile'ı açar)",
+    )
+    parser.add_argument(
+        "--profile-collapsed",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Olay döngüsü yığınını örnekleyip flamegraph uyumlu collapsed-stack dosyası yaz (--profile'ı açar)",
+    )
+    parser.add_argument(
+        "--coordinator",
+        metavar="HOST:PORT",
+        default=None,
+        help="Taramayı dağıtık çalıştır: iş birimlerini bu adresten işçilere dağıt",
+    )
+    parser.add_argument(
+        "--queue",
+        type=Path,
+        default=None,
+        help="Koordinatörün kalıcı iş kuyruğu (SQLite). Aynı dosyayla yeniden başlatınca kaldığı yerden devam eder.",
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=30.0,
+        help="İşçi kira süresi; süresi dolan birimler başka işçiye verilir",
+    )
+    parser.add_argument(
+        "--worker",
+        metavar="HOST:PORT",
+        default=None,
+        help="İşçi modunda çalış: verilen koordinatörden iş birimi al",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get(TOKEN_ENV),
+        help=f"Koordinatör ile işçiler arasındaki paylaşılan gizli anahtar (varsayılan: ${TOKEN_ENV}). "
+        "Loopback dışı adreste koordinatör token olmadan başlamaz.",
+    )
+    parser.add_argument(
+        "--build-corpus",
+        nargs="+",
+        type=Path,
+        default=None,
+        metavar=("CORPUS", "SOURCE"),
+        help="Satır başına bir payload içeren kaynak dosyalardan tekilleştirilmiş, dizinli korpus üret ve çık",
+    )
+    args = parser.parse_args()
+    if args.build_corpus is not None and len(args.build_corpus) < 2:
+        parser.error("--build-corpus en az bir kaynak dosya ister")
+    if args.config is None and args.worker is None and args.build_corpus is None:
+        parser.error("--config gerekli (işçi modu hariç)")
+    if args.coordinator and not args.token:
+        try:
+            host, _ = parse_address(args.coordinator)
+        except ValueError as exc:
+            parser.error(str(exc))
+        if not is_loopback(host):
+            parser.error(f"--coordinator {host} loopback değil; --token veya ${TOKEN_ENV} gerekli")
+    return args
 
 
-async def run_scan(config_path: Path, report_path: Optional[Path], max_concurrency: int, timeout: Optional[float]) -> int:
+async def run_scan(
+    config_path: Path,
+    report_path: Optional[Path],
+    max_concurrency: int,
+    timeout: Optional[float],
+    index_path: Optional[Path] = None,
+    log: Optional[ScanLog] = None,
+    top: Optional[int] = DEFAULT_TOP,
+    slow_concurrency: int = 2,
+    time_budget: Optional[float] = None,
+    record_path: Optional[Path] = None,
+    replay_path: Optional[Path] = None,
+    analysis_threshold: int = DEFAULT_OFFLOAD_THRESHOLD,
+    profiler: Optional[ScanProfiler] = None,
+    fail_fast: Optional[str] = None,
+) -> int:
     config = load_scanner_config(config_path)
     if timeout is not None:
         config.http.timeout = timeout
 
-    scanner = Scanner(config=config, max_concurrency=max_concurrency, console=console)
-    report = await scanner.scan()
+    transport: Optional[Union[RecordingTransport, ReplayTransport]] = None
+    if record_path:
+        transport = RecordingTransport(record_path, inner=httpx.AsyncHTTPTransport(verify=config.http.verify_ssl))
+    elif replay_path:
+        transport = ReplayTransport(replay_path)
+        # Yanıtlar diskten gelir; hedefi korumak için konan bekleme yalnızca yavaşlatır.
+        config.rate_limit_per_minute = None
+
+    scanner = Scanner(
+        config=config,
+        max_concurrency=max_concurrency,
+        console=console,
+        transport=transport,
+        log=log,
+        slow_concurrency=slow_concurrency,
+        time_budget=time_budget,
+        analysis=AnalysisExecutor(threshold=analysis_threshold),
+        profiler=profiler,
+        fail_fast=fail_fast,
+    )
+    with LiveProgress(scanner.progress, console):
+        if profiler is not None:
+            profiler.start()
+        try:
+            with _cancel_on_signals(scanner):
+                report = await scanner.scan()
+        finally:
+            scanner.analysis.shutdown()
+            if profiler is not None:
+                profiler.stop()
+    if isinstance(transport, RecordingTransport):
+        _status(
+            f"[green]Arşiv kaydedildi:[/green] {record_path} ({transport.recorded} alışveriş)",
+            f"arşiv: {record_path} alışveriş={transport.recorded}",
+        )
+    elif isinstance(transport, ReplayTransport):
+        _status(
+            f"[bold]Replay:[/bold] {transport.served} yanıt arşivden, {transport.misses} istek arşivde yok",
+            f"replay: arşivden={transport.served} eksik={transport.misses}",
+        )
+    exit_code = _finish(report, report_path, config.name, index_path, top, fail_fast)
+    if profiler is not None:
+        _print_profile(profiler, top)
+    return exit_code
+
+
+@contextmanager
+def _cancel_on_signals(scanner: Scanner) -> Iterator[None]:
+    """SIGINT/SIGTERM taramayı iptal eder ve kısmi rapora düşürür; ikinci Ctrl+C doğrudan çıkar."""
+    loop = asyncio.get_running_loop()
+    installed: List[signal.Signals] = []
+    previous: Dict[signal.Signals, Any] = {}
+
+    def interrupt(signum: signal.Signals) -> None:
+        scanner.cancel(INTERRUPTED)
+        if signum == signal.SIGINT and signum in installed:
+            loop.remove_signal_handler(signum)
+            installed.remove(signum)
 
-    console.rule("[bold cyan]Tarama Sonuçları")
-    report.render(console=console)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, interrupt, signum)
+            installed.append(signum)
+        except NotImplementedError:  # Windows: döngü sinyal işleyicisi yok
+            previous[signum] = signal.signal(
+                signum, lambda *_: loop.call_soon_threadsafe(scanner.cancel, INTERRUPTED)
+            )
+        except (RuntimeError, ValueError):  # ana iş parçacığı dışında
+            pass
+    try:
+        yield
+    finally:
+        for signum in installed:
+            loop.remove_signal_handler(signum)
+        for signum, handler in previous.items():
+            signal.signal(signum, handler)
+
+
+async def run_coordinator(
+    config_path: Path,
+    report_path: Optional[Path],
+    address: str,
+    queue_path: Optional[Path],
+    lease_seconds: float,
+    timeout: Optional[float],
+    index_path: Optional[Path] = None,
+    log: Optional[ScanLog] = None,
+    top: Optional[int] = DEFAULT_TOP,
+    token: Optional[str] = None,
+) -> int:
+    config = load_scanner_config(config_path)
+    if timeout is not None:
+        config.http.timeout = timeout
+
+    host, port = parse_address(address)
+    queue_path = queue_path or config_path.with_suffix(".queue.sqlite")
+    coordinator = Coordinator(
+        config=config,
+        queue_path=queue_path,
+        host=host,
+        port=port,
+        lease_seconds=lease_seconds,
+        console=console,
+        log=log,
+        token=token,
+    )
+    report = await coordinator.run()
+    return _finish(report, report_path, config.name, index_path, top)
+
+
+async def run_worker(
+    address: str, max_concurrency: int, log: Optional[ScanLog] = None, token: Optional[str] = None
+) -> int:
+    host, port = parse_address(address)
+    worker = Worker(host=host, port=port, concurrency=max_concurrency, console=console, log=log, token=token)
+    completed = await worker.run()
+    _status(f"[green]İşçi tamamlandı:[/green] {completed} iş birimi", f"işçi: iş_birimi={completed}")
+    return 0
+
+
+def _status(markup: str, plain: str) -> None:
+    """Durum satırı: `--quiet`'te rich'e hiç uğramadan düz metin, aksi halde renkli."""
+    if console.quiet:
+        sys.stdout.write(plain + "\n")
+    else:
+        console.print(markup)
+
+
+def _finish(
+    report: ScanReport,
+    report_path: Optional[Path],
+    target: str,
+    index_path: Optional[Path],
+    top: Optional[int] = DEFAULT_TOP,
+    fail_fast: Optional[str] = None,
+) -> int:
+    if console.quiet:
+        report.render_plain(top=top)
+    else:
+        console.rule("[bold cyan]Tarama Sonuçları")
+        report.render(console=console, top=top)
 
     if report_path:
         report_path.parent.mkdir(parents=True, exist_ok=True)
         report.write_json(report_path)
-        console.print(f"[green]Rapor kaydedildi:[/green] {report_path}")
+        _status(f"[green]Rapor kaydedildi:[/green] {report_path}", f"rapor: {report_path}")
+
+    if index_path:
+        # Aynı --report yoluyla tekrarlanan taramalar dizinde ayrı kayıt olmalı.
+        prefix = report_path.stem if report_path else "scan"
+        scan_id = f"{prefix}_{report.summary.start_time:%Y%m%dT%H%M%S}_{uuid.uuid4().hex[:6]}"
+        _update_index(report, index_path, target, scan_id)
+
+    if report.summary.stop_reason == INTERRUPTED:
+        return 130  # SIGINT ile kesilen süreçlerin olağan çıkış kodu
+    threshold = fail_fast or "critical"
+    return 1 if any(severity_at_least(finding.severity, threshold) for finding in report.findings) else 0
 
-    return 0 if report.summary.stats["critical"] == 0 else 1
+
+def _print_profile(profiler: ScanProfiler, top: Optional[int]) -> None:
+    if console.quiet:
+        profiler.render_plain(top=top)
+    else:
+        profiler.render(console, top=top)
+    for label, path in (("pstats", profiler.pstats_path), ("collapsed", profiler.collapsed_path)):
+        if path is not None:
+            _status(f"[green]Profil ({label}) kaydedildi:[/green] {path}", f"profil_{label}: {path}")
+
+
+def _update_index(report: ScanReport, index_path: Path, target: str, scan_id: str) -> None:
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    index = FindingIndex(index_path)
+    try:
+        delta = index.record(scan_id, target, report)
+        _status(
+            f"[bold]Bulgu dizini:[/bold] {len(delta.new)} yeni, {len(delta.recurring)} tekrarlayan, "
+            f"{len(delta.fixed)} düzelen (önceki tarama: {delta.previous_scan or '-'})",
+            f"dizin: yeni={len(delta.new)} tekrarlayan={len(delta.recurring)} düzelen={len(delta.fixed)} "
+            f"önceki={delta.previous_scan or '-'}",
+        )
+        for item in index.new_findings(target, min_severity="high", scan_id=scan_id):
+            _status(
+                f"  [red]yeni {item.severity}[/red] {item.check_id} {item.endpoint}",
+                f"yeni\t{item.severity}\t{item.check_id}\t{item.endpoint}",
+            )
+    finally:
+        index.close()
+
+
+def _build_corpus(output: Path, sources: List[Path]) -> int:
+    result = build_corpus(sources, output)
+    _status(
+        f"[green]Korpus yazıldı:[/green] {output} ({result.payloads} payload, "
+        f"{result.duplicates} tekrar atıldı, etiketler: {', '.join(result.tags) or '-'})",
+        f"korpus: {output} payload={result.payloads} tekrar={result.duplicates} "
+        f"etiketler={','.join(result.tags) or '-'}",
+    )
+    return 0
+
+
+def _profiler(args: argparse.Namespace) -> Optional[ScanProfiler]:
+    if not (args.profile or args.profile_pstats or args.profile_collapsed):
+        return None
+    return ScanProfiler(pstats_path=args.profile_pstats, collapsed_path=args.profile_collapsed)
 
 
 def app() -> None:
     args = parse_args()
-    exit_code = asyncio.run(
-        run_scan(
-            config_path=args.config,
-            report_path=args.report,
-            max_concurrency=args.max_concurrency,
-            timeout=args.timeout,
+    console.quiet = args.quiet
+    log = ScanLog(path=args.log_file, level=args.log_level)
+    if args.build_corpus:
+        exit_code = _build_corpus(args.build_corpus[0], args.build_corpus[1:])
+    elif args.worker:
+        exit_code = asyncio.run(
+            run_worker(
+                address=args.worker,
+                max_concurrency=args.max_concurrency,
+                log=log,
+                token=args.token,
+            )
+        )
+    elif args.coordinator:
+        exit_code = asyncio.run(
+            run_coordinator(
+                config_path=args.config,
+                report_path=args.report,
+                address=args.coordinator,
+                queue_path=args.queue,
+                lease_seconds=args.lease_seconds,
+                timeout=args.timeout,
+                index_path=args.index,
+                log=log,
+                top=args.top,
+                token=args.token,
+            )
+        )
+    else:
+        exit_code = asyncio.run(
+            run_scan(
+                config_path=args.config,
+                report_path=args.report,
+                max_concurrency=args.max_concurrency,
+                slow_concurrency=args.slow_concurrency,
+                time_budget=args.time_budget,
+                timeout=args.timeout,
+                record_path=args.record,
+                replay_path=args.replay,
+                analysis_threshold=args.analysis_threshold,
+                profiler=_profiler(args),
+                fail_fast=args.fail_fast,
+                index_path=args.index,
+                log=log,
+                top=args.top,
+            )
         )
-    )
     raise SystemExit(exit_code)
 
 
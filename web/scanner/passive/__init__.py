@@ -0,0 +1,21 @@
+from scanner.passive.analyzers import (
+    CookieFlagsAnalyzer,
+    SecurityHeadersAnalyzer,
+    SensitiveDataAnalyzer,
+    VerboseErrorAnalyzer,
+)
+from scanner.passive.base import PassiveAnalyzer
+from scanner.passive.bus import PassiveBus
+from scanner.passive.registry import PASSIVE_REGISTRY, all_analyzers, iter_analyzers
+
+__all__ = [
+    "PassiveAnalyzer",
+    "PassiveBus",
+    "SensitiveDataAnalyzer",
+    "SecurityHeadersAnalyzer",
+    "CookieFlagsAnalyzer",
+    "VerboseErrorAnalyzer",
+    "PASSIVE_REGISTRY",
+    "iter_analyzers",
+    "all_analyzers",
+]
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from scanner.core.analysis import AnalysisExecutor
+from scanner.core.reporting import ScanFinding, finding_text
+from scanner.core.response import ScanResponse
+from scanner.passive.base import PassiveAnalyzer
+
+
+SENSITIVE_PATTERNS = {
+    "AWS Access Key": re.compile(r"AKIA[0-9A-Z]{16}"),
+    "JWT": re.compile(r"eyJ[a-zA-Z0-9_-]{10,}\.[a-zA-Z0-9_-]{10,}\.[a-zA-Z0-9_-]{10,}"),
+    "Private Key": re.compile(r"-----BEGIN (?:RSA|DSA|EC)? PRIVATE KEY-----"),
+    "Email": re.compile(r"[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+"),
+}
+
+SECURITY_HEADERS = (
+    "Content-Security-Policy",
+    "X-Content-Type-Options",
+    "X-Frame-Options",
+    "Referrer-Policy",
+)
+
+VERBOSE_ERROR_PATTERNS = {
+    "Python Traceback": re.compile(r"Traceback \(most recent call last\)"),
+    "Werkzeug Debugger": re.compile(r"Werkzeug Debugger"),
+    "Java Stack Trace": re.compile(r"(?:Exception in thread|\bat [a-z]+\.[\w.$]+\([\w]+\.java:\d+\))"),
+    ".NET Stack Trace": re.compile(r"(?:System\.[\w.]+Exception|Server Error in '.*' Application)"),
+    "PHP Error": re.compile(r"(?:<b>(?:Fatal error|Warning|Parse error)</b>:|PHP (?:Fatal error|Warning):)"),
+}
+
+
+def find_sensitive_data(body: str) -> Dict[str, str]:
+    findings: Dict[str, str] = {}
+    for name, pattern in SENSITIVE_PATTERNS.items():
+        match = pattern.search(body)
+        if match:
+            findings[name] = match.group(0)[:120]
+    return findings
+
+
+def find_verbose_error(body: str) -> Optional[Tuple[str, int]]:
+    """İlk eşleşen hata kalıbının adı ve gövdedeki konumu."""
+    for name, pattern in VERBOSE_ERROR_PATTERNS.items():
+        match = pattern.search(body)
+        if match:
+            return name, match.start()
+    return None
+
+
+class SensitiveDataAnalyzer(PassiveAnalyzer):
+    check_id = "DATA-001"
+    name = "Hassas Veri Sızıntısı Kontrolü"
+    description = "Yanıtlarda yaygın hassas veri kalıplarını arar."
+    severity = "medium"
+
+    text = finding_text(
+        text_id="DATA-001.pattern-match",
+        summary="Hassas veri sızıntısı belirtisi",
+        description="Yanıtta hassas veri kalıpları bulundu. Bu, veri sızıntısına işaret edebilir.",
+        remediation="Yanıtlarda gereksiz veri göndermeyin ve hassas bilgileri maskeleyin.",
+        references=["https://owasp.org/Top10/A02_2021-Cryptographic_Failures/"],
+    )
+
+    async def prepare(self, response: ScanResponse, analysis: AnalysisExecutor) -> None:
+        await analysis.memo(response, "sensitive_data", find_sensitive_data)
+
+    def analyze(self, endpoint: str, response: ScanResponse) -> Optional[ScanFinding]:
+        matches = response.memo("sensitive_data", lambda: find_sensitive_data(response.text))
+        if not matches:
+            return None
+
+        return ScanFinding(
+            check_id=self.check_id,
+            severity=self.severity,
+            endpoint=endpoint,
+            text=self.text,
+            evidence={
+                "matches": matches,
+                "status_code": response.status_code,
+            },
+        )
+
+
+class SecurityHeadersAnalyzer(PassiveAnalyzer):
+    check_id = "HDR-001"
+    name = "Eksik Güvenlik Başlıkları"
+    description = "Yanıtlarda önerilen HTTP güvenlik başlıklarının varlığını denetler."
+    severity = "low"
+    once_per_endpoint = True
+
+    text = finding_text(
+        text_id="HDR-001.missing-headers",
+        summary="Güvenlik başlıkları eksik",
+        description="Yanıtta tarayıcı tarafı korumaları etkinleştiren bazı güvenlik başlıkları bulunmuyor.",
+        remediation="Eksik güvenlik başlıklarını tüm yanıtlara ekleyin (CSP, nosniff, frame ve referrer politikaları).",
+        references=["https://owasp.org/www-project-secure-headers/"],
+    )
+
+    def analyze(self, endpoint: str, response: ScanResponse) -> Optional[ScanFinding]:
+        missing = [name for name in SECURITY_HEADERS if not response.has_header(name)]
+        if response.url.scheme == "https" and not response.has_header("Strict-Transport-Security"):
+            missing.append("Strict-Transport-Security")
+        if not missing:
+            return None
+
+        return ScanFinding(
+            check_id=self.check_id,
+            severity=self.severity,
+            endpoint=endpoint,
+            text=self.text,
+            evidence={
+                "missing": missing,
+                "status_code": response.status_code,
+            },
+        )
+
+
+class CookieFlagsAnalyzer(PassiveAnalyzer):
+    check_id = "COOKIE-001"
+    name = "Güvensiz Çerez Bayrakları"
+    description = "Set-Cookie başlıklarında HttpOnly, Secure ve SameSite bayraklarını denetler."
+    severity = "low"
+
+    text = finding_text(
+        text_id="COOKIE-001.weak-flags",
+        summary="Çerezler güvenlik bayrakları olmadan ayarlanıyor",
+        description="Sunucu, koruyucu bayrakları eksik çerezler gönderiyor. Oturum çerezleri XSS veya CSRF ile ele geçirilebilir.",
+        remediation="Oturum çerezlerini HttpOnly, Secure ve uygun SameSite değeriyle ayarlayın.",
+        references=["https://owasp.org/www-community/controls/SecureCookieAttribute"],
+    )
+
+    def analyze(self, endpoint: str, response: ScanResponse) -> Optional[ScanFinding]:
+        if not response.has_header("set-cookie"):
+            return None
+
+        weak: Dict[str, List[str]] = {}
+        secure_transport = response.url.scheme == "https"
+        for cookie in response.headers.get_list("set-cookie"):
+            name, _, attributes = cookie.partition(";")
+            flags = attributes.lower()
+            missing = []
+            if "httponly" not in flags:
+                missing.append("HttpOnly")
+            if secure_transport and "secure" not in flags:
+                missing.append("Secure")
+            if "samesite" not in flags:
+                missing.append("SameSite")
+            if missing:
+                weak[name.split("=", 1)[0].strip()] = missing
+        if not weak:
+            return None
+
+        return ScanFinding(
+            check_id=self.check_id,
+            severity=self.severity,
+            endpoint=endpoint,
+            text=self.text,
+            evidence={
+                "cookies": weak,
+                "status_code": response.status_code,
+            },
+        )
+
+
+class VerboseErrorAnalyzer(PassiveAnalyzer):
+    check_id = "ERR-001"
+    name = "Ayrıntılı Hata Mesajları"
+    description = "Yanıtlarda yığın izi ve çerçeve hata sayfası izlerini arar."
+    severity = "low"
+
+    text = finding_text(
+        text_id="ERR-001.stack-trace",
+        summary="Ayrıntılı hata mesajı döndürülüyor",
+        description="Sunucu hata yanıtlarında iç yapıyı ele veren yığın izi veya hata ayrıntıları döndürüyor.",
+        remediation="Üretim ortamında hata ayrıntılarını kapatın ve genel hata sayfaları döndürün.",
+        references=["https://owasp.org/www-community/Improper_Error_Handling"],
+    )
+
+    async def prepare(self, response: ScanResponse, analysis: AnalysisExecutor) -> None:
+        if response.status_code >= 400:
+            await analysis.memo(response, "verbose_error", find_verbose_error)
+
+    def analyze(self, endpoint: str, response: ScanResponse) -> Optional[ScanFinding]:
+        if response.status_code < 400:
+            return None
+
+        match = response.memo("verbose_error", lambda: find_verbose_error(response.text))
+        if match is None:
+            return None
+        name, position = match
+        start = max(position - 100, 0)
+        return ScanFinding(
+            check_id=self.check_id,
+            severity=self.severity,
+            endpoint=endpoint,
+            text=self.text,
+            evidence={
+                "pattern": name,
+                "status_code": response.status_code,
+                "response_snippet": response.text[start : start + 500],
+            },
+        )
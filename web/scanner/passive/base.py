@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import abc
+from typing import Optional
+
+from scanner.core.analysis import AnalysisExecutor
+from scanner.core.reporting import ScanFinding
+from scanner.core.response import ScanResponse
+
+
+class PassiveAnalyzer(abc.ABC):
+    """Taramanın zaten aldığı yanıtları ek istek göndermeden inceleyen analizör."""
+
+    check_id: str
+    name: str
+    description: str
+    severity: str
+    # Yanıt başlıklarına bakan analizörler için endpoint başına ilk yanıt yeterlidir.
+    once_per_endpoint: bool = False
+
+    async def prepare(self, response: ScanResponse, analysis: AnalysisExecutor) -> None:
+        """`analyze` öncesi CPU yoğun hesapları yanıt memo'suna hazırla (gerekirse havuzda).
+
+        İsteğe bağlı kanca: yalnızca başlıklara bakan analizörler için hazırlık
+        gerekmez, varsayılan hiçbir şey yapmaz.
+        """
+        return None
+
+    @abc.abstractmethod
+    def analyze(self, endpoint: str, response: ScanResponse) -> Optional[ScanFinding]:
+        """Yanıtı incele. Bulgu varsa `ScanFinding` dön."""
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import suppress
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from scanner.core.analysis import AnalysisExecutor
+from scanner.core.reporting import ScanFinding
+from scanner.core.response import ScanResponse
+from scanner.passive.base import PassiveAnalyzer
+
+
+# Kuyruğa alınan yanıt memo'da işaretlenir; aynı yanıt ikinci kez analiz edilmez.
+_QUEUED = "passive.queued"
+
+
+def endpoint_key(method: str, url: str) -> str:
+    return f"{method.upper()} {url.split('?', 1)[0].split('#', 1)[0]}"
+
+
+class PassiveBus:
+    """Taramanın aldığı her yanıtı kayıtlı pasif analizörlere dağıtır.
+
+    `publish` yalnızca sınırlı bir kuyruğa ekler; analiz ayrı bir görevde,
+    istek akışını bekletmeden yapılır. Kuyruk doluysa yanıt düşürülür.
+    Bir analizör bir endpoint için bulgu ürettikten sonra o endpoint'in
+    yanıtları o analizöre tekrar gösterilmez. Büyük gövdelerin analizi
+    `analysis` yürütücüsüyle havuza gönderilir; döngü bu sürede bloklanmaz.
+
+    Bir endpoint'in yanıtlarında yalnızca o endpoint'te etkin kontrollerin
+    (`scope`) analizörleri çalışır; kaydı olmayan URL'lere `default_checks`
+    uygulanır. `None` kapsam tüm analizörler demektir.
+    """
+
+    def __init__(
+        self,
+        analyzers: Iterable[PassiveAnalyzer],
+        max_pending: int = 1024,
+        max_samples_per_endpoint: int = 25,
+        analysis: Optional[AnalysisExecutor] = None,
+        default_checks: Optional[Iterable[str]] = None,
+    ) -> None:
+        self._analyzers = list(analyzers)
+        self.analysis = analysis or AnalysisExecutor.inline_only()
+        self._max_pending = max_pending
+        self._max_samples = max_samples_per_endpoint
+        self._queue: Optional[asyncio.Queue[Tuple[str, ScanResponse]]] = None
+        self._worker: Optional[asyncio.Task[None]] = None
+        self._samples: Dict[str, int] = {}
+        self._default_scope = frozenset(default_checks) if default_checks is not None else None
+        self._scopes: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._inspected: Set[Tuple[str, str]] = set()
+        self._reported: Set[Tuple[str, str]] = set()
+        self.findings: List[ScanFinding] = []
+        self.analyzed = 0
+        self.dropped = 0
+        self.errors = 0
+
+    def handles(self, check_id: str) -> bool:
+        return any(analyzer.check_id == check_id for analyzer in self._analyzers)
+
+    def scope(self, method: str, url: str, check_ids: Optional[Iterable[str]]) -> None:
+        """Endpoint'in yanıtlarında çalışacak kontrol kimliklerini kaydet (`None`: hepsi)."""
+        self._scopes[endpoint_key(method, url)] = frozenset(check_ids) if check_ids is not None else None
+
+    def seen(self, method: str, url: str) -> bool:
+        return endpoint_key(method, url) in self._samples
+
+    def publish(self, response: ScanResponse, clean: bool = False) -> None:
+        """Yanıtı analiz kuyruğuna ekle.
+
+        `clean=True` endpoint'in değiştirilmemiş isteğinin yanıtıdır: problar
+        örnek sınırını doldurmuş olsa da analiz edilir.
+        """
+        if not self._analyzers or response.has_memo(_QUEUED):
+            return
+        key = endpoint_key(response.request.method, str(response.url))
+        samples = self._samples.get(key, 0)
+        self._samples[key] = samples + 1
+        if samples >= self._max_samples and not clean:
+            return
+
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._max_pending)
+            self._worker = asyncio.create_task(self._run())
+        try:
+            self._queue.put_nowait((key, response))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            return
+        response.memo(_QUEUED, lambda: True)
+
+    async def drain(self) -> List[ScanFinding]:
+        """Bekleyen yanıtları işle, çalışan görevi kapat ve bulguları döndür."""
+        if self._queue is not None:
+            await self._queue.join()
+        if self._worker is not None:
+            self._worker.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+        self._queue = None
+        return self.findings
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            key, response = await self._queue.get()
+            try:
+                await self._analyze(key, response)
+            except Exception:  # noqa: BLE001
+                self.errors += 1
+            finally:
+                self._queue.task_done()
+            # Dolu kuyrukta bile olay döngüsünü istek görevlerine bırak.
+            await asyncio.sleep(0)
+
+    async def _analyze(self, key: str, response: ScanResponse) -> None:
+        self.analyzed += 1
+        endpoint = key.split(" ", 1)[1]
+        allowed = self._scopes.get(key, self._default_scope)
+        for analyzer in self._analyzers:
+            if allowed is not None and analyzer.check_id not in allowed:
+                continue
+            marker = (analyzer.check_id, key)
+            if marker in self._reported:
+                continue
+            if analyzer.once_per_endpoint and marker in self._inspected:
+                continue
+            self._inspected.add(marker)
+            await analyzer.prepare(response, self.analysis)
+            finding = analyzer.analyze(endpoint, response)
+            if finding:
+                if finding.target is None:
+                    finding.target = key
+                self._reported.add(marker)
+                self.findings.append(finding)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Type
+
+from scanner.passive.analyzers import (
+    CookieFlagsAnalyzer,
+    SecurityHeadersAnalyzer,
+    SensitiveDataAnalyzer,
+    VerboseErrorAnalyzer,
+)
+from scanner.passive.base import PassiveAnalyzer
+
+
+PASSIVE_REGISTRY: Dict[str, Type[PassiveAnalyzer]] = {
+    SensitiveDataAnalyzer.check_id: SensitiveDataAnalyzer,
+    SecurityHeadersAnalyzer.check_id: SecurityHeadersAnalyzer,
+    CookieFlagsAnalyzer.check_id: CookieFlagsAnalyzer,
+    VerboseErrorAnalyzer.check_id: VerboseErrorAnalyzer,
+}
+
+
+def iter_analyzers(ids: Iterable[str]) -> List[PassiveAnalyzer]:
+    instances: List[PassiveAnalyzer] = []
+    for check_id in ids:
+        cls = PASSIVE_REGISTRY.get(check_id)
+        if not cls:
+            continue
+        instances.append(cls())
+    return instances
+
+
+def all_analyzers() -> List[PassiveAnalyzer]:
+    return [cls() for cls in PASSIVE_REGISTRY.values()]
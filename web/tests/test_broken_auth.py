@@ -0,0 +1,155 @@
+import asyncio
+import json
+from pathlib import Path
+
+import httpx
+
+from scanner.core.config import AuthCredential, CredentialTestSettings, Endpoint, HttpSettings
+from scanner.core.credentials import AccountThrottle, CredentialSource
+from scanner.core.http_client import HttpClient
+from scanner.core.request_template import RequestTemplate
+from scanner.core.scan_log import ScanLog
+from scanner.checks import BrokenAuthCheck, CheckContext
+
+
+def _wordlist(tmp_path: Path, size: int, winner: int) -> Path:
+    path = tmp_path / "creds.txt"
+    lines = ["# kullanıcı:parola", ""]
+    lines += [f"user{i}:{'s3cret:x' if i == winner else f'pass{i}'}" for i in range(size)]
+    path.write_text("\n".join(lines), encoding="utf-8")
+    return path
+
+
+def _context(
+    handler, source: CredentialSource, log: ScanLog, path: str = "/login", throttle=None, **settings
+) -> CheckContext:
+    endpoint = Endpoint(name="Login", method="POST", path=path, json={"username": "", "password": ""})
+    return CheckContext(
+        base_url="http://target.local",
+        endpoint=endpoint.path,
+        method=endpoint.method,
+        template=RequestTemplate.from_endpoint("http://target.local", endpoint, []),
+        metadata={
+            "credentials": source,
+            "credential_testing": CredentialTestSettings(**settings),
+            "account_throttle": throttle,
+        },
+        http_client=HttpClient(HttpSettings(), transport=httpx.MockTransport(handler)),
+        log=log,
+    )
+
+
+def _run(context: CheckContext):
+    async def run():
+        try:
+            return await BrokenAuthCheck().execute(context)
+        finally:
+            await context.http_client.close()
+
+    return asyncio.run(run())
+
+
+def test_credential_source_streams_inline_then_file(tmp_path) -> None:
+    source = CredentialSource([AuthCredential(username="admin", password="admin")], _wordlist(tmp_path, 3, winner=1))
+
+    assert list(source) == [
+        {"username": "admin", "password": "admin"},
+        {"username": "user0", "password": "pass0"},
+        {"username": "user1", "password": "s3cret:x"},
+        {"username": "user2", "password": "pass2"},
+    ]
+    assert not CredentialSource()
+
+
+def test_account_throttle_spaces_attempts_and_forgets_idle_accounts() -> None:
+    now = [0.0]
+    throttle = AccountThrottle(interval=2.0, max_tracked=2, clock=lambda: now[0])
+
+    assert throttle.reserve("admin") == 0
+    assert throttle.reserve("admin") == 2.0
+    assert throttle.reserve("root") == 0
+    now[0] = 5.0
+    assert throttle.reserve("guest") == 0
+    assert len(throttle) == 1
+
+
+def test_concurrent_attempts_stop_at_first_success(tmp_path) -> None:
+    seen = []
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        body = json.loads(request.content)
+        seen.append(body["username"])
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if body["password"] == "s3cret:x":
+            return httpx.Response(200, json={"token": "abc"})
+        return httpx.Response(401, json={"error": "invalid"})
+
+    source = CredentialSource(path=_wordlist(tmp_path, 500, winner=20))
+    finding = _run(_context(handler, source, ScanLog(), concurrency=4))
+
+    assert finding is not None
+    assert finding.evidence["username"] == "user20"
+    assert peak == 4
+    assert len(seen) < 30
+
+
+def test_lockout_response_stops_testing(tmp_path) -> None:
+    attempts = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal attempts
+        attempts += 1
+        if attempts > 3:
+            return httpx.Response(403, text="Account locked, try again later")
+        return httpx.Response(401, text="invalid")
+
+    log = ScanLog()
+    source = CredentialSource(path=_wordlist(tmp_path, 500, winner=-1))
+    finding = _run(_context(handler, source, log, concurrency=2))
+
+    assert finding is None
+    assert attempts <= 5
+    warning = log.events("warning")[0]
+    assert warning.check_id == "AUTH-001"
+    assert "account locked" in warning.message
+
+
+def test_lockout_phrase_in_successful_response_is_not_a_lockout(tmp_path) -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        if json.loads(request.content)["password"] == "s3cret:x":
+            return httpx.Response(
+                200, text="Hoş geldiniz! Too many login attempts uyarısı kaldırıldı.", headers={"Set-Cookie": "sid=1"}
+            )
+        return httpx.Response(401, text="invalid")
+
+    log = ScanLog()
+    source = CredentialSource(path=_wordlist(tmp_path, 4, winner=2))
+    finding = _run(_context(handler, source, log, concurrency=1))
+
+    assert finding is not None and finding.evidence["username"] == "user2"
+    assert finding.evidence["set_cookie"] == "sid=1"
+    assert not log.events("warning")
+
+
+def test_lockout_is_shared_across_endpoints(tmp_path) -> None:
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        username = json.loads(request.content)["username"]
+        seen.append((request.url.path, username))
+        if username == "user0":
+            return httpx.Response(423, text="locked")
+        return httpx.Response(401, text="invalid")
+
+    throttle = AccountThrottle(interval=0.0)
+    source = CredentialSource(path=_wordlist(tmp_path, 3, winner=-1))
+    _run(_context(handler, source, ScanLog(), throttle=throttle, concurrency=1))
+    _run(_context(handler, source, ScanLog(), path="/admin/login", throttle=throttle, concurrency=1))
+
+    assert throttle.is_locked("user0")
+    assert seen == [("/login", "user0"), ("/admin/login", "user1"), ("/admin/login", "user2")]
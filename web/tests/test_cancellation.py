@@ -0,0 +1,69 @@
+import asyncio
+
+import httpx
+from rich.console import Console
+
+from scanner.core.config import ScannerConfig
+from scanner.core.scanner import FAIL_FAST, INTERRUPTED, Scanner
+
+
+def _config(endpoints: int = 4) -> ScannerConfig:
+    return ScannerConfig.model_validate(
+        {
+            "name": "İptal",
+            "default_checks": ["SQLI-001", "XSS-001"],
+            "passive_checks": [],
+            "scope": {
+                "base_url": "http://target.local",
+                "endpoints": [{"name": f"Ara {i}", "path": f"/search/{i}"} for i in range(endpoints)],
+            },
+        }
+    )
+
+
+def test_cancel_returns_partial_report_and_closes_client() -> None:
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        scanner = Scanner(
+            _config(), max_concurrency=2, console=Console(quiet=True), transport=httpx.MockTransport(slow)
+        )
+        asyncio.get_running_loop().call_later(0.05, scanner.cancel)
+        return scanner, await scanner.scan()
+
+    scanner, report = asyncio.run(run())
+
+    assert report.summary.incomplete
+    assert report.summary.serialize()["stop_reason"] == INTERRUPTED
+    coverage = report.summary.coverage
+    assert coverage["interrupted"] == 2
+    assert coverage["completed"] == 0
+    assert coverage["skipped"] == coverage["planned"] - 2
+    assert scanner.http_client._client is None
+    assert not scanner.cancel()  # tarama bitti; ikinci çağrı etkisiz
+
+
+def test_fail_fast_stops_at_first_finding_over_threshold() -> None:
+    def vulnerable(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(500, text="You have an error in your SQL syntax")
+
+    async def run(fail_fast):
+        scanner = Scanner(
+            _config(),
+            max_concurrency=1,
+            console=Console(quiet=True),
+            transport=httpx.MockTransport(vulnerable),
+            fail_fast=fail_fast,
+        )
+        return await scanner.scan()
+
+    report = asyncio.run(run("high"))
+    assert [finding.check_id for finding in report.findings] == ["SQLI-001"]
+    assert report.summary.stop_reason == FAIL_FAST
+    assert report.summary.coverage["skipped"] > 0
+
+    complete = asyncio.run(run(None))
+    assert not complete.summary.incomplete
+    assert len(complete.findings) == 4
@@ -9,6 +9,6 @@ def test_load_sample_config(tmp_path: Path) -> None:
 
     assert config.name == "Demo Hedef"
     assert config.scope.base_url == "http://localhost:8000"
-    assert config.default_checks == ["SQLI-001", "XSS-001", "DATA-001"]
+    assert config.default_checks == ["SQLI-001", "XSS-001", "DATA-001", "HDR-001", "COOKIE-001", "ERR-001"]
     assert config.scope.endpoints[0].enabled_checks == ["AUTH-001"]
 
@@ -0,0 +1,120 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from scanner.core.config import ScannerConfig
+from scanner.core.scanner import WorkUnit
+from scanner.distributed import Coordinator, Worker, WorkQueue
+from scanner.distributed.protocol import read_message, send_message
+
+
+def _config() -> ScannerConfig:
+    return ScannerConfig.model_validate(
+        {
+            "name": "Dağıtık",
+            "default_checks": ["SQLI-001", "XSS-001", "HDR-001"],
+            "passive_checks": ["HDR-001"],
+            "scope": {
+                "base_url": "http://target.local",
+                "endpoints": [
+                    {"name": f"E{i}", "path": f"/api/items/{i}", "query": {"id": str(i)}} for i in range(6)
+                ],
+            },
+        }
+    )
+
+
+def _target(request: httpx.Request) -> httpx.Response:
+    if "%27" in str(request.url) and request.url.path.endswith(("/1", "/4")):
+        return httpx.Response(500, text="You have an error in your SQL syntax")
+    return httpx.Response(200, text="ok")
+
+
+def test_coordinator_assembles_report_from_several_workers(tmp_path: Path) -> None:
+    async def run():
+        coordinator = Coordinator(_config(), tmp_path / "queue.sqlite", lease_seconds=5)
+        host, port = await coordinator.start()
+        workers = [
+            Worker(host, port, worker_id=f"w{i}", concurrency=2, transport=httpx.MockTransport(_target))
+            for i in range(3)
+        ]
+        completed = await asyncio.gather(*(worker.run() for worker in workers))
+        report = await coordinator.wait()
+        return completed, report
+
+    completed, report = asyncio.run(run())
+
+    assert sum(completed) == 12
+    sqli = sorted(finding.endpoint for finding in report.findings if finding.check_id == "SQLI-001")
+    assert sqli == ["http://target.local/api/items/1", "http://target.local/api/items/4"]
+    headers = [finding for finding in report.findings if finding.check_id == "HDR-001"]
+    assert len(headers) == 6
+    assert report.summary.total_requests > 12
+
+
+def test_expired_lease_is_handed_to_another_worker(tmp_path: Path) -> None:
+    queue = WorkQueue(tmp_path / "queue.sqlite", max_attempts=2)
+    queue.enqueue([WorkUnit(0, "SQLI-001")])
+
+    first = queue.lease("dead", lease_seconds=10, now=100.0)
+    assert first is not None
+    assert queue.lease("alive", lease_seconds=10, now=105.0) is None
+
+    second = queue.lease("alive", lease_seconds=10, now=111.0)
+    assert second is not None and second.unit_id == first.unit_id and second.attempt == 2
+    assert not queue.complete(first.unit_id, "dead", [])
+    assert queue.complete(second.unit_id, "alive", [{"check_id": "SQLI-001"}])
+    assert queue.finished()
+    queue.close()
+
+
+def test_release_fails_units_that_reached_max_attempts(tmp_path: Path) -> None:
+    queue = WorkQueue(tmp_path / "queue.sqlite", max_attempts=2)
+    queue.enqueue([WorkUnit(0, "SQLI-001"), WorkUnit(1, "SQLI-001")])
+
+    poison = queue.lease("w1", lease_seconds=10, now=100.0)
+    assert poison is not None
+    assert queue.release("w1") == 1
+    again = queue.lease("w2", lease_seconds=10, now=101.0)
+    assert again is not None and again.unit_id == poison.unit_id and again.attempt == 2
+    other = queue.lease("w2", lease_seconds=10, now=101.0)
+    assert other is not None and other.attempt == 1
+
+    # İkinci denemede de işçi düştü: birim FAILED olur, diğeri yeniden bekler.
+    assert queue.release("w2") == 2
+    assert queue.counts() == {"pending": 1, "leased": 0, "done": 0, "failed": 1}
+    retry = queue.lease("w3", lease_seconds=10, now=102.0)
+    assert retry is not None and retry.unit_id == other.unit_id
+    queue.close()
+
+
+def test_hello_requires_token_before_sending_config(tmp_path: Path) -> None:
+    async def hello(port: int, token):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        await send_message(writer, {"op": "hello", "worker": "w", "token": token})
+        reply = await read_message(reader)
+        writer.close()
+        return reply
+
+    async def run():
+        coordinator = Coordinator(_config(), tmp_path / "queue.sqlite", token="gizli")
+        _, port = await coordinator.start()
+        rejected = await hello(port, None)
+        wrong = await hello(port, "yanlis")
+        accepted = await hello(port, "gizli")
+        coordinator._server.close()
+        coordinator.queue.close()
+        return rejected, wrong, accepted
+
+    rejected, wrong, accepted = asyncio.run(run())
+
+    assert rejected == wrong == {"ok": False, "error": "Geçersiz token."}
+    assert accepted["ok"] and accepted["config"]["name"] == "Dağıtık"
+
+
+def test_non_loopback_coordinator_requires_token(tmp_path: Path) -> None:
+    with pytest.raises(ValueError):
+        Coordinator(_config(), tmp_path / "queue.sqlite", host="0.0.0.0")
+    Coordinator(_config(), tmp_path / "queue.sqlite", host="0.0.0.0", token="gizli").queue.close()
@@ -0,0 +1,103 @@
+import asyncio
+import threading
+
+import httpx
+from rich.console import Console
+
+from scanner.core.config import ScannerConfig
+from scanner.core.events import FINDING, FINISHED, PROGRESS, STARTED, EventBroadcaster
+from scanner.core.scanner import Scanner
+
+
+def test_slow_subscriber_drops_oldest_and_late_subscriber_replays() -> None:
+    events = EventBroadcaster(subscriber_buffer=3, replay=10)
+    slow = events.subscribe()
+    for i in range(8):
+        events.publish(PROGRESS, {"done": i})
+    events.close()
+
+    assert slow.dropped == 5
+    assert [slow.get(0).data["done"] for _ in range(3)] == [5, 6, 7]
+    assert slow.get(0) is None and slow.exhausted
+
+    late = events.subscribe(after=6)
+    assert late.get(0).seq == 7
+    assert late.get(0).seq == 8
+    assert late.exhausted
+
+
+def test_get_wakes_up_on_publish_from_another_thread() -> None:
+    events = EventBroadcaster()
+    subscription = events.subscribe()
+    timer = threading.Timer(0.05, events.publish, args=(FINDING, {"check_id": "XSS-001"}))
+    timer.start()
+    event = subscription.get(timeout=2)
+    timer.join()
+    assert event is not None and event.kind == FINDING
+
+
+def test_scanner_streams_findings_while_running() -> None:
+    config = ScannerConfig.model_validate(
+        {
+            "name": "Olaylar",
+            "default_checks": ["SQLI-001"],
+            "passive_checks": [],
+            "scope": {
+                "base_url": "http://target.local",
+                "endpoints": [{"name": "Users", "path": "/api/users", "query": {"id": "1"}}],
+            },
+        }
+    )
+
+    def target(request: httpx.Request) -> httpx.Response:
+        if "%27" in str(request.url):
+            return httpx.Response(500, text="You have an error in your SQL syntax")
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        events = EventBroadcaster()
+        scanner = Scanner(
+            config,
+            max_concurrency=2,
+            console=Console(quiet=True),
+            transport=httpx.MockTransport(target),
+            events=events,
+        )
+        subscription = events.subscribe()
+        received = []
+
+        async def consume():
+            async for event in subscription:
+                received.append(event)
+
+        consumer = asyncio.create_task(consume())
+        await scanner.scan()
+        events.close()
+        await consumer
+        return received
+
+    received = asyncio.run(run())
+    kinds = [event.kind for event in received]
+    assert kinds[0] == STARTED and kinds[-1] == FINISHED
+    assert kinds.count(FINDING) == 1
+    finding = next(event for event in received if event.kind == FINDING)
+    assert finding.data["check_id"] == "SQLI-001"
+    assert received[-1].data["findings_count"] == 1
+    assert received[-2].data["done"] == 1
+
+
+def test_full_queue_drops_progress_but_never_findings() -> None:
+    events = EventBroadcaster(subscriber_buffer=3, replay=3)
+    slow = events.subscribe()
+    for i in range(6):
+        events.publish(FINDING, {"index": i})
+        events.publish(PROGRESS, {"done": i})
+    events.close()
+
+    received = [slow.get(0) for _ in range(7)]
+    assert [event.data["index"] for event in received if event.kind == FINDING] == list(range(6))
+    assert [event.data["done"] for event in received if event.kind == PROGRESS] == [5]
+    assert slow.dropped == 5 and slow.exhausted
+
+    late = events.subscribe()
+    assert [event.kind for event in iter(lambda: late.get(0), None)].count(FINDING) == 6
@@ -0,0 +1,95 @@
+from pathlib import Path
+from typing import Optional
+
+from scanner.core.finding_index import FindingIndex
+from scanner.core.fingerprint import endpoint_identity, normalize_endpoint
+from scanner.core.reporting import ScanFinding, ScanReport
+
+
+def _finding(
+    endpoint: str, severity: str = "critical", parameter: str = "query:id", target: Optional[str] = None
+) -> ScanFinding:
+    return ScanFinding(
+        check_id="SQLI-001",
+        severity=severity,
+        endpoint=endpoint,
+        summary="SQL Injection belirtisi tespit edildi",
+        description="Yanıtta SQL hata izi bulundu.",
+        evidence={"payload": "'", "parameter": parameter, "response_snippet": "SQL syntax"},
+        target=target,
+    )
+
+
+def _report(*findings: ScanFinding) -> ScanReport:
+    report = ScanReport()
+    for finding in findings:
+        report.add_finding(finding)
+    return report
+
+
+def test_endpoint_identity_uses_configured_target_without_guessing_ids() -> None:
+    assert normalize_endpoint("HTTP://Target.local:80/api/users/42/?x=1#a") == "http://target.local/api/users/42?x=1"
+    assert normalize_endpoint("POST /login") == "POST /login"
+
+    templated = _finding("http://t/api/users/42?id=%27", target="GET HTTP://T/api/users/{id}")
+    assert endpoint_identity(templated) == "GET http://t/api/users/{id}"
+    assert endpoint_identity(_finding("https://t:8443/api/orders/3f2c9a1e")) == "https://t:8443/api/orders/3f2c9a1e"
+
+
+def test_report_drops_duplicate_fingerprints() -> None:
+    report = _report(
+        _finding("http://t/api/users/1?id=%27", target="GET http://t/api/users/1"),
+        _finding("http://t/api/users/1?id=%22", target="GET http://t/api/users/1"),
+        _finding("http://t/api/users/1", parameter="json:name", target="GET http://t/api/users/1"),
+        _finding("http://t/api/users/1", target="POST http://t/api/users/1"),
+        _finding("http://t/api/users/2", target="GET http://t/api/users/2"),
+    )
+    assert len(report.findings) == 4
+    assert report.summary.duplicates == 1
+
+
+def test_index_tracks_new_recurring_and_fixed(tmp_path: Path) -> None:
+    index = FindingIndex(tmp_path / "index.sqlite")
+    users, orders = _finding("http://t/api/users/1"), _finding("http://t/api/orders/1", severity="high")
+
+    first = index.record("scan_1", "Demo", _report(users, orders))
+    assert len(first.new) == 2 and first.previous_scan is None
+
+    second = index.record("scan_2", "Demo", _report(_finding("http://t/api/users/1"), _finding("http://t/api/items")))
+    assert second.previous_scan == "scan_1"
+    assert second.recurring == [users.fingerprint]
+    assert second.fixed == [orders.fingerprint]
+
+    new_criticals = index.new_findings("Demo", min_severity="critical")
+    assert [item.endpoint for item in new_criticals] == ["http://t/api/items"]
+    assert [item.fingerprint for item in index.fixed_findings("Demo")] == [orders.fingerprint]
+    assert index.get(users.fingerprint).occurrences == 2
+    index.close()
+
+
+def test_rerun_with_same_report_path_gets_a_new_scan_id(tmp_path: Path) -> None:
+    from scanner.main import _finish
+
+    index_path, report_path = tmp_path / "index.sqlite", tmp_path / "rapor.json"
+    for _ in range(2):
+        _finish(_report(_finding("http://t/api/users/1")), report_path, "Demo", index_path, top=0)
+
+    index = FindingIndex(index_path)
+    scans = [row[0] for row in index._db.execute("SELECT scan_id FROM scans ORDER BY seq")]
+    assert len(scans) == 2 and all(scan.startswith("rapor_") for scan in scans)
+    assert index.get(_finding("http://t/api/users/1").fingerprint).occurrences == 2
+    index.close()
+
+
+def test_quiet_finish_writes_status_lines_without_rich(tmp_path: Path, monkeypatch, capsys) -> None:
+    from scanner import main
+
+    monkeypatch.setattr(main.console, "quiet", True)
+    index_path, report_path = tmp_path / "index.sqlite", tmp_path / "rapor.json"
+    main._finish(_report(_finding("http://t/api/users/1")), report_path, "Demo", index_path, top=0)
+
+    out = capsys.readouterr().out
+    assert f"rapor: {report_path}" in out
+    assert "dizin: yeni=1 tekrarlayan=0 düzelen=0 önceki=-" in out
+    assert "yeni\tcritical\tSQLI-001\thttp://t/api/users/1" in out
+    assert "[green]" not in out
@@ -0,0 +1,87 @@
+import asyncio
+import random
+
+import httpx
+from rich.console import Console
+
+from scanner.core.config import PayloadCorpusSettings, ScannerConfig
+from scanner.core.payloads import HitStats, PayloadCorpus, build_corpus, hits_path_for, plan_payloads
+from scanner.core.scanner import Scanner
+
+
+def _corpus(tmp_path, name="sqli.corpus", count=50):
+    source = tmp_path / "sqli.txt"
+    lines = ["# genel payload'lar", "' OR 1=1 -- ", "", "#! tags: mysql"]
+    lines += [f"' OR SLEEP({index}) -- " for index in range(count)]
+    lines += ["#! tags: postgres, mysql", "' OR 1=1 -- ", "'; SELECT pg_sleep(1) --"]
+    source.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return build_corpus([source], tmp_path / name)
+
+
+def test_build_deduplicates_and_reads_payloads_lazily_by_tag(tmp_path) -> None:
+    result = _corpus(tmp_path, count=3)
+    corpus = PayloadCorpus(tmp_path / "sqli.corpus")
+    try:
+        assert (result.payloads, result.duplicates, result.tags) == (5, 1, ["mysql", "postgres"])
+        assert len(corpus) == 5
+        assert corpus.payload(0) == "' OR 1=1 -- "  # sondaki boşluk korunur
+        by_tag = {tag: [corpus.payload(index) for index in corpus.iter_ids([tag])] for tag in ("mysql", "postgres")}
+        assert by_tag["postgres"] == ["' OR 1=1 -- ", "'; SELECT pg_sleep(1) --"]
+        assert len(by_tag["mysql"]) == 5
+        assert corpus.unknown_tags(["mssql", "mysql"]) == ["mssql"]
+    finally:
+        corpus.close()
+
+
+def test_hit_rate_ordering_and_sampling_keep_proven_payloads(tmp_path) -> None:
+    _corpus(tmp_path)
+    corpus = PayloadCorpus(tmp_path / "sqli.corpus")
+    stats = HitStats(hits_path_for(corpus.path))
+    proven = corpus.digest(40)
+    stats.tried(proven)
+    stats.hit(proven)
+    stats.tried(corpus.digest(0))
+    stats.save()
+
+    try:
+        reloaded = HitStats(hits_path_for(corpus.path))
+        ordered = list(plan_payloads(corpus, reloaded, PayloadCorpusSettings(path=corpus.path)))
+        assert ordered[0] == 40
+        assert ordered[-1] == 0  # denenip isabet etmeyen en sona
+        sampled = list(
+            plan_payloads(corpus, reloaded, PayloadCorpusSettings(path=corpus.path, sample=5), random.Random(1))
+        )
+        assert len(sampled) == 5 and sampled[0] == 40
+    finally:
+        corpus.close()
+
+
+def test_scan_feeds_corpus_to_check_and_learns_hit_rates(tmp_path) -> None:
+    _corpus(tmp_path)
+    config = ScannerConfig.model_validate(
+        {
+            "name": "Korpus",
+            "default_checks": ["SQLI-001"],
+            "passive_checks": [],
+            "payloads": {"SQLI-001": {"path": str(tmp_path / "sqli.corpus"), "tags": ["mysql"]}},
+            "scope": {"base_url": "http://target.local", "endpoints": [{"name": "Ara", "path": "/search", "query": {"q": "x"}}]},
+        }
+    )
+
+    def target(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("q") == "' OR SLEEP(30) -- ":
+            return httpx.Response(500, text="You have an error in your SQL syntax")
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        scanner = Scanner(config, max_concurrency=1, console=Console(quiet=True), transport=httpx.MockTransport(target))
+        report = await scanner.scan()
+        return report, scanner.http_client.request_count
+
+    first, first_requests = asyncio.run(run())
+    second, second_requests = asyncio.run(run())
+
+    assert [finding.evidence["payload"] for finding in first.findings] == ["' OR SLEEP(30) -- "]
+    assert first_requests == 32
+    assert [finding.evidence["payload"] for finding in second.findings] == ["' OR SLEEP(30) -- "]
+    assert second_requests == 1
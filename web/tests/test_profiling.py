@@ -0,0 +1,82 @@
+import asyncio
+import pstats
+import time
+
+import httpx
+from rich.console import Console
+
+from scanner.core.config import ScannerConfig
+from scanner.core.profiling import ScanProfiler, StackSampler
+from scanner.core.scanner import Scanner
+
+
+def _config() -> ScannerConfig:
+    return ScannerConfig.model_validate(
+        {
+            "name": "Profil",
+            "default_checks": ["SQLI-001", "XSS-001"],
+            "passive_checks": [],
+            "scope": {"base_url": "http://target.local", "endpoints": [{"name": "Ara", "path": "/search"}]},
+        }
+    )
+
+
+def test_profile_attributes_requests_network_and_bytes_to_units(tmp_path) -> None:
+    async def target(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.02)
+        return httpx.Response(200, text="x" * 1000)
+
+    profiler = ScanProfiler()
+
+    async def run():
+        scanner = Scanner(
+            _config(),
+            max_concurrency=2,
+            console=Console(quiet=True),
+            transport=httpx.MockTransport(target),
+            profiler=profiler,
+        )
+        return await scanner.scan()
+
+    report = asyncio.run(run())
+
+    costs = {cost.check_id: cost for cost in profiler.ranked()}
+    assert costs["SQLI-001"].requests == 4
+    assert costs["XSS-001"].requests == 1
+    assert costs["SQLI-001"].network >= 0.08
+    assert costs["SQLI-001"].wall >= costs["SQLI-001"].network
+    assert costs["XSS-001"].bytes_received >= 1000
+    assert costs["XSS-001"].bytes_sent > 0
+    assert [entry["check_id"] for entry in report.profile] == ["SQLI-001", "XSS-001"]
+
+
+def test_pstats_and_collapsed_stack_dumps(tmp_path) -> None:
+    profiler = ScanProfiler(pstats_path=tmp_path / "scan.pstats", collapsed_path=tmp_path / "scan.folded")
+
+    def busy() -> None:
+        deadline = time.perf_counter() + 0.1
+        while time.perf_counter() < deadline:
+            pass
+
+    profiler.start()
+    busy()
+    profiler.stop()
+
+    functions = {name for _, _, name in pstats.Stats(str(tmp_path / "scan.pstats")).stats}
+    assert "busy" in functions
+    lines = (tmp_path / "scan.folded").read_text(encoding="utf-8").splitlines()
+    stack, count = lines[0].rsplit(" ", 1)
+    assert stack.endswith("test_profiling:busy")
+    assert int(count) > 0
+
+
+def test_stack_sampler_can_be_restarted() -> None:
+    sampler = StackSampler(interval=0.001)
+    for _ in range(2):
+        before = sum(sampler.stacks.values()) + sampler.idle
+        sampler.start()
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            sum(range(1000))
+        sampler.stop()
+        assert sum(sampler.stacks.values()) + sampler.idle > before
@@ -0,0 +1,103 @@
+import asyncio
+import html
+
+import httpx
+import pytest
+from rich.console import Console
+
+from scanner.core.config import HttpSettings, ScannerConfig
+from scanner.core.http_client import HttpClient
+from scanner.core.replay import RecordingTransport, ReplayMiss, ReplayTransport, index_path_for
+from scanner.core.scanner import Scanner
+
+
+def _config() -> ScannerConfig:
+    return ScannerConfig.model_validate(
+        {
+            "name": "Replay",
+            "default_checks": ["XSS-001", "SQLI-001"],
+            "passive_checks": [],
+            "scope": {
+                "base_url": "http://target.local",
+                "endpoints": [
+                    {"name": "Search", "path": "/search"},
+                    {"name": "Safe", "path": "/safe"},
+                ],
+            },
+        }
+    )
+
+
+def _target(request: httpx.Request) -> httpx.Response:
+    query = request.url.params.get("q", "")
+    if request.url.path == "/search":
+        if any("'" in value for value in request.url.params.values()) and "<" not in query:
+            return httpx.Response(500, text="You have an error in your SQL syntax")
+        return httpx.Response(200, text=f"<p>{query}</p>" + "x" * 400)
+    return httpx.Response(200, text=f"<p>{html.escape(query)}</p>")
+
+
+def _scan(transport: httpx.AsyncBaseTransport):
+    async def run():
+        scanner = Scanner(_config(), max_concurrency=2, console=Console(quiet=True), transport=transport)
+        return await scanner.scan()
+
+    return asyncio.run(run())
+
+
+def _findings(report):
+    return sorted((f.check_id, f.endpoint, f.text.text_id, repr(f.evidence)) for f in report.findings)
+
+
+def test_replay_reproduces_recorded_scan_without_network(tmp_path) -> None:
+    archive = tmp_path / "scan.bin"
+    recorded = _scan(RecordingTransport(archive, inner=httpx.MockTransport(_target)))
+
+    replay = ReplayTransport(archive)
+    replayed = _scan(replay)
+
+    assert {f.check_id for f in recorded.findings} == {"XSS-001", "SQLI-001"}
+    # XSS token'ı arşiv tohumundan türetildiği için kanıt birebir aynı.
+    assert _findings(replayed) == _findings(recorded)
+    assert replay.misses == 0
+    assert replay.served == len(replay) == recorded.summary.total_requests
+
+
+def test_unknown_request_is_a_non_retried_miss(tmp_path) -> None:
+    archive = tmp_path / "empty.bin"
+
+    async def run():
+        await RecordingTransport(archive, inner=httpx.MockTransport(_target)).aclose()
+        replay = ReplayTransport(archive)
+        client = HttpClient(HttpSettings(max_retries=3), transport=replay)
+        try:
+            with pytest.raises(ReplayMiss):
+                await client.request("GET", "http://target.local/search")
+        finally:
+            await client.close()
+        return replay
+
+    replay = asyncio.run(run())
+    assert replay.misses == 1
+
+
+def test_interrupted_recording_is_replayable(tmp_path) -> None:
+    archive = tmp_path / "crash.bin"
+
+    async def run():
+        recorder = RecordingTransport(archive, inner=httpx.MockTransport(_target))
+        async with httpx.AsyncClient(transport=recorder) as client:
+            await client.get("http://target.local/search?q=abc")
+            await client.get("http://target.local/safe?q=<b>")
+            # aclose() çağrılmadan (çökme gibi) arşive yarım bir dizin satırı düşer.
+            with index_path_for(archive).open("a", encoding="utf-8") as index:
+                index.write('{"key":"yar')
+            replay = ReplayTransport(archive)
+            response = await replay.handle_async_request(httpx.Request("GET", "http://target.local/search?q=abc"))
+            await response.aread()
+            await replay.aclose()
+            return replay, response
+
+    replay, response = asyncio.run(run())
+    assert len(replay) == 2
+    assert response.text.startswith("<p>abc</p>")
@@ -0,0 +1,79 @@
+import gzip
+import json
+import os
+
+from flask import Flask, request
+
+from web import report_cache
+from web.report_cache import ReportCache, json_response, payload_response
+
+
+def _write_report(path, findings: int) -> None:
+    payload = {
+        "summary": {"stats": {"low": findings}},
+        "findings": [{"check_id": "HDR-001", "endpoint": f"http://t/api/{i}", "evidence": "x" * 64} for i in range(findings)],
+    }
+    path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def test_cache_reuses_payload_until_file_changes(tmp_path) -> None:
+    report_path = tmp_path / "scan_1.json"
+    _write_report(report_path, 40)
+    cache = ReportCache(max_entries=2)
+
+    first = cache.get(report_path)
+    assert cache.get(report_path) is first
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert first.findings_count == 40
+    assert json.loads(gzip.decompress(first.payload.encoded["gzip"])) == json.loads(first.payload.body)
+
+    _write_report(report_path, 41)
+    stat = report_path.stat()
+    os.utime(report_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    second = cache.get(report_path)
+    assert second.findings_count == 41
+    assert second.payload.etag() != first.payload.etag()
+    assert cache.summary(report_path) == (second.summary, 41)
+
+
+def test_conditional_and_compressed_responses(tmp_path) -> None:
+    report_path = tmp_path / "scan_2.json"
+    _write_report(report_path, 40)
+    payload = ReportCache().get(report_path).payload
+    app = Flask(__name__)
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip, deflate"}):
+        response = payload_response(payload, request)
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    etag = response.headers["ETag"]
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip", "If-None-Match": etag}):
+        assert payload_response(payload, request).status_code == 304
+
+    with app.test_request_context(headers={"Accept-Encoding": "identity", "If-None-Match": '"other"'}):
+        plain = payload_response(payload, request)
+    assert plain.status_code == 200
+    assert "Content-Encoding" not in plain.headers
+    assert plain.get_data() == payload.body
+
+
+def test_json_response_compresses_only_the_negotiated_encoding(monkeypatch) -> None:
+    compressed = []
+    real_compress = report_cache._compress
+    monkeypatch.setattr(
+        report_cache, "_compress", lambda body, encoding: compressed.append(encoding) or real_compress(body, encoding)
+    )
+    data = {"reports": [{"id": f"scan_{i}", "findings_count": i} for i in range(100)]}
+    app = Flask(__name__)
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip"}):
+        response = json_response(data, request)
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(response.get_data())) == data
+    assert compressed == ["gzip"]
+
+    with app.test_request_context(headers={"Accept-Encoding": "gzip", "If-None-Match": response.headers["ETag"]}):
+        assert json_response(data, request).status_code == 304
+    assert compressed == ["gzip"]
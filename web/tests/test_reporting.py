@@ -0,0 +1,100 @@
+import io
+import json
+
+import pytest
+from rich.console import Console
+
+from scanner.core import reporting
+from scanner.core.reporting import ScanFinding, ScanReport, evidence_preview
+from scanner.checks import SQLInjectionCheck
+
+
+def _legacy_payload(endpoint: str, snippet: str) -> dict:
+    return {
+        "check_id": "SQLI-001",
+        "severity": "critical",
+        "endpoint": endpoint,
+        "summary": "SQL Injection belirtisi tespit edildi",
+        "description": (
+            "Sunucu, enjekte edilen payload'a hatalı yanıt verdi. Sunucu hata döndürdü. "
+            "Bu durum parametrik sorgular kullanılmadığına işaret eder."
+        ),
+        "evidence": {"payload": "' OR 1=1 --", "response_snippet": snippet},
+        "remediation": "Parametreleri parametrik sorgularla kullanın ve giriş doğrulaması uygulayın.",
+        "references": ["https://owasp.org/www-community/attacks/SQL_Injection"],
+    }
+
+
+def test_compact_findings_serialize_like_plain_records() -> None:
+    check = SQLInjectionCheck()
+    snippet = "SQLSTATE[HY000]: " + "x" * 483
+    report = ScanReport()
+    for index in range(3):
+        url = "".join(["http://t/api/items/", str(index % 2)])
+        parameter = "query:id" if index == 2 else None
+        report.add_finding(check._finding("' OR 1=1 --", url, snippet + "tail", "server_error", parameter))
+
+    first, second, third = report.findings
+    assert first.serialize() == _legacy_payload("http://t/api/items/0", snippet)
+    assert ScanFinding.from_dict(json.loads(json.dumps(first.serialize()))) == first
+
+    assert first.text is second.text is check.texts["server_error"]
+    assert first.endpoint is third.endpoint
+    assert first.evidence["response_snippet"] is second.evidence["response_snippet"]
+    assert not hasattr(first, "__dict__")
+
+
+def test_ad_hoc_text_is_shared_within_report_and_not_cataloged() -> None:
+    catalog_size = len(reporting._TEXT_CATALOG)
+    report = ScanReport()
+    for endpoint in ("http://t/x", "http://t/y"):
+        data = _legacy_payload(endpoint, "short")
+        data["summary"] = "Koordinatörden gelen ad-hoc metin"
+        report.add_finding(ScanFinding.from_dict(data))
+
+    first, second = report.findings
+    assert first.text is second.text
+    assert first.text.text_id.startswith("adhoc:")
+    assert len(reporting._TEXT_CATALOG) == catalog_size
+
+
+def test_evidence_is_read_only() -> None:
+    finding = ScanFinding.from_dict(_legacy_payload("http://t/x", "short"))
+
+    assert finding.evidence is finding.evidence
+    with pytest.raises(TypeError):
+        finding.evidence["payload"] = "değişti"  # type: ignore[index]
+    assert finding.serialize()["evidence"] == {"payload": "' OR 1=1 --", "response_snippet": "short"}
+
+
+def test_render_is_summary_first_and_limited_to_top() -> None:
+    report = ScanReport()
+    for i in range(30):
+        severity = "critical" if i == 29 else "low"
+        report.add_finding(
+            ScanFinding(
+                check_id="HDR-001",
+                severity=severity,
+                endpoint=f"http://t/api/items/{i}",
+                summary="Eksik güvenlik başlıkları",
+                description="d",
+                evidence={"missing": [f"X-Header-{n}" for n in range(40)], "note": "y" * 1000},
+            )
+        )
+
+    assert [f.severity for f in report.ranked_findings()[:2]] == ["critical", "low"]
+    preview = evidence_preview(report.findings[0].evidence)
+    assert len(preview) <= 250 and preview.startswith("missing: X-Header-0")
+
+    console = Console(record=True, width=200)
+    report.render(console, top=5)
+    output = console.export_text()
+    assert output.index("Özet") < output.index("Bulgular (5/30)")
+    assert "25 bulgu daha gösterilmedi" in output
+
+    stream = io.StringIO()
+    report.render_plain(stream, top=3)
+    lines = stream.getvalue().splitlines()
+    assert lines[0].startswith("özet: critical=1")
+    assert lines[1].startswith("critical\tHDR-001")
+    assert lines[-1] == "... 27 bulgu daha"
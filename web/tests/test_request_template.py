@@ -0,0 +1,87 @@
+import tracemalloc
+from copy import deepcopy
+
+import httpx
+
+from scanner.core.config import Endpoint, Header
+from scanner.core.request_template import JSON, QUERY, InsertionPoint, RequestTemplate
+
+
+def _endpoint() -> Endpoint:
+    return Endpoint(
+        name="Search",
+        method="post",
+        path="/api/search",
+        query={"search": "test", "page": 1},
+        json={"filter": "x" * 256, "tags": ["a", "b"], "nested": {"limit": 10}},
+        headers=[Header(name="X-Trace", value="1")],
+    )
+
+
+def test_render_substitutes_only_touched_sections() -> None:
+    template = RequestTemplate.from_endpoint("http://localhost:8000/", _endpoint(), [("Accept", "application/json")])
+
+    base = template.render()
+    assert base["method"] == "POST"
+    assert base["url"] == "http://localhost:8000/api/search?search=test&page=1"
+    assert base["headers"] == {"Accept": "application/json", "X-Trace": "1"}
+
+    probe = template.render({InsertionPoint(QUERY, "search"): "' OR 1=1 --"})
+    assert probe["url"] == "http://localhost:8000/api/search?search=%27+OR+1%3D1+--&page=1"
+    assert probe["json"] is base["json"]
+    assert probe["headers"] is base["headers"]
+
+    body = template.render({InsertionPoint(JSON, "filter"): "<svg>"})
+    assert body["json"]["filter"] == "<svg>"
+    assert body["json"]["nested"] is template.json["nested"]
+    assert template.json["filter"] == "x" * 256
+
+    request = httpx.Request(**body)
+    assert request.url.params["search"] == "test"
+
+
+def test_primary_points_match_legacy_payload_placement() -> None:
+    template = RequestTemplate("GET", "http://localhost/api", form={"user": "a", "pass": "b"})
+    assert template.primary_points() == (
+        InsertionPoint(QUERY, "probe"),
+        InsertionPoint("form", "user"),
+    )
+
+    kwargs = template.render({point: "x y" for point in template.primary_points()})
+    assert kwargs["url"] == "http://localhost/api?probe=x+y"
+    assert kwargs["content"] == b"user=x+y&pass=b"
+    assert kwargs["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+def _legacy_build(request_kwargs: dict, payload: str) -> dict:
+    kwargs = deepcopy(request_kwargs)
+    params = kwargs.get("params") or {}
+    params[next(iter(params))] = payload
+    kwargs["params"] = params
+    json_body = kwargs["json"]
+    json_body[next(iter(json_body))] = payload
+    return kwargs
+
+
+def _allocated(build, rounds: int) -> int:
+    tracemalloc.start()
+    try:
+        kept = [build(i) for i in range(rounds)]
+        current, _peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    assert len(kept) == rounds
+    return current
+
+
+def test_payload_generation_allocates_less_than_deepcopy() -> None:
+    endpoint = _endpoint()
+    template = RequestTemplate.from_endpoint("http://localhost:8000", endpoint)
+    legacy_kwargs = template.as_kwargs()
+    points = template.primary_points()
+    payloads = [f"' OR {i}={i} --" for i in range(2000)]
+
+    legacy = _allocated(lambda i: _legacy_build(legacy_kwargs, payloads[i]), len(payloads))
+    templated = _allocated(lambda i: template.render({point: payloads[i] for point in points}), len(payloads))
+
+    assert templated < legacy
@@ -0,0 +1,57 @@
+import httpx
+
+from scanner.core.response import ScanResponse
+
+
+def _raw(text: str = "", headers=None) -> httpx.Response:
+    return httpx.Response(200, text=text, headers=headers, request=httpx.Request("GET", "http://target.local/"))
+
+
+def test_of_reuses_wrapper_stored_on_raw_response() -> None:
+    raw = _raw("ok")
+    wrapped = ScanResponse.of(raw)
+
+    assert ScanResponse.of(raw) is wrapped
+    assert ScanResponse.of(wrapped) is wrapped
+    assert raw.extensions["scanner.scan_response"] is wrapped
+    assert ScanResponse.of(_raw("ok")) is not wrapped
+
+
+def test_memo_is_computed_once_and_shared_across_checks() -> None:
+    raw = _raw("Hata: SQL syntax")
+    calls = []
+
+    def analyze() -> bool:
+        calls.append(1)
+        return "sql syntax" in ScanResponse.of(raw).folded
+
+    # İki farklı kontrol aynı ham yanıtı kendi tarafında sarmalar.
+    first = ScanResponse.of(raw).memo("sql_error", analyze)
+    second = ScanResponse.of(raw).memo("sql_error", analyze)
+
+    assert first is True and second is True
+    assert calls == [1]
+    assert ScanResponse.of(raw).has_memo("sql_error")
+    assert not ScanResponse.of(raw).has_memo("other")
+
+
+def test_header_default_and_missing_semantics() -> None:
+    response = ScanResponse.of(_raw(headers={"X-Frame-Options": "DENY", "X-Empty": ""}))
+
+    assert response.header("x-frame-options") == "DENY"
+    assert response.header("X-FRAME-OPTIONS") == "DENY"
+    assert response.header("Content-Security-Policy") is None
+    assert response.header("Content-Security-Policy", "") == ""
+    assert response.header("X-Empty", "varsayılan") == ""  # boş değer de değerdir
+    assert response.has_header("x-empty")
+    assert not response.has_header("content-security-policy")
+
+
+def test_json_on_non_json_body_is_none_and_cached() -> None:
+    html = ScanResponse.of(_raw("<html>değil</html>"))
+    data = ScanResponse.of(_raw('{"user": "admin"}'))
+
+    assert html.json() is None
+    assert html.json() is None
+    assert data.json() == {"user": "admin"}
+    assert data.json() is data.json()
@@ -0,0 +1,88 @@
+import asyncio
+
+import httpx
+import pytest
+
+from scanner.core.config import HttpSettings
+from scanner.core.http_client import HttpClient
+from scanner.core.retry import RetryBudget
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_budget_is_reserve_plus_ratio_of_successes_in_window() -> None:
+    clock = _Clock()
+    budget = RetryBudget(ratio=0.1, window=10, reserve=2, clock=clock)
+
+    assert [budget.try_acquire() for _ in range(3)] == [True, True, False]
+    for _ in range(10):
+        budget.record_success()
+    assert [budget.try_acquire() for _ in range(2)] == [True, False]
+
+    clock.now += 10  # eski kovalar pencereden düşer
+    assert budget.try_acquire() and budget.try_acquire() and not budget.try_acquire()
+
+
+def _client(handler, **settings) -> HttpClient:
+    client = HttpClient(HttpSettings(**settings), transport=httpx.MockTransport(handler))
+    client.retry.base_delay = 0.001
+    return client
+
+
+def test_failing_target_only_gets_the_budgeted_retries() -> None:
+    calls = []
+
+    def down(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        raise httpx.ConnectError("bağlantı reddedildi", request=request)
+
+    client = _client(down, max_retries=3, retry_budget_reserve=5)
+
+    async def run():
+        try:
+            return await asyncio.gather(
+                *(client.request("GET", "http://target.local/") for _ in range(30)), return_exceptions=True
+            )
+        finally:
+            await client.close()
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, httpx.ConnectError) for result in results)
+    assert len(calls) == 35  # 30 istek + bütçedeki 5 yeniden deneme (3 × 30 yerine)
+    stats = client.retry.stats()
+    assert stats["retries"] == 5
+    assert stats["denied_by_budget"] == 30 - stats["gave_up"]
+
+
+@pytest.mark.parametrize("retry, expected_calls", [(True, 2), (False, 1)])
+def test_transient_error_is_retried_unless_disabled(retry, expected_calls) -> None:
+    calls = []
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            raise httpx.ReadTimeout("zaman aşımı", request=request)
+        return httpx.Response(200, text="ok")
+
+    client = _client(flaky)
+
+    async def run():
+        try:
+            return await client.request("GET", "http://target.local/", retry=retry)
+        finally:
+            await client.close()
+
+    if retry:
+        assert asyncio.run(run()).status_code == 200
+        assert client.retry.stats()["retry_seconds"] > 0
+    else:
+        with pytest.raises(httpx.ReadTimeout):
+            asyncio.run(run())
+    assert len(calls) == expected_calls
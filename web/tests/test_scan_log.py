@@ -0,0 +1,65 @@
+import json
+
+from scanner.core.reporting import ScanReport
+from scanner.core.scan_log import DEBUG, ScanLog
+
+
+def test_ring_buffer_samples_and_bounds_memory() -> None:
+    log = ScanLog(capacity=10, level=DEBUG, sampling={DEBUG: 5})
+    for i in range(100):
+        log.debug("yanıt %d", i, endpoint="GET /api")
+    for i in range(30):
+        log.error("hata: %s", i, endpoint="GET /api", check_id="SQLI-001")
+
+    assert log.counts[DEBUG] == 100
+    assert log.sampled_out == 80
+    assert len(log.events()) == 10
+    assert [event.message for event in log.events("error")][-1] == "hata: 29"
+    assert log.evicted == 40
+    assert log.events()[-1].format() == "GET /api -> SQLI-001 hata: 29"
+
+
+def test_level_threshold_skips_event_construction() -> None:
+    log = ScanLog()
+    log.debug("asla %s", object())
+    assert log.last_seq == 0
+    assert not log.counts
+
+
+def test_report_references_streamed_log_file(tmp_path) -> None:
+    log_path = tmp_path / "scan.log.jsonl"
+    report = ScanReport(log=ScanLog(capacity=5, path=log_path))
+    for i in range(20):
+        report.log.info("bulgu üretti.", endpoint=f"GET /items/{i}", check_id="XSS-001")
+    report.add_log("Eski biçim mesaj")
+    report.log.close()
+
+    lines = log_path.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 21
+    assert json.loads(lines[0])["endpoint"] == "GET /items/0"
+    assert report.log_messages[-1] == "Eski biçim mesaj"
+
+    report_path = tmp_path / "report.json"
+    report.write_json(report_path)
+    logs = json.loads(report_path.read_text(encoding="utf-8"))["logs"]
+    assert logs["file"] == str(log_path)
+    assert logs["counts"]["info"] == 21
+    assert len(logs["tail"]) == 5
+
+
+def test_warnings_reach_the_file_before_close(tmp_path) -> None:
+    path = tmp_path / "scan.log.jsonl"
+    log = ScanLog(path=path)
+    log.info("başladı")
+    log.warning("hedef yavaş: %s sn", 3)
+
+    lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert [line["level"] for line in lines] == ["info", "warning"]
+    log.close()
+
+
+def test_ingest_falls_back_to_info_for_unknown_level() -> None:
+    log = ScanLog()
+    log.ingest({"level": None, "message": "işçi olayı"})
+    log.ingest({"level": "error", "message": "işçi hatası"})
+    assert [event.level for event in log.events()] == ["info", "error"]
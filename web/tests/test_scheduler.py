@@ -0,0 +1,91 @@
+import asyncio
+
+import httpx
+from rich.console import Console
+
+from scanner.core.config import Endpoint, ScannerConfig
+from scanner.core.scanner import Scanner
+from scanner.core.scheduler import PriorityScheduler
+from scanner.checks import ReflectedXSSCheck, SQLInjectionCheck
+
+
+def _config() -> ScannerConfig:
+    return ScannerConfig.model_validate(
+        {
+            "name": "Öncelik",
+            "default_checks": ["XSS-001", "SQLI-001"],
+            "passive_checks": [],
+            "scope": {
+                "base_url": "http://target.local",
+                "endpoints": [
+                    {"name": "Health", "path": "/api/health", "risk_override": 1},
+                    {"name": "Admin", "path": "/api/admin", "risk_override": 9},
+                    {"name": "Items", "path": "/api/items"},
+                ],
+            },
+        }
+    )
+
+
+def test_scheduler_orders_by_risk_severity_and_weight() -> None:
+    now = [0.0]
+    scheduler = PriorityScheduler(time_budget=10, clock=lambda: now[0])
+    low = Endpoint(name="Low", path="/low", risk_override=2)
+    high = Endpoint(name="High", path="/high", risk_override=8)
+    scheduler.push(0, low, SQLInjectionCheck())
+    scheduler.push(1, high, ReflectedXSSCheck())
+    scheduler.push(0, low, ReflectedXSSCheck(weight=2))
+    scheduler.push(1, high, SQLInjectionCheck())
+
+    order = [(unit.endpoint.name, unit.check.check_id) for unit in iter(lambda: scheduler.pop("fast"), None)]
+    assert order == [("High", "SQLI-001"), ("High", "XSS-001"), ("Low", "XSS-001"), ("Low", "SQLI-001")]
+
+    scheduler.push(0, low, SQLInjectionCheck())
+    now[0] = 10
+    assert scheduler.pop("fast") is None
+    assert [unit.describe()["endpoint"] for unit in scheduler.pending()] == ["GET /low"]
+
+
+def test_scan_runs_high_risk_endpoints_first() -> None:
+    seen = []
+
+    def target(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        scanner = Scanner(
+            _config(), max_concurrency=1, console=Console(quiet=True), transport=httpx.MockTransport(target)
+        )
+        return await scanner.scan()
+
+    report = asyncio.run(run())
+
+    first_seen = list(dict.fromkeys(seen))
+    assert first_seen == ["/api/admin", "/api/items", "/api/health"]
+    assert report.summary.coverage["ratio"] == 1.0
+    assert report.skipped == []
+
+
+def test_time_budget_skips_unstarted_pairs() -> None:
+    async def run():
+        scanner = Scanner(
+            _config(),
+            max_concurrency=2,
+            console=Console(quiet=True),
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, text="ok")),
+            time_budget=0,
+        )
+        return await scanner.scan()
+
+    report = asyncio.run(run())
+
+    assert report.summary.coverage == {
+        "planned": 6,
+        "completed": 0,
+        "skipped": 6,
+        "ratio": 0.0,
+        "time_budget": 0,
+    }
+    assert report.skipped[0] == {"endpoint": "GET /api/admin", "check_id": "SQLI-001", "priority": 47.5}
+    assert report.summary.total_requests == 0
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from scanner.core.config import AuthCredential, HttpSettings, SessionSettings
+from scanner.core.http_client import HttpClient
+from scanner.core.session import SessionManager, _dig
+
+
+class _Target:
+    """Giriş yapınca sıradaki token'ı veren, `/api/me` için geçerli token isteyen sahte hedef."""
+
+    def __init__(self) -> None:
+        self.logins = 0
+        self.valid = None
+        self.bodies = []
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/login":
+            self.logins += 1
+            self.bodies.append(json.loads(request.content))
+            await asyncio.sleep(0.01)
+            self.valid = f"t{self.logins}"
+            return httpx.Response(200, json={"data": {"access_token": self.valid}})
+        await asyncio.sleep(0.001)
+        if request.headers.get("authorization") != f"Bearer {self.valid}":
+            return httpx.Response(401, text="yetkisiz")
+        return httpx.Response(200, json={"user": "admin"})
+
+
+def _client(target: _Target, **overrides) -> HttpClient:
+    settings = SessionSettings(
+        login_path="/api/login",
+        login_json={"username": "{username}", "password": "{password}"},
+        token_json="data.access_token",
+        **overrides,
+    )
+    client = HttpClient(HttpSettings(), transport=httpx.MockTransport(target))
+    client.session = SessionManager(
+        settings, "http://target.local", [AuthCredential(username="admin", password="admin123")]
+    )
+    return client
+
+
+def _gather(client: HttpClient, count: int):
+    async def run():
+        try:
+            return await asyncio.gather(
+                *(client.request("GET", "http://target.local/api/me") for _ in range(count)),
+                return_exceptions=True,
+            )
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+def test_logs_in_once_for_concurrent_requests() -> None:
+    target = _Target()
+    responses = _gather(_client(target), 20)
+
+    assert target.logins == 1
+    assert target.bodies == [{"username": "admin", "password": "admin123"}]
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_expired_token_is_refreshed_once() -> None:
+    target = _Target()
+    client = _client(target, min_refresh_interval=0)
+
+    async def run():
+        try:
+            await client.request("GET", "http://target.local/api/me")
+            target.valid = "revoked"  # sunucu tarafında oturum düştü
+            return await asyncio.gather(*(client.request("GET", "http://target.local/api/me") for _ in range(20)))
+        finally:
+            await client.close()
+
+    responses = asyncio.run(run())
+
+    assert target.logins == 2
+    assert client.session.generation == 2
+    assert all(response.status_code == 200 for response in responses)
+
+
+def test_persistent_401_does_not_cause_a_login_storm() -> None:
+    target = _Target()
+
+    async def always_denied(request: httpx.Request) -> httpx.Response:
+        response = await target(request)
+        return response if request.url.path == "/api/login" else httpx.Response(401)
+
+    client = _client(target, min_refresh_interval=60)
+    client._transport = httpx.MockTransport(always_denied)
+    results = _gather(client, 20)
+
+    assert target.logins == 1
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+def test_login_endpoint_requests_bypass_the_session() -> None:
+    target = _Target()
+    client = _client(target)
+
+    async def run():
+        try:
+            return await client.request("POST", "http://target.local/api/login", json={"username": "x", "password": "y"})
+        finally:
+            await client.close()
+
+    asyncio.run(run())
+    assert target.logins == 1
+    assert client.session.generation == 0
+
+
+@pytest.mark.parametrize("path, expected", [("data.access_token", "abc"), ("items.0.id", "7"), ("missing.key", None)])
+def test_token_path(path, expected) -> None:
+    value = _dig({"data": {"access_token": "abc"}, "items": [{"id": 7}]}, path)
+    assert (str(value) if value is not None else None) == expected
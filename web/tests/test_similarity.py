@@ -0,0 +1,57 @@
+import asyncio
+
+import httpx
+
+from scanner.core.response import ScanResponse
+from scanner.core.similarity import ResponseSignature, SignatureBaselines, minhash_sketch, signature
+
+_PAGE = " ".join(f"ürün{index} açıklama{index} fiyat{index}" for index in range(200))
+
+
+def _response(status: int, text: str) -> ScanResponse:
+    return ScanResponse.of(httpx.Response(status, text=text, request=httpx.Request("GET", "http://target.local/")))
+
+
+def test_similar_pages_match_and_different_pages_do_not() -> None:
+    base = signature(_response(200, _PAGE + " zaman 1712"))
+    dynamic = signature(_response(200, _PAGE + " zaman 1713"))
+    other = signature(_response(200, " ".join(f"kayıt{index} bulunamadı" for index in range(300))))
+
+    assert base.similarity(dynamic) >= 0.9
+    assert base.matches(dynamic)
+    assert base.similarity(other) < 0.2
+    assert not base.matches(other)
+    assert not base.matches(signature(_response(500, _PAGE)))
+
+
+def test_sketch_is_bounded_and_signature_is_memoized() -> None:
+    response = _response(200, _PAGE)
+
+    assert len(minhash_sketch(_PAGE)) == 64
+    assert signature(response) is signature(response)
+    assert ResponseSignature(200, 0, ()).similarity(ResponseSignature(200, 0, ())) == 1.0
+
+
+def test_baseline_is_measured_once_and_tracks_page_stability() -> None:
+    sent = []
+
+    async def send() -> ScanResponse:
+        sent.append(1)
+        await asyncio.sleep(0.01)
+        return _response(200, _PAGE + f" istek{len(sent)}")
+
+    async def run():
+        baselines = SignatureBaselines()
+        results = await asyncio.gather(*(baselines.get("GET /urun", send) for _ in range(10)))
+        return baselines, results
+
+    baselines, results = asyncio.run(run())
+
+    assert len(sent) == 2  # kararlılık için iki örnek, eşzamanlı çağıranlar paylaşır
+    assert all(result is results[0] for result in results)
+    baseline = baselines.cached("GET /urun")
+    assert baseline is results[0]
+    assert 0.9 <= baseline.stability <= 1.0
+    assert not baseline.differs(signature(_response(200, _PAGE)))
+    assert baseline.differs(signature(_response(200, "boş")))
+    assert baseline.differs(signature(_response(404, _PAGE)))
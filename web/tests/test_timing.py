@@ -0,0 +1,100 @@
+import asyncio
+
+import httpx
+
+from scanner.core.config import HttpSettings
+from scanner.core.http_client import HttpClient
+from scanner.core.request_template import RequestTemplate
+from scanner.core.timing import BaselineCache
+from scanner.checks import CheckContext, TimeBasedSQLInjectionCheck
+
+
+class _FastProbe(TimeBasedSQLInjectionCheck):
+    delay_seconds = 0.2
+
+
+def _context(handler) -> CheckContext:
+    template = RequestTemplate("GET", "http://target.local/api/items", query={"id": "1"})
+    return CheckContext(
+        base_url="http://target.local",
+        endpoint="/api/items",
+        method="GET",
+        template=template,
+        metadata={},
+        http_client=HttpClient(HttpSettings(), transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_time_based_probe_detects_delay_against_baseline() -> None:
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(str(request.url))
+        if "SLEEP" in request.url.params["id"]:
+            await asyncio.sleep(0.2)
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        context = _context(handler)
+        try:
+            return await _FastProbe().execute(context)
+        finally:
+            await context.http_client.close()
+
+    finding = asyncio.run(run())
+
+    assert finding is not None
+    assert finding.evidence["payload"] == "' OR SLEEP(0.2) --"
+    assert finding.evidence["parameter"] == "query:id"
+    assert all(value >= 160 for value in finding.evidence["observed_ms"])
+    # 5 taban örneği + WAITFOR + SLEEP probu + doğrulama
+    assert len(requests) == 8
+
+
+def test_uniformly_slow_endpoint_is_not_reported() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, text="ok")
+
+    async def run():
+        context = _context(handler)
+        try:
+            return await _FastProbe().execute(context)
+        finally:
+            await context.http_client.close()
+
+    assert asyncio.run(run()) is None
+
+
+def test_unreachable_endpoint_is_skipped_without_error() -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("bağlantı reddedildi", request=request)
+
+    async def run():
+        context = _context(handler)
+        context.http_client.retry.max_retries = 0
+        try:
+            return await _FastProbe().execute(context)
+        finally:
+            await context.http_client.close()
+
+    assert asyncio.run(run()) is None
+
+
+def test_baseline_is_measured_once_for_concurrent_callers() -> None:
+    calls = 0
+
+    async def sample() -> float:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 0.05
+
+    async def run():
+        cache = BaselineCache(samples=3)
+        return await asyncio.gather(*(cache.get("GET http://t/api", sample) for _ in range(4)))
+
+    baselines = asyncio.run(run())
+    assert calls == 3
+    assert all(baseline is baselines[0] for baseline in baselines)
+    assert baselines[0].median == 0.05
@@ -2,14 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
+import time
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request, stream_with_context
 from flask_cors import CORS
 
 from scanner.core.config import load_scanner_config
+from scanner.core.events import EventBroadcaster
+from scanner.core.finding_index import FindingIndex
 from scanner.core.scanner import Scanner
+from web.report_cache import ReportCache, json_response, payload_response
 from rich.console import Console
 
 app = Flask(__name__)
@@ -17,6 +23,8 @@ CORS(app)
 
 REPORTS_DIR = Path("reports")
 REPORTS_DIR.mkdir(exist_ok=True)
+INDEX_PATH = REPORTS_DIR / "findings-index.sqlite"
+REPORT_CACHE = ReportCache()
 
 console = Console()
 
@@ -26,9 +34,56 @@ def index():
     return render_template("index.html")
 
 
+@dataclass
+class ScanJob:
+    scan_id: str
+    config_name: str
+    events: EventBroadcaster
+    thread: Optional[threading.Thread] = None
+    status: str = "running"
+
+
+SCAN_JOBS: Dict[str, ScanJob] = {}
+MAX_FINISHED_JOBS = 16
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+def _run_scan_job(job: ScanJob, config, report_path: Path) -> None:
+    """Taramayı kendi olay döngüsünde çalıştır; ilerleme `job.events` üzerinden yayınlanır."""
+    try:
+        scanner = Scanner(config=config, max_concurrency=8, console=console, events=job.events)
+        report = asyncio.run(scanner.scan())
+        
+        # Raporu kaydet
+        report.write_json(report_path)
+        index = FindingIndex(INDEX_PATH)
+        try:
+            delta = index.record(job.scan_id, config.name, report)
+        finally:
+            index.close()
+        
+        job.status = "completed"
+        job.events.publish("saved", {
+            "report_id": job.scan_id,
+            "findings_count": len(report.findings),
+            "index": delta.serialize(),
+        })
+    except Exception as e:
+        job.status = "failed"
+        job.events.publish("failed", {"error": str(e)})
+    finally:
+        job.events.close()
+
+
+def _prune_jobs() -> None:
+    finished = [job_id for job_id, job in SCAN_JOBS.items() if job.status != "running"]
+    for job_id in finished[:-MAX_FINISHED_JOBS]:
+        SCAN_JOBS.pop(job_id, None)
+
+
 @app.route("/api/scan", methods=["POST"])
 def start_scan():
-    """Yeni bir tarama başlat"""
+    """Yeni bir taramayı arka planda başlat; ilerleme /api/scan/<id>/events üzerinden akar"""
     data = request.json
     config_path = data.get("config_path")
     
@@ -39,35 +94,60 @@ def start_scan():
     if not config_file.exists():
         return jsonify({"error": f"Konfigürasyon dosyası bulunamadı: {config_path}"}), 404
     
-    # Asenkron taramayı başlat
-    import time
-    report_id = f"scan_{int(time.time())}"
-    report_path = REPORTS_DIR / f"{report_id}.json"
-    
     try:
         config = load_scanner_config(config_file)
-        scanner = Scanner(config=config, max_concurrency=8, console=console)
-        
-        # Asenkron fonksiyonu çalıştır
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        report = loop.run_until_complete(scanner.scan())
-        
-        # Raporu kaydet
-        report.write_json(report_path)
-        
-        return jsonify({
-            "success": True,
-            "report_id": report_id,
-            "summary": report.summary.serialize(),
-            "findings_count": len(report.findings)
-        })
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    
+    started = int(time.time())
+    while f"scan_{started}" in SCAN_JOBS or (REPORTS_DIR / f"scan_{started}.json").exists():
+        started += 1
+    scan_id = f"scan_{started}"
+    report_path = REPORTS_DIR / f"{scan_id}.json"
+    job = ScanJob(scan_id=scan_id, config_name=config.name, events=EventBroadcaster())
+    job.thread = threading.Thread(target=_run_scan_job, args=(job, config, report_path), daemon=True)
+    _prune_jobs()
+    SCAN_JOBS[scan_id] = job
+    job.thread.start()
+    
+    return jsonify({
+        "success": True,
+        "scan_id": scan_id,
+        "report_id": scan_id,
+        "events_url": f"/api/scan/{scan_id}/events",
+    }), 202
+
+
+@app.route("/api/scan/<scan_id>/events")
+def scan_events(scan_id: str):
+    """Tarama olaylarını Server-Sent Events olarak akıt"""
+    job = SCAN_JOBS.get(scan_id)
+    if job is None:
+        return jsonify({"error": "Tarama bulunamadı"}), 404
+    
+    # Yeniden bağlanan EventSource kaldığı yerden devam eder.
+    last_event_id = request.headers.get("Last-Event-ID", "0")
+    subscription = job.events.subscribe(after=int(last_event_id) if last_event_id.isdigit() else 0)
+    
+    def stream():
+        try:
+            while True:
+                event = subscription.get(timeout=SSE_KEEPALIVE_SECONDS)
+                if event is None:
+                    if subscription.exhausted:
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+                payload = json.dumps(event.data, ensure_ascii=False)
+                yield f"id: {event.seq}\nevent: {event.kind}\ndata: {payload}\n\n"
+        finally:
+            subscription.close()
+    
+    return Response(
+        stream_with_context(stream()),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 @app.route("/api/reports")
@@ -76,32 +156,52 @@ def list_reports():
     reports = []
     for report_file in sorted(REPORTS_DIR.glob("*.json"), reverse=True):
         try:
-            data = json.loads(report_file.read_text(encoding="utf-8"))
+            summary, findings_count = REPORT_CACHE.summary(report_file)
             reports.append({
                 "id": report_file.stem,
                 "filename": report_file.name,
-                "summary": data.get("summary", {}),
-                "findings_count": len(data.get("findings", [])),
+                "summary": summary,
+                "findings_count": findings_count,
             })
         except Exception:
             continue
     
-    return jsonify({"reports": reports})
+    return json_response({"reports": reports}, request)
 
 
 @app.route("/api/reports/<report_id>")
 def get_report(report_id: str):
-    """Belirli bir raporu getir"""
+    """Belirli bir raporu getir (önbellekli, ETag ve sıkıştırma destekli)"""
     report_path = REPORTS_DIR / f"{report_id}.json"
     
-    if not report_path.exists():
+    if report_path.parent != REPORTS_DIR or not report_path.exists():
         return jsonify({"error": "Rapor bulunamadı"}), 404
     
     try:
-        data = json.loads(report_path.read_text(encoding="utf-8"))
-        return jsonify(data)
+        cached = REPORT_CACHE.get(report_path)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+    return payload_response(cached.payload, request)
+
+
+@app.route("/api/findings/new")
+def new_findings():
+    """Son taramada ilk kez görülen bulguları dizinden getir"""
+    target = request.args.get("target")
+    if not target:
+        return jsonify({"error": "target gerekli"}), 400
+    
+    index = FindingIndex(INDEX_PATH)
+    try:
+        findings = index.new_findings(target, min_severity=request.args.get("severity", "info"))
+        fixed = index.fixed_findings(target)
+    finally:
+        index.close()
+    
+    return jsonify({
+        "new": [asdict(item) for item in findings],
+        "fixed": [asdict(item) for item in fixed],
+    })
 
 
 @app.route("/api/configs")
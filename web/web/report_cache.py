@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from flask import Request, Response
+
+try:  # brotli isteğe bağlıdır; yoksa yalnızca gzip sunulur.
+    import brotli
+except ImportError:  # pragma: no cover - ortama bağlı
+    brotli = None
+
+
+CacheKey = Tuple[str, int, int]
+
+JSON_MIMETYPE = "application/json"
+# Rapor dosyaları yazıldıktan sonra değişmez; tarayıcı her seferinde ETag ile doğrular.
+CACHE_CONTROL = "no-cache"
+MIN_COMPRESS_BYTES = 1024
+
+
+def _offered_encodings(size: int) -> Tuple[str, ...]:
+    if size < MIN_COMPRESS_BYTES:
+        return ()
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=9)
+    return gzip.compress(body, compresslevel=6, mtime=0)
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    """Serileştirilmiş yanıt gövdesi, kodlamaya göre ETag'leri ve ön sıkıştırılmış varyantları.
+
+    `encoded` boşsa varyant yalnızca istemcinin seçtiği kodlama için, yanıt
+    anında üretilir; 304 dönen koşullu isteklerde hiç sıkıştırma yapılmaz.
+    """
+
+    body: bytes
+    digest: str
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+    @property
+    def encodings(self) -> Tuple[str, ...]:
+        return _offered_encodings(len(self.body))
+
+    def encode(self, encoding: str) -> bytes:
+        cached = self.encoded.get(encoding)
+        return cached if cached is not None else _compress(self.body, encoding)
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        # Her temsil için ayrı güçlü ETag (RFC 9110); sıkıştırılmış varyant son ek alır.
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    @classmethod
+    def build(cls, body: bytes, precompress: bool = True) -> "CachedPayload":
+        encoded: Dict[str, bytes] = {}
+        if precompress:
+            encoded = {encoding: _compress(body, encoding) for encoding in _offered_encodings(len(body))}
+        return cls(body=body, digest=hashlib.sha256(body).hexdigest()[:32], encoded=encoded)
+
+
+@dataclass(frozen=True)
+class CachedReport:
+    payload: CachedPayload
+    summary: Dict[str, Any]
+    findings_count: int
+
+
+class ReportCache:
+    """Rapor dosyalarını (yol, mtime, boyut) anahtarıyla tutan iş parçacığı güvenli LRU.
+
+    Dosya yeniden yazılırsa anahtar değişir ve eski girdi doğal olarak
+    LRU'dan düşer; önbellek hiçbir zaman bayat rapor sunmaz.
+    """
+
+    def __init__(self, max_entries: int = 32, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[CacheKey, CachedReport]" = OrderedDict()
+        self._summaries: "OrderedDict[CacheKey, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(path: Path) -> CacheKey:
+        stat = path.stat()
+        return (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+
+    def get(self, path: Path) -> CachedReport:
+        key = self.key_for(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        data = json.loads(path.read_bytes())
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        entry = CachedReport(
+            payload=CachedPayload.build(body),
+            summary=data.get("summary", {}),
+            findings_count=len(data.get("findings", [])),
+        )
+        with self._lock:
+            if key not in self._entries:
+                self._entries[key] = entry
+                self._bytes += entry.payload.size
+                self._evict()
+        return entry
+
+    def summary(self, path: Path) -> Tuple[Dict[str, Any], int]:
+        """Liste görünümü için özet ve bulgu sayısı; tam rapor önbelleğini doldurmaz."""
+        key = self.key_for(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry.summary, entry.findings_count
+            cached = self._summaries.get(key)
+            if cached is not None:
+                self._summaries.move_to_end(key)
+                return cached
+
+        data = json.loads(path.read_bytes())
+        cached = (data.get("summary", {}), len(data.get("findings", [])))
+        with self._lock:
+            self._summaries[key] = cached
+            while len(self._summaries) > self.max_entries * 32:
+                self._summaries.popitem(last=False)
+        return cached
+
+    def _evict(self) -> None:
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.payload.size
+
+
+def _accepted_encodings(header: Optional[str]) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def _choose_encoding(payload: CachedPayload, header: Optional[str]) -> Optional[str]:
+    accepted = _accepted_encodings(header)
+    for encoding in ("br", "gzip"):
+        if encoding in payload.encodings and accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def _matches(payload: CachedPayload, if_none_match: Optional[str]) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    known = {payload.etag(), *(payload.etag(encoding) for encoding in payload.encodings)}
+    return not tags.isdisjoint(known)
+
+
+def payload_response(payload: CachedPayload, request: Request) -> Response:
+    """Koşullu isteğe 304, aksi halde en uygun ön sıkıştırılmış gövdeyle yanıt ver."""
+    encoding = _choose_encoding(payload, request.headers.get("Accept-Encoding"))
+    headers = {
+        "ETag": payload.etag(encoding),
+        "Cache-Control": CACHE_CONTROL,
+        "Vary": "Accept-Encoding",
+    }
+    if _matches(payload, request.headers.get("If-None-Match")):
+        return Response(status=304, headers=headers)
+
+    body = payload.encode(encoding) if encoding else payload.body
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(body, mimetype=JSON_MIMETYPE, headers=headers)
+
+
+def json_response(data: Any, request: Request) -> Response:
+    """Küçük, dinamik JSON yanıtları (ör. rapor listesi) için ETag'li yanıt.
+
+    Her yoklamada yeniden üretildiğinden önceden sıkıştırılmaz: ETag gövde
+    özetinden gelir, gövde yalnızca 200 dönerken ve seçilen kodlamayla sıkıştırılır.
+    """
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return payload_response(CachedPayload.build(body, precompress=False), request)
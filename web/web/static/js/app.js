@@ -45,9 +45,9 @@ async function startScan() {
     
     const btn = document.getElementById('start-scan-btn');
     btn.disabled = true;
-    btn.textContent = '⏳ Tarama başlatılıyor...';
+    btn.textContent = '⏳ Tarama sürüyor...';
     
-    showStatus('info', 'Tarama başlatılıyor, lütfen bekleyin...');
+    showStatus('info', 'Tarama başlatılıyor...');
     
     try {
         const response = await fetch(`${API_BASE}/api/scan`, {
@@ -61,20 +61,83 @@ async function startScan() {
         const data = await response.json();
         
         if (response.ok) {
-            showStatus('success', `Tarama tamamlandı! ${data.findings_count} bulgu bulundu.`);
-            updateStats(data.summary);
-            await loadReport(data.report_id);
+            followScan(data.events_url, btn);
         } else {
             showStatus('error', 'Tarama hatası: ' + (data.error || 'Bilinmeyen hata'));
+            resetScanButton(btn);
         }
     } catch (error) {
         showStatus('error', 'Tarama başlatılırken hata: ' + error.message);
-    } finally {
-        btn.disabled = false;
-        btn.textContent = '🚀 Taramayı Başlat';
+        resetScanButton(btn);
     }
 }
 
+// Tarama olaylarını SSE ile takip et; bulgular geldikçe listeye eklenir
+function followScan(eventsUrl, btn) {
+    const source = new EventSource(`${API_BASE}${eventsUrl}`);
+    const findingsList = document.getElementById('findings-list');
+    
+    const finish = () => {
+        source.close();
+        resetScanButton(btn);
+    };
+    
+    source.addEventListener('started', () => {
+        findingsList.innerHTML = '<p class="empty-message">Tarama sürüyor, henüz bulgu yok...</p>';
+        updateStats({ stats: {} });
+    });
+    
+    source.addEventListener('progress', (event) => {
+        const progress = JSON.parse(event.data);
+        showStatus('progress',
+            `İlerleme: ${progress.done}/${progress.total} birim · ${progress.requests} istek ` +
+            `(${progress.requests_per_second}/sn) · ${progress.errors} hata`);
+        updateStats({ stats: progress.findings });
+    });
+    
+    source.addEventListener('finding', (event) => {
+        insertFinding(JSON.parse(event.data));
+    });
+    
+    source.addEventListener('finished', (event) => {
+        const data = JSON.parse(event.data);
+        updateStats(data.summary);
+        if (data.findings_count === 0) {
+            displayFindings([]);
+        }
+    });
+    
+    source.addEventListener('saved', async (event) => {
+        const data = JSON.parse(event.data);
+        // Akışta kaçan bulgu varsa (kopan bağlantı, dolan kuyruk) listeyi kayıtlı rapordan kur.
+        const rendered = findingsList.querySelectorAll('.finding-card').length;
+        if (rendered !== data.findings_count) {
+            await loadReport(data.report_id);
+        }
+        showStatus('success', `Tarama tamamlandı! ${data.findings_count} bulgu bulundu.`);
+        finish();
+    });
+    
+    source.addEventListener('failed', (event) => {
+        const data = JSON.parse(event.data);
+        showStatus('error', 'Tarama hatası: ' + (data.error || 'Bilinmeyen hata'));
+        finish();
+    });
+    
+    source.onerror = () => {
+        // Tarayıcı bağlantıyı kendisi yeniden kurar; yalnızca kalıcı kopmada bildir.
+        if (source.readyState === EventSource.CLOSED) {
+            showStatus('error', 'Tarama olay akışı kesildi');
+            finish();
+        }
+    };
+}
+
+function resetScanButton(btn) {
+    btn.disabled = false;
+    btn.textContent = '🚀 Taramayı Başlat';
+}
+
 // Son raporu yükle
 async function loadLatestReport() {
     try {
@@ -124,6 +187,12 @@ function updateStats(summary) {
     document.getElementById('stat-info').textContent = summary.stats.info || 0;
 }
 
+const SEVERITY_ORDER = { critical: 0, high: 1, medium: 2, low: 3, info: 4 };
+
+function severityRank(severity) {
+    return SEVERITY_ORDER[severity] ?? 99;
+}
+
 // Bulguları göster
 function displayFindings(findings) {
     const findingsList = document.getElementById('findings-list');
@@ -134,13 +203,29 @@ function displayFindings(findings) {
     }
     
     // Severity sırasına göre sırala
-    const severityOrder = { critical: 0, high: 1, medium: 2, low: 3, info: 4 };
-    findings.sort((a, b) => {
-        return (severityOrder[a.severity] || 99) - (severityOrder[b.severity] || 99);
-    });
+    findings.sort((a, b) => severityRank(a.severity) - severityRank(b.severity));
     
-    findingsList.innerHTML = findings.map(finding => `
-        <div class="finding-card ${finding.severity}">
+    findingsList.innerHTML = findings.map(renderFinding).join('');
+}
+
+// Canlı taramada tek bir bulguyu severity sırasını koruyarak ekle
+function insertFinding(finding) {
+    const findingsList = document.getElementById('findings-list');
+    findingsList.querySelectorAll('.empty-message').forEach(node => node.remove());
+    
+    const rank = severityRank(finding.severity);
+    const next = Array.from(findingsList.children).find(card => Number(card.dataset.rank) > rank);
+    const html = renderFinding(finding);
+    if (next) {
+        next.insertAdjacentHTML('beforebegin', html);
+    } else {
+        findingsList.insertAdjacentHTML('beforeend', html);
+    }
+}
+
+function renderFinding(finding) {
+    return `
+        <div class="finding-card ${finding.severity}" data-rank="${severityRank(finding.severity)}">
             <div class="finding-header">
                 <span class="finding-severity ${finding.severity}">${finding.severity.toUpperCase()}</span>
                 <span class="finding-check-id">${finding.check_id}</span>
@@ -151,7 +236,7 @@ function displayFindings(findings) {
             ${finding.evidence ? `
                 <div class="finding-evidence">
                     <strong>Delil:</strong>
-                    <pre>${JSON.stringify(finding.evidence, null, 2)}</pre>
+                    <pre>${escapeHtml(JSON.stringify(finding.evidence, null, 2))}</pre>
                 </div>
             ` : ''}
             ${finding.remediation ? `
@@ -161,7 +246,7 @@ function displayFindings(findings) {
                 </div>
             ` : ''}
         </div>
-    `).join('');
+    `;
 }
 
 // Raporları yenile